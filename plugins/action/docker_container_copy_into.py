@@ -38,12 +38,14 @@ class ActionModule(ActionBase):
             self._execute_module(task_vars=task_vars, wrap_async=self._task.async_val),
         )
 
-        if "diff" in result and result["diff"].get("scrambled_diff"):
-            # Scrambling is not done for security, but to avoid no_log screwing up the diff
-            diff = result["diff"]
-            key = base64.b64decode(diff.pop("scrambled_diff"))
-            for k in ("before", "after"):
-                if k in diff:
-                    diff[k] = unscramble(diff[k], key)
+        # When copying into several containers, there is one diff per container
+        diffs = result.get("diff") or []
+        for diff in diffs if isinstance(diffs, list) else [diffs]:
+            if diff.get("scrambled_diff"):
+                # Scrambling is not done for security, but to avoid no_log screwing up the diff
+                key = base64.b64decode(diff.pop("scrambled_diff"))
+                for k in ("before", "after"):
+                    if k in diff:
+                        diff[k] = unscramble(diff[k], key)
 
         return result
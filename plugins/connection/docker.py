@@ -109,14 +109,59 @@ options:
     type: boolean
     default: false
     version_added: 3.12.0
+  facts_cache:
+    description:
+      - Whether to remember the version of the Docker daemon in the user's cache directory, so that later connections that
+        use the same C(docker) command and arguments, also from other worker processes, do not need to run C(docker version)
+        again.
+      - The version is needed when O(remote_user) or O(working_dir) are set.
+      - See the notes on E(ANSIBLE_DOCKER_METADATA_CACHE) in the P(community.docker.docker_api#connection) connection plugin
+        for the location of the cache. Entries expire after E(ANSIBLE_DOCKER_METADATA_CACHE_TTL) seconds (default V(600)).
+    env:
+      - name: ANSIBLE_DOCKER_FACTS_CACHE
+    ini:
+      - key: facts_cache
+        section: docker_connection
+    vars:
+      - name: ansible_docker_facts_cache
+    type: boolean
+    default: false
+    version_added: 5.3.0
+  batch_put_file:
+    description:
+      - Whether to collect the files put into the container, like the modules, their arguments and wrappers, and to transfer
+        them together with a single C(tar) process in the container right before the next command is run or file is fetched.
+      - Without batching, a C(docker exec) is run for every file.
+      - Since the transfer is deferred, a file that cannot be written is only reported by the next command, file fetch,
+        or when the connection is closed. The error names the file that could not be written.
+      - As with C(dd), a file whose directory does not exist is not written, and the transfer fails.
+      - Unlike C(dd), which writes into an existing file and so keeps its mode and owner, C(tar) replaces existing files.
+        The files are always created with mode V(0644) (minus the umask in the container), owned by the user the commands
+        run as.
+      - This requires C(tar) in the container. If it is not available, the files are transferred one by one with C(dd).
+      - Files larger than 1 MiB are always transferred directly.
+      - Ignored for Windows containers.
+    env:
+      - name: ANSIBLE_DOCKER_BATCH_PUT_FILE
+    ini:
+      - key: batch_put_file
+        section: docker_connection
+    vars:
+      - name: ansible_docker_batch_put_file
+    type: boolean
+    default: false
+    version_added: 5.3.0
 """
 
 import fcntl
+import io
 import os
 import os.path
 import re
 import selectors
 import subprocess
+import tarfile
+import time
 import typing as t
 from shlex import quote
 
@@ -129,9 +174,16 @@ from ansible.utils.display import Display
 from ansible_collections.community.docker.plugins.module_utils._version import (
     LooseVersion,
 )
+from ansible_collections.community.docker.plugins.plugin_utils._container_cache import (
+    get_cached_docker_version,
+    set_cached_docker_version,
+)
 
 display = Display()
 
+# Larger files are not kept in memory until the next batch is transferred
+_MAX_BATCHED_FILE_SIZE = 1024 * 1024
+
 
 class Connection(ConnectionBase):
     """Local docker based connections"""
@@ -156,6 +208,7 @@ class Connection(ConnectionBase):
         self._version: str | None = None
         self.remote_user: str | None = None
         self.timeout: int | float | None = None
+        self._pending_puts: list[tuple[str, str, bytes]] = []
 
         # Windows uses Powershell modules
         if getattr(self._shell, "_IS_WINDOWS", False):
@@ -216,6 +269,26 @@ class Connection(ConnectionBase):
 
         return self._sanitize_version(to_text(cmd_output, errors="surrogate_or_strict"))
 
+    def _get_cached_docker_version(self) -> str:
+        if not self.get_option("facts_cache"):
+            return self._get_docker_version()
+        # The daemon the docker CLI talks to depends on its arguments and
+        # on these environment variables
+        key = [
+            to_text(self.docker_cmd),
+            [to_text(arg) for arg in self._docker_args],
+            {
+                name: value
+                for name, value in os.environ.items()
+                if name.startswith("DOCKER_")
+            },
+        ]
+        version = get_cached_docker_version(key)
+        if version is None:
+            version = self._get_docker_version()
+            set_cached_docker_version(key, version)
+        return version
+
     def _get_docker_remote_user(self) -> str | None:
         """Get the default user configured in the docker container"""
         container = self.get_option("remote_addr")
@@ -327,7 +400,7 @@ class Connection(ConnectionBase):
         if not self._version:
             self._set_docker_args()
 
-            self._version = self._get_docker_version()
+            self._version = self._get_cached_docker_version()
             if self._version == "dev":
                 display.warning(
                     'Docker version number is "dev". Will assume latest version.'
@@ -381,6 +454,7 @@ class Connection(ConnectionBase):
         """Run a command on the docker host"""
 
         self._set_conn_data()
+        self._flush_put_files()
 
         super().exec_command(cmd, in_data=in_data, sudoable=sudoable)  # type: ignore[safe-super]
 
@@ -494,6 +568,109 @@ class Connection(ConnectionBase):
             remote_path = os.path.join(os.path.sep, remote_path)
         return os.path.normpath(remote_path)
 
+    def _put_file_dd(
+        self, in_path: str, out_path: str, in_data: t.IO[bytes] | bytes
+    ) -> None:
+        """Write in_data, an open file or its content, to out_path with dd"""
+        if isinstance(in_data, bytes):
+            size = len(in_data)
+        else:
+            size = os.fstat(in_data.fileno()).st_size
+        count = "" if size else " count=0"
+        args = self._build_exec_cmd(
+            [
+                self._play_context.executable,
+                "-c",
+                f"dd of={quote(out_path)} bs={BUFSIZE}{count}",
+            ]
+        )
+        args = [to_bytes(i, errors="surrogate_or_strict") for i in args]
+        try:
+            # pylint: disable-next=consider-using-with
+            p = subprocess.Popen(
+                args,
+                stdin=subprocess.PIPE if isinstance(in_data, bytes) else in_data,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+        except OSError as exc:
+            raise AnsibleError(
+                "docker connection requires dd command in the container to put files"
+            ) from exc
+        stdout, stderr = p.communicate(in_data if isinstance(in_data, bytes) else None)
+
+        if p.returncode != 0:
+            raise AnsibleError(
+                f"failed to transfer file {to_text(in_path)} to {to_text(quote(out_path))}:\n{to_text(stdout)}\n{to_text(stderr)}"
+            )
+
+    def _can_batch_put_file(self) -> bool:
+        return bool(self.get_option("batch_put_file")) and not getattr(
+            self._shell, "_IS_WINDOWS", False
+        )
+
+    def _flush_put_files(self) -> None:
+        """Transfer the files collected by put_file with one tar process"""
+        pending, self._pending_puts = self._pending_puts, []
+        if not pending:
+            return
+        display.vvv(
+            f"PUT {len(pending)} FILES WITH TAR", host=self.get_option("remote_addr")
+        )
+
+        archive = io.BytesIO()
+        mtime = int(time.time())
+        with tarfile.open(fileobj=archive, mode="w") as tar:
+            for dummy_in_path, out_path, data in pending:
+                # Only regular files are added, so tar does not touch the
+                # metadata of existing directories. Existing files are
+                # replaced, so they get this mode instead of keeping theirs
+                # like with dd.
+                info = tarfile.TarInfo(out_path.lstrip("/"))
+                info.size = len(data)
+                info.mode = 0o644
+                info.mtime = mtime
+                tar.addfile(info, io.BytesIO(data))
+
+        # tar creates missing parent directories of the members, while dd
+        # fails in that case. So check that they exist before extracting.
+        # -o: do not restore the owner from the archive, but use the user
+        # the command runs as, same as for dd
+        script = (
+            'for p; do d="${p%/*}"; if [ ! -d "${d:-/}" ]; then'
+            ' echo "$p: No such file or directory" >&2; exit 1; fi; done;'
+            " exec tar -x -o -f - -C /"
+        )
+        args = self._build_exec_cmd(
+            [self._play_context.executable, "-c", script, "sh"]
+            + [out_path for dummy_in_path, out_path, dummy_data in pending]
+        )
+        args = [to_bytes(i, errors="surrogate_or_strict") for i in args]
+        with subprocess.Popen(
+            args, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        ) as p:
+            stdout, stderr = p.communicate(archive.getvalue())
+
+        if p.returncode in (126, 127):
+            # tar cannot be run in the container
+            display.vvv(
+                f"tar is not available, falling back to dd: {to_text(stderr)}",
+                host=self.get_option("remote_addr"),
+            )
+            for in_path, out_path, data in pending:
+                self._put_file_dd(in_path, out_path, data)
+        elif p.returncode != 0:
+            # Both tar and the check above name the failing member
+            error = to_text(stderr)
+            failed = [
+                item for item in pending if f"{item[1].lstrip('/')}:" in error
+            ] or pending
+            in_paths = ", ".join(to_text(item[0]) for item in failed)
+            out_paths = ", ".join(to_text(quote(item[1])) for item in failed)
+            raise AnsibleError(
+                f"failed to transfer file {in_paths} to {out_paths}:\n{to_text(stdout)}\n{error}"
+            )
+
     def put_file(self, in_path: str, out_path: str) -> None:
         """Transfer a file from local to docker container"""
         self._set_conn_data()
@@ -501,48 +678,33 @@ class Connection(ConnectionBase):
         display.vvv(f"PUT {in_path} TO {out_path}", host=self.get_option("remote_addr"))
 
         out_path = self._prefix_login_path(out_path)
-        if not os.path.exists(to_bytes(in_path, errors="surrogate_or_strict")):
+        b_in_path = to_bytes(in_path, errors="surrogate_or_strict")
+        if not os.path.exists(b_in_path):
             raise AnsibleFileNotFound(
                 f"file or module does not exist: {to_text(in_path)}"
             )
 
-        out_path = quote(out_path)
+        if self._can_batch_put_file():
+            # The file is read now, since the caller can remove it before
+            # the batch is transferred
+            if os.path.getsize(b_in_path) <= _MAX_BATCHED_FILE_SIZE:
+                with open(b_in_path, "rb") as in_file:
+                    self._pending_puts.append((in_path, out_path, in_file.read()))
+                return
+            # Keep the order of the transfers
+            self._flush_put_files()
+
         # Older docker does not have native support for copying files into
         # running containers, so we use docker exec to implement this
         # Although docker version 1.8 and later provide support, the
         # owner and group of the files are always set to root
-        with open(to_bytes(in_path, errors="surrogate_or_strict"), "rb") as in_file:
-            if not os.fstat(in_file.fileno()).st_size:
-                count = " count=0"
-            else:
-                count = ""
-            args = self._build_exec_cmd(
-                [
-                    self._play_context.executable,
-                    "-c",
-                    f"dd of={out_path} bs={BUFSIZE}{count}",
-                ]
-            )
-            args = [to_bytes(i, errors="surrogate_or_strict") for i in args]
-            try:
-                # pylint: disable-next=consider-using-with
-                p = subprocess.Popen(
-                    args, stdin=in_file, stdout=subprocess.PIPE, stderr=subprocess.PIPE
-                )
-            except OSError as exc:
-                raise AnsibleError(
-                    "docker connection requires dd command in the container to put files"
-                ) from exc
-            stdout, stderr = p.communicate()
-
-            if p.returncode != 0:
-                raise AnsibleError(
-                    f"failed to transfer file {to_text(in_path)} to {to_text(out_path)}:\n{to_text(stdout)}\n{to_text(stderr)}"
-                )
+        with open(b_in_path, "rb") as in_file:
+            self._put_file_dd(in_path, out_path, in_file)
 
     def fetch_file(self, in_path: str, out_path: str) -> None:
         """Fetch a file from container to local."""
         self._set_conn_data()
+        self._flush_put_files()
         super().fetch_file(in_path, out_path)  # type: ignore[safe-super]
         display.vvv(
             f"FETCH {in_path} TO {out_path}", host=self.get_option("remote_addr")
@@ -614,10 +776,12 @@ class Connection(ConnectionBase):
             )
 
     def close(self) -> None:
-        """Terminate the connection. Nothing to do for Docker"""
+        """Terminate the connection, after transferring pending files"""
+        self._flush_put_files()
         super().close()  # type: ignore[safe-super]
         self._connected = False
 
     def reset(self) -> None:
+        self._flush_put_files()
         # Clear container user cache
         self._container_user_cache = {}
@@ -103,8 +103,81 @@ options:
     type: boolean
     default: false
     version_added: 3.12.0
+  persistent_shell:
+    description:
+      - Whether to run commands through a shell that keeps running in the container, instead of creating a new exec instance
+        for every command.
+      - This saves three Docker API requests per command. The shell is started with the first command and ends when the
+        connection is closed.
+      - Commands that need to answer a privilege escalation prompt, and commands whose input does not end with a newline or contains
+        NUL bytes, still get their own exec instance.
+      - Does not work with Windows containers.
+    env:
+      - name: ANSIBLE_DOCKER_PERSISTENT_SHELL
+    ini:
+      - key: persistent_shell
+        section: docker_connection
+    vars:
+      - name: ansible_docker_persistent_shell
+    type: boolean
+    default: false
+    version_added: 5.3.0
+  share_client:
+    description:
+      - Whether all connections to the same Docker daemon with the same connection options share one client within an Ansible
+        worker process.
+      - The API version is then negotiated, and connections to the daemon are opened, only once for example for all items of
+        a loop with C(delegate_to).
+    env:
+      - name: ANSIBLE_DOCKER_SHARE_CLIENT
+    ini:
+      - key: share_client
+        section: docker_connection
+    vars:
+      - name: ansible_docker_share_client
+    type: boolean
+    default: false
+    version_added: 5.3.0
+  warm_up_client:
+    description:
+      - Whether to remember the API version and version information of the Docker daemon in the daemon metadata cache, also
+        if E(ANSIBLE_DOCKER_METADATA_CACHE) is not set.
+      - Ansible runs every task for every host in a new worker process. With this option, only the first connection to a daemon
+        in a play negotiates the API version, and all later connections to the same daemon, also from other worker processes,
+        reuse the result until it expires.
+      - See the notes on E(ANSIBLE_DOCKER_METADATA_CACHE) for the location of the cache and when entries expire.
+    env:
+      - name: ANSIBLE_DOCKER_WARM_UP_CLIENT
+    ini:
+      - key: warm_up_client
+        section: docker_connection
+    vars:
+      - name: ansible_docker_warm_up_client
+    type: boolean
+    default: false
+    version_added: 5.3.0
+  facts_cache:
+    description:
+      - Whether to remember the user and group IDs of the remote user of a container in the user's cache directory, so that
+        later connections to the same container, also from other worker processes, do not need to look them up again.
+      - Looking up the IDs needs an exec instance in the container, that is three Docker API requests, every time a file is
+        transferred in a new connection. With this option, only an inspection of the container is needed.
+      - The IDs are remembered per container ID and start time, and are discarded when the container is restarted. If the
+        IDs of a user are changed while the container is running, the cache directory has to be cleared.
+      - See the notes on E(ANSIBLE_DOCKER_METADATA_CACHE) for the location of the cache.
+    env:
+      - name: ANSIBLE_DOCKER_FACTS_CACHE
+    ini:
+      - key: facts_cache
+        section: docker_connection
+    vars:
+      - name: ansible_docker_facts_cache
+    type: boolean
+    default: false
+    version_added: 5.3.0
 """
 
+import json
 import os
 import os.path
 import typing as t
@@ -133,6 +206,13 @@ from ansible_collections.community.docker.plugins.module_utils._version import (
 )
 from ansible_collections.community.docker.plugins.plugin_utils._common_api import (
     AnsibleDockerClient,
+    get_shared_client,
+)
+from ansible_collections.community.docker.plugins.plugin_utils._container_cache import (
+    ContainerFacts,
+)
+from ansible_collections.community.docker.plugins.plugin_utils._shell_session import (
+    PersistentShell,
 )
 from ansible_collections.community.docker.plugins.plugin_utils._socket_handler import (
     DockerSocketHandler,
@@ -196,6 +276,8 @@ class Connection(ConnectionBase):
 
         self.client: AnsibleDockerClient | None = None
         self.ids: dict[str | None, tuple[int, int]] = {}
+        self._persistent_shell: PersistentShell | None = None
+        self._container_facts: ContainerFacts | None = None
 
         # Windows uses Powershell modules
         if getattr(self._shell, "_IS_WINDOWS", False):
@@ -213,9 +295,18 @@ class Connection(ConnectionBase):
                 host=self.get_option("remote_addr"),
             )
             if self.client is None:
-                self.client = AnsibleDockerClient(
-                    self, min_docker_api_version=MIN_DOCKER_API
-                )
+                if self.get_option("share_client"):
+                    self.client = get_shared_client(
+                        self,
+                        min_docker_api_version=MIN_DOCKER_API,
+                        metadata_cache=self.get_option("warm_up_client"),
+                    )
+                else:
+                    self.client = AnsibleDockerClient(
+                        self,
+                        min_docker_api_version=MIN_DOCKER_API,
+                        metadata_cache=self.get_option("warm_up_client"),
+                    )
             self._connected = True
 
             if self.actual_user is None and display.verbosity > 2:
@@ -235,11 +326,29 @@ class Connection(ConnectionBase):
 
         return self
 
+    def _log_api_stats(self, action: str) -> None:
+        """Log the Docker API requests made since the last call with -vvvv."""
+        if self.client is None or self.client.api_stats is None:
+            return
+        if display.verbosity > 3:
+            display.vvvv(
+                f"{action}: Docker API requests: {json.dumps(self.client.api_stats.summarize())}",
+                host=self.get_option("remote_addr"),
+            )
+        self.client.api_stats.clear()
+
     def exec_command(
         self, cmd: str, in_data: bytes | None = None, sudoable: bool = False
     ) -> tuple[int, bytes, bytes]:
         """Run a command on the docker host"""
+        try:
+            return self._exec_command(cmd, in_data=in_data, sudoable=sudoable)
+        finally:
+            self._log_api_stats("EXEC")
 
+    def _exec_command(
+        self, cmd: str, in_data: bytes | None = None, sudoable: bool = False
+    ) -> tuple[int, bytes, bytes]:
         super().exec_command(cmd, in_data=in_data, sudoable=sudoable)  # type: ignore[safe-super]
 
         if self.client is None:
@@ -258,42 +367,18 @@ class Connection(ConnectionBase):
             host=self.get_option("remote_addr"),
         )
 
-        need_stdin = bool((in_data is not None) or do_become)
-
-        data = {
-            "Container": self.get_option("remote_addr"),
-            "User": self.get_option("remote_user") or "",
-            "Privileged": self.get_option("privileged"),
-            "Tty": False,
-            "AttachStdin": need_stdin,
-            "AttachStdout": True,
-            "AttachStderr": True,
-            "Cmd": command,
-        }
-
-        if "detachKeys" in self.client._general_configs:
-            data["detachKeys"] = self.client._general_configs["detachKeys"]
-
-        if self.get_option("extra_env"):
-            data["Env"] = []
-            for k, v in self.get_option("extra_env").items():
-                for val, what in ((k, "Key"), (v, "Value")):
-                    if not isinstance(val, str):
-                        raise AnsibleConnectionFailure(
-                            f"Non-string {what.lower()} found for extra_env option. Ambiguous env options must be "
-                            "wrapped in quotes to avoid them being interpreted when directly specified "
-                            "in YAML, or explicitly converted to strings when the option is templated. "
-                            f"{what}: {val!r}"
-                        )
-                data["Env"].append(f"{k}={v}")
+        if (
+            self.get_option("persistent_shell")
+            and not do_become
+            and not getattr(self._shell, "_IS_WINDOWS", False)
+            and PersistentShell.can_send(in_data)
+        ):
+            return self._call_client(
+                lambda client: self._get_persistent_shell(client).run(command, in_data)
+            )
 
-        if self.get_option("working_dir") is not None:
-            data["WorkingDir"] = self.get_option("working_dir")
-            if self.client.docker_api_version < LooseVersion("1.35"):
-                raise AnsibleConnectionFailure(
-                    "Providing the working directory requires Docker API version 1.35 or newer."
-                    f" The Docker daemon the connection is using has API version {self.client.docker_api_version_str}."
-                )
+        need_stdin = bool((in_data is not None) or do_become)
+        data = self._get_exec_data(command, need_stdin)
 
         exec_data = self._call_client(
             lambda client: client.post_json_to_json(
@@ -376,6 +461,56 @@ class Connection(ConnectionBase):
 
         return result.get("ExitCode") or 0, stdout or b"", stderr or b""
 
+    def _get_exec_data(self, command: list[str], need_stdin: bool) -> dict[str, t.Any]:
+        if self.client is None:
+            raise AssertionError("Client must be present")
+
+        data = {
+            "Container": self.get_option("remote_addr"),
+            "User": self.get_option("remote_user") or "",
+            "Privileged": self.get_option("privileged"),
+            "Tty": False,
+            "AttachStdin": need_stdin,
+            "AttachStdout": True,
+            "AttachStderr": True,
+            "Cmd": command,
+        }
+
+        if "detachKeys" in self.client._general_configs:
+            data["detachKeys"] = self.client._general_configs["detachKeys"]
+
+        if self.get_option("extra_env"):
+            data["Env"] = []
+            for k, v in self.get_option("extra_env").items():
+                for val, what in ((k, "Key"), (v, "Value")):
+                    if not isinstance(val, str):
+                        raise AnsibleConnectionFailure(
+                            f"Non-string {what.lower()} found for extra_env option. Ambiguous env options must be "
+                            "wrapped in quotes to avoid them being interpreted when directly specified "
+                            "in YAML, or explicitly converted to strings when the option is templated. "
+                            f"{what}: {val!r}"
+                        )
+                data["Env"].append(f"{k}={v}")
+
+        if self.get_option("working_dir") is not None:
+            data["WorkingDir"] = self.get_option("working_dir")
+            if self.client.docker_api_version < LooseVersion("1.35"):
+                raise AnsibleConnectionFailure(
+                    "Providing the working directory requires Docker API version 1.35 or newer."
+                    f" The Docker daemon the connection is using has API version {self.client.docker_api_version_str}."
+                )
+        return data
+
+    def _get_persistent_shell(self, client: AnsibleDockerClient) -> PersistentShell:
+        if self._persistent_shell is None:
+            self._persistent_shell = PersistentShell(
+                client,
+                self.get_option("remote_addr"),
+                self._get_exec_data([self._play_context.executable], True),
+                display,
+            )
+        return self._persistent_shell
+
     def _prefix_login_path(self, remote_path: str) -> str:
         """Make sure that we put files into a standard path
 
@@ -396,6 +531,12 @@ class Connection(ConnectionBase):
 
     def put_file(self, in_path: str, out_path: str) -> None:
         """Transfer a file from local to docker container"""
+        try:
+            self._put_file(in_path, out_path)
+        finally:
+            self._log_api_stats("PUT")
+
+    def _put_file(self, in_path: str, out_path: str) -> None:
         super().put_file(in_path, out_path)  # type: ignore[safe-super]
         display.vvv(f"PUT {in_path} TO {out_path}", host=self.get_option("remote_addr"))
 
@@ -405,20 +546,15 @@ class Connection(ConnectionBase):
         out_path = self._prefix_login_path(out_path)
 
         if self.actual_user not in self.ids:
-            dummy, ids, dummy2 = self.exec_command("id -u && id -g")
-            remote_addr = self.get_option("remote_addr")
-            try:
-                b_user_id, b_group_id = ids.splitlines()
-                user_id, group_id = int(b_user_id), int(b_group_id)
-                self.ids[self.actual_user] = user_id, group_id
-                display.vvvv(
-                    f'PUT: Determined uid={user_id} and gid={group_id} for user "{self.actual_user}"',
-                    host=remote_addr,
-                )
-            except Exception as e:
-                raise AnsibleConnectionFailure(
-                    f'Error while determining user and group ID of current user in container "{remote_addr}": {e}\nGot value: {ids!r}'
-                ) from e
+            facts = (
+                self._get_container_facts() if self.get_option("facts_cache") else None
+            )
+            ids = facts.get_ids(self.actual_user) if facts is not None else None
+            if ids is None:
+                ids = self._get_ids()
+                if facts is not None:
+                    facts.set_ids(self.actual_user, ids)
+            self.ids[self.actual_user] = ids
 
         user_id, group_id = self.ids[self.actual_user]
         try:
@@ -440,8 +576,42 @@ class Connection(ConnectionBase):
         except DockerFileCopyError as exc:
             raise AnsibleConnectionFailure(to_text(exc)) from exc
 
+    def _get_ids(self) -> tuple[int, int]:
+        dummy, ids, dummy2 = self.exec_command("id -u && id -g")
+        remote_addr = self.get_option("remote_addr")
+        try:
+            b_user_id, b_group_id = ids.splitlines()
+            user_id, group_id = int(b_user_id), int(b_group_id)
+        except Exception as e:
+            raise AnsibleConnectionFailure(
+                f'Error while determining user and group ID of current user in container "{remote_addr}": {e}\nGot value: {ids!r}'
+            ) from e
+        display.vvvv(
+            f'PUT: Determined uid={user_id} and gid={group_id} for user "{self.actual_user}"',
+            host=remote_addr,
+        )
+        return user_id, group_id
+
+    def _get_container_facts(self) -> ContainerFacts:
+        if self._container_facts is None:
+            result = self._call_client(
+                lambda client: client.get_json(
+                    "/containers/{0}/json", self.get_option("remote_addr")
+                )
+            )
+            self._container_facts = ContainerFacts(
+                result["Id"], (result.get("State") or {}).get("StartedAt") or ""
+            )
+        return self._container_facts
+
     def fetch_file(self, in_path: str, out_path: str) -> None:
         """Fetch a file from container to local."""
+        try:
+            self._fetch_file(in_path, out_path)
+        finally:
+            self._log_api_stats("FETCH")
+
+    def _fetch_file(self, in_path: str, out_path: str) -> None:
         super().fetch_file(in_path, out_path)  # type: ignore[safe-super]
         display.vvv(
             f"FETCH {in_path} TO {out_path}", host=self.get_option("remote_addr")
@@ -471,10 +641,18 @@ class Connection(ConnectionBase):
         except DockerFileCopyError as exc:
             raise AnsibleConnectionFailure(to_text(exc)) from exc
 
+    def _close_persistent_shell(self) -> None:
+        if self._persistent_shell is not None:
+            self._persistent_shell.close()
+            self._persistent_shell = None
+
     def close(self) -> None:
-        """Terminate the connection. Nothing to do for Docker"""
+        """Terminate the connection. Ends the persistent shell, if there is one"""
         super().close()  # type: ignore[safe-super]
+        self._close_persistent_shell()
         self._connected = False
 
     def reset(self) -> None:
+        self._close_persistent_shell()
         self.ids.clear()
+        self._container_facts = None
@@ -32,6 +32,25 @@ options:
     ini:
       - section: nsenter_connection
         key: nsenter_pid
+  persistent_shell:
+    description:
+      - Whether to run commands through a shell that keeps running in the namespaces of O(nsenter_pid), instead of running
+        C(nsenter) and a shell for every command and file transfer.
+      - The shell is started with the first command and ends when the connection is closed.
+      - Files are transferred through the shell as well. Files that do not end with a newline or contain NUL bytes are
+        transferred Base64 encoded, which needs the C(base64) program on the host.
+      - Commands that need to answer a privilege escalation prompt, and commands whose input does not end with a newline or contains
+        NUL bytes, still run with their own C(nsenter).
+    type: bool
+    default: false
+    vars:
+      - name: ansible_nsenter_persistent_shell
+    env:
+      - name: ANSIBLE_NSENTER_PERSISTENT_SHELL
+    ini:
+      - section: nsenter_connection
+        key: persistent_shell
+    version_added: 5.3.0
 notes:
   - The remote user is ignored; this plugin always runs as root.
   - "This plugin requires the Ansible controller container to be launched in the following way: (1) The container image contains
@@ -39,6 +58,7 @@ notes:
     PID namespace (C(--pid host))."
 """
 
+import base64
 import fcntl
 import os
 import pty
@@ -54,6 +74,10 @@ from ansible.plugins.connection import ConnectionBase
 from ansible.utils.display import Display
 from ansible.utils.path import unfrackpath
 
+from ansible_collections.community.docker.plugins.plugin_utils._shell_session import (
+    ProcessShell,
+)
+
 display = Display()
 
 
@@ -67,6 +91,7 @@ class Connection(ConnectionBase):
         super().__init__(*args, **kwargs)
         self.cwd = None
         self._nsenter_pid = None
+        self._persistent_shell: ProcessShell | None = None
 
     def _connect(self) -> t.Self:
         self._nsenter_pid = self.get_option("nsenter_pid")
@@ -83,13 +108,21 @@ class Connection(ConnectionBase):
             self._connected = True
         return self
 
-    def exec_command(
-        self, cmd: str, in_data: bytes | None = None, sudoable: bool = True
-    ) -> tuple[int, bytes, bytes]:
-        super().exec_command(cmd, in_data=in_data, sudoable=sudoable)  # type: ignore[safe-super]
-
-        display.debug("in nsenter.exec_command()")
+    def _get_nsenter_command(self) -> list[str]:
+        return [
+            "nsenter",
+            "--ipc",
+            "--mount",
+            "--net",
+            "--pid",
+            "--uts",
+            "--preserve-credentials",
+            f"--target={self._nsenter_pid}",
+            "--",
+        ]
 
+    @staticmethod
+    def _get_executable() -> str | None:
         # pylint: disable-next=no-member
         def_executable: str | None = C.DEFAULT_EXECUTABLE  # type: ignore[attr-defined]
         executable = def_executable.split()[0] if def_executable else None
@@ -99,19 +132,44 @@ class Connection(ConnectionBase):
                 f"failed to find the executable specified {executable}."
                 " Please verify if the executable exists and re-try."
             )
+        return executable
+
+    def _use_persistent_shell(self, in_data: bytes | None, sudoable: bool) -> bool:
+        return bool(
+            self.get_option("persistent_shell")
+            and not (sudoable and self.become and self.become.expect_prompt())
+            and ProcessShell.can_send(in_data)
+        )
+
+    def _get_persistent_shell(self) -> ProcessShell:
+        if self._persistent_shell is None:
+            executable = self._get_executable()
+            assert executable is not None
+            self._persistent_shell = ProcessShell(
+                self._get_nsenter_command() + [executable],
+                f"for PID {self._nsenter_pid}",
+            )
+        return self._persistent_shell
+
+    def exec_command(
+        self, cmd: str, in_data: bytes | None = None, sudoable: bool = True
+    ) -> tuple[int, bytes, bytes]:
+        super().exec_command(cmd, in_data=in_data, sudoable=sudoable)  # type: ignore[safe-super]
+
+        display.debug("in nsenter.exec_command()")
+
+        executable = self._get_executable()
+
+        if self._use_persistent_shell(in_data, sudoable):
+            assert executable is not None
+            display.vvv(
+                f"EXEC {to_text(cmd)} (persistent shell)",
+                host=self._play_context.remote_addr,
+            )
+            return self._get_persistent_shell().run([executable, "-c", cmd], in_data)
 
         # Rewrite the provided command to prefix it with nsenter
-        nsenter_cmd_parts = [
-            "nsenter",
-            "--ipc",
-            "--mount",
-            "--net",
-            "--pid",
-            "--uts",
-            "--preserve-credentials",
-            f"--target={self._nsenter_pid}",
-            "--",
-        ]
+        nsenter_cmd_parts = self._get_nsenter_command()
 
         cmd_parts = nsenter_cmd_parts + [cmd]
         cmd_b = to_bytes(" ".join(cmd_parts))
@@ -246,10 +304,19 @@ class Connection(ConnectionBase):
         display.vvv(f"PUT {in_path} to {out_path}", host=self._play_context.remote_addr)
         try:
             with open(to_bytes(in_path, errors="surrogate_or_strict"), "rb") as in_file:
-                in_data = in_file.read()
-            rc, dummy_out, err = self.exec_command(
-                cmd=f"tee {shlex.quote(out_path)}", in_data=in_data
-            )
+                in_data: bytes | None = in_file.read()
+            cmd = f"tee {shlex.quote(out_path)}"
+            if self.get_option("persistent_shell"):
+                # Send the file through the persistent shell's here document
+                if not in_data:
+                    cmd = f": > {shlex.quote(out_path)}"
+                    in_data = None
+                elif ProcessShell.can_send(in_data):
+                    cmd = f"cat > {shlex.quote(out_path)}"
+                else:
+                    cmd = f"base64 -d > {shlex.quote(out_path)}"
+                    in_data = base64.encodebytes(in_data)
+            rc, dummy_out, err = self.exec_command(cmd=cmd, in_data=in_data)
             if rc != 0:
                 raise AnsibleError(
                     f"failed to transfer file to {out_path}: {to_text(err)}"
@@ -281,6 +348,15 @@ class Connection(ConnectionBase):
                 f"failed to transfer file to {to_text(out_path)}: {e}"
             ) from e
 
+    def _close_persistent_shell(self) -> None:
+        if self._persistent_shell is not None:
+            self._persistent_shell.close()
+            self._persistent_shell = None
+
     def close(self) -> None:
-        """terminate the connection; nothing to do here"""
+        """terminate the connection; ends the persistent shell, if there is one"""
+        self._close_persistent_shell()
         self._connected = False
+
+    def reset(self) -> None:
+        self._close_persistent_shell()
@@ -274,6 +274,25 @@ notes:
     E(DOCKER_TLS), E(DOCKER_TLS_VERIFY) and E(DOCKER_TIMEOUT). If you are using docker machine, run the script shipped
     with the product that sets up the environment. It will set these variables for you. See
     U(https://docs.docker.com/machine/reference/env/) for more details.
+  - If the environment variable E(ANSIBLE_DOCKER_METADATA_CACHE) is set to V(true), the result of C(GET /version) used to
+    negotiate the API version, and daemon information that does not change while the daemon is running, are cached in
+    the user's cache directory (E(XDG_CACHE_HOME) or C(~/.cache)). The location can be changed with
+    E(ANSIBLE_DOCKER_METADATA_CACHE_DIR). Entries expire after E(ANSIBLE_DOCKER_METADATA_CACHE_TTL) seconds (default
+    V(600)), and are discarded earlier if the daemon's Unix socket is re-created or the daemon reports a different ID or version.
+  - If the environment variable E(ANSIBLE_DOCKER_MINIMAL_HTTP) is set to V(true) and O(docker_host) is a Unix socket, a
+    minimal HTTP client built into this collection is used to talk to the daemon instead of C(requests). This is also
+    done when C(requests) or C(urllib3) are not installed. The variable can be set per task with the C(environment) keyword.
+  - If the environment variable E(ANSIBLE_DOCKER_API_STATS) is set to V(true), modules record method, endpoint, status,
+    latency, and request and response body sizes of every request sent to the Docker daemon, and return a summary as
+    RV(ignore:debug_api_stats). Connection plugins log the summary with verbosity 4 (C(-vvvv)).
+  - If the environment variable E(ANSIBLE_DOCKER_SSH_CONTROL_PERSIST) is set to V(true) or to a number of seconds and
+    O(use_ssh_client=true), all C(ssh) processes for the same host share one connection through a control socket in
+    C(~/.ansible/cp). The connection stays open for that many seconds (V(60) for V(true)) after its last use, so that
+    later tasks do not need a new SSH handshake.
+  - If the environment variable E(ANSIBLE_DOCKER_TLS_SESSION_CACHE) is set to V(true) and TLS is used, new connections
+    to the daemon resume the TLS session of a previous connection made by the same process with the same TLS options,
+    instead of doing a full handshake. Sessions are not offered after they expire. With E(ANSIBLE_DOCKER_API_STATS), the
+    number of full and resumed handshakes is part of the summary.
 #  - Note that the Docker SDK for Python only allows to specify the path to the Docker configuration for very few functions.
 #    In general, it will use C($HOME/.docker/config.json) if the E(DOCKER_CONFIG) environment variable is not specified,
 #    and use C($DOCKER_CONFIG/config.json) otherwise.
@@ -281,7 +300,7 @@ notes:
     communicate with the Docker daemon. It uses code derived from the Docker SDK or Python that is included in this
     collection.
 requirements:
-  - requests
+  - requests (not needed when O(docker_host) is a Unix socket)
   - pywin32 (when using named pipes on Windows 32)
   - paramiko (when using SSH with O(use_ssh_client=false))
   - pyOpenSSL (when using TLS)
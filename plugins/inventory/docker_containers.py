@@ -182,6 +182,10 @@ from ansible_collections.community.docker.plugins.module_utils._api.errors impor
     APIError,
     DockerException,
 )
+from ansible_collections.community.docker.plugins.module_utils._async_api import (
+    GetJSON,
+    get_json_batch,
+)
 from ansible_collections.community.docker.plugins.module_utils._common_api import (
     RequestException,
 )
@@ -249,8 +253,19 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
                 if value is not None:
                     extra_facts[var_name] = value
 
+        # Inspect all containers up front; the requests are sent concurrently
+        # if the connection to the daemon allows it
+        inspects = get_json_batch(
+            client,
+            [
+                GetJSON("/containers/{0}/json", (container.get("Id"),))
+                for container in containers
+            ],
+            return_exceptions=True,
+        )
+
         filters = parse_filters(self.get_option("filters"))
-        for container in containers:
+        for container, inspect in zip(containers, inspects):
             container_id = container.get("Id")
             short_container_id = container_id[:13]
 
@@ -267,12 +282,12 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
             }
             full_facts = {}
 
-            try:
-                inspect = client.get_json("/containers/{0}/json", container_id)
-            except APIError as exc:
+            if isinstance(inspect, APIError):
                 raise AnsibleError(
-                    f"Error inspecting container {name} - {exc}"
-                ) from exc
+                    f"Error inspecting container {name} - {inspect}"
+                ) from inspect
+            if isinstance(inspect, BaseException):
+                raise inspect
 
             state = inspect.get("State") or {}
             config = inspect.get("Config") or {}
@@ -15,19 +15,28 @@ import json
 import logging
 import os
 import struct
+import threading
 import typing as t
-from urllib.parse import quote
+from urllib.parse import quote, urlsplit
+from urllib.request import getproxies, proxy_bypass
 
+from ..._api_stats import APIStats, count_response_bytes
+from ..._unix_http import TCPHTTPSession, UnixHTTPResponse, UnixHTTPSession
 from .. import auth
+from .._import_helper import (
+    REQUESTS_IMPORT_ERROR,
+    URLLIB3_IMPORT_ERROR,
+    fail_on_missing_imports,
+)
 from .._import_helper import HTTPError as _HTTPError
 from .._import_helper import InvalidSchema as _InvalidSchema
 from .._import_helper import Session as _Session
-from .._import_helper import fail_on_missing_imports
 from ..constants import (
     DEFAULT_DATA_CHUNK_SIZE,
     DEFAULT_MAX_POOL_SIZE,
     DEFAULT_NUM_POOLS,
     DEFAULT_NUM_POOLS_SSH,
+    DEFAULT_STREAM_COALESCE_SIZE,
     DEFAULT_TIMEOUT_SECONDS,
     DEFAULT_USER_AGENT,
     IS_WINDOWS_PLATFORM,
@@ -42,21 +51,24 @@ from ..errors import (
     create_api_error_from_http_exception,
 )
 from ..tls import TLSConfig
-from ..transport.npipeconn import NpipeHTTPAdapter
-from ..transport.npipesocket import PYWIN32_IMPORT_ERROR
-from ..transport.sshconn import PARAMIKO_IMPORT_ERROR, SSHHTTPAdapter
-from ..transport.ssladapter import SSLHTTPAdapter
-from ..transport.unixconn import UnixHTTPAdapter
 from ..utils import config, json_stream, utils
 from ..utils.decorators import minimum_version, update_headers
 from ..utils.proxy import ProxyConfig
-from ..utils.socket import consume_socket_output, demux_adaptor, frames_iter
+from ..utils.socket import (
+    FrameReader,
+    consume_frames,
+    demux_adaptor,
+    frames_iter,
+)
 
 if t.TYPE_CHECKING:
+    from collections.abc import Callable
+
     from requests import Response
     from requests.adapters import BaseAdapter
 
     from ..._socket_helper import SocketLike
+    from ..transport.basehttpadapter import BaseHTTPAdapter
 
 
 log = logging.getLogger(__name__)
@@ -99,6 +111,17 @@ class APIClient(_Session):
             installed and configured on the host.
         max_pool_size (int): The maximum number of connections
             to save in the pool.
+        use_minimal_http (bool): If set to `True` and ``base_url`` is a Unix
+            socket, talk to the daemon with a minimal built-in HTTP client
+            instead of requests. This is also done if requests or urllib3
+            are not installed.
+        collect_stats (bool): If set to `True`, record latency and body sizes
+            of every request in ``api_stats``.
+        ssh_control_persist (int): If set and ``use_ssh_client`` is `True`,
+            share one SSH connection per host between all ssh processes, and
+            keep it open for this many seconds after its last use.
+        tls_session_cache (bool): If set to `True`, resume TLS sessions when
+            new connections are made to the same daemon in this process.
     """
 
     __attrs__ = _Session.__attrs__ + [
@@ -120,10 +143,14 @@ class APIClient(_Session):
         credstore_env: dict[str, str] | None = None,
         use_ssh_client: bool = False,
         max_pool_size: int = DEFAULT_MAX_POOL_SIZE,
+        use_minimal_http: bool = False,
+        collect_stats: bool = False,
+        ssh_control_persist: int | None = None,
+        tls_session_cache: bool = False,
     ) -> None:
         super().__init__()
 
-        fail_on_missing_imports()
+        self.api_stats: APIStats | None = APIStats() if collect_stats else None
 
         if tls and not base_url:
             raise TLSParameterError(
@@ -131,7 +158,6 @@ class APIClient(_Session):
             )
 
         self.timeout = timeout
-        self.headers["User-Agent"] = user_agent
 
         self._general_configs = config.load_general_config()
 
@@ -151,6 +177,31 @@ class APIClient(_Session):
 
         base_url = utils.parse_host(base_url, IS_WINDOWS_PLATFORM, tls=bool(tls))
         self.base_url = base_url
+        # base_url is replaced by a placeholder for some transports below;
+        # keep the actual address and the TLS settings for other clients
+        # that talk to the same daemon (see _async_api)
+        self._connection_url = base_url
+        self._tls = tls
+
+        self._max_pool_size = max_pool_size
+        # Sends bodies that write themselves to the socket, see _http()
+        self._direct_http: UnixHTTPSession | None = None
+        self._direct_http_lock = threading.Lock()
+        self._unix_http: UnixHTTPSession | None = None
+        if base_url.startswith("http+unix://") and (
+            use_minimal_http
+            or REQUESTS_IMPORT_ERROR is not None
+            or URLLIB3_IMPORT_ERROR is not None
+        ):
+            self._unix_http = UnixHTTPSession(
+                base_url[len("http+unix://") :],
+                max_pool_size=max_pool_size,
+            )
+            self._unix_http.headers["User-Agent"] = user_agent
+        else:
+            fail_on_missing_imports()
+            self.headers["User-Agent"] = user_agent
+
         # SSH has a different default for num_pools to all other adapters
         num_pools = (
             num_pools or DEFAULT_NUM_POOLS_SSH
@@ -158,10 +209,15 @@ class APIClient(_Session):
             else DEFAULT_NUM_POOLS
         )
 
-        self._custom_adapter: (
-            UnixHTTPAdapter | NpipeHTTPAdapter | SSHHTTPAdapter | SSLHTTPAdapter | None
-        ) = None
-        if base_url.startswith("http+unix://"):
+        self._custom_adapter: BaseHTTPAdapter | None = None
+        # The transports are only imported once they are needed; some of them
+        # pull in expensive dependencies like paramiko
+        if self._unix_http is not None:
+            # host part of URL is not used
+            self.base_url = "http+docker://localhost"
+        elif base_url.startswith("http+unix://"):
+            from ..transport.unixconn import UnixHTTPAdapter
+
             self._custom_adapter = UnixHTTPAdapter(
                 base_url,
                 timeout,
@@ -178,6 +234,9 @@ class APIClient(_Session):
                 raise DockerException(
                     "The npipe:// protocol is only supported on Windows"
                 )
+            from ..transport.npipeconn import NpipeHTTPAdapter
+            from ..transport.npipesocket import PYWIN32_IMPORT_ERROR
+
             if PYWIN32_IMPORT_ERROR is not None:
                 raise MissingRequirementException(
                     "Install pypiwin32 package to enable npipe:// support",
@@ -193,6 +252,8 @@ class APIClient(_Session):
             self.mount("http+docker://", self._custom_adapter)
             self.base_url = "http+docker://localnpipe"
         elif base_url.startswith("ssh://"):
+            from ..transport.sshconn import PARAMIKO_IMPORT_ERROR, SSHHTTPAdapter
+
             if PARAMIKO_IMPORT_ERROR is not None and not use_ssh_client:
                 raise MissingRequirementException(
                     "Install paramiko package to enable ssh:// support",
@@ -205,6 +266,7 @@ class APIClient(_Session):
                 pool_connections=num_pools,
                 max_pool_size=max_pool_size,
                 shell_out=use_ssh_client,
+                control_persist=ssh_control_persist,
             )
             self.mount("http+docker://ssh", self._custom_adapter)
             self._unmount("http://", "https://")
@@ -212,9 +274,18 @@ class APIClient(_Session):
         else:
             # Use SSLAdapter for the ability to specify SSL version
             if isinstance(tls, TLSConfig):
-                tls.configure_client(self)
+                tls.configure_client(self, session_cache=tls_session_cache)
             elif tls:
-                self._custom_adapter = SSLHTTPAdapter(pool_connections=num_pools)
+                from ..transport.ssladapter import SSLHTTPAdapter
+
+                ssl_context = None
+                if tls_session_cache:
+                    from ..._tls_sessions import get_session_caching_context
+
+                    ssl_context = get_session_caching_context(None)
+                self._custom_adapter = SSLHTTPAdapter(
+                    pool_connections=num_pools, ssl_context=ssl_context
+                )
                 self.mount("https://", self._custom_adapter)
             self.base_url = base_url
 
@@ -259,23 +330,77 @@ class APIClient(_Session):
 
     @update_headers
     def _post(self, url: str, **kwargs: t.Any) -> Response:
-        return self.post(url, **self._set_request_timeout(kwargs))
+        return self._send("POST", self._http().post, url, kwargs)
 
     @update_headers
     def _get(self, url: str, **kwargs: t.Any) -> Response:
-        return self.get(url, **self._set_request_timeout(kwargs))
+        return self._send("GET", self._http().get, url, kwargs)
 
     @update_headers
     def _head(self, url: str, **kwargs: t.Any) -> Response:
-        return self.head(url, **self._set_request_timeout(kwargs))
+        return self._send("HEAD", self._http().head, url, kwargs)
 
     @update_headers
     def _put(self, url: str, **kwargs: t.Any) -> Response:
-        return self.put(url, **self._set_request_timeout(kwargs))
+        return self._send("PUT", self._http(kwargs.get("data")).put, url, kwargs)
 
     @update_headers
     def _delete(self, url: str, **kwargs: t.Any) -> Response:
-        return self.delete(url, **self._set_request_timeout(kwargs))
+        return self._send("DELETE", self._http().delete, url, kwargs)
+
+    def _send(
+        self,
+        method: str,
+        send: Callable[..., Response],
+        url: str,
+        kwargs: dict[str, t.Any],
+    ) -> Response:
+        kwargs = self._set_request_timeout(kwargs)
+        if self.api_stats is None:
+            return send(url, **kwargs)
+        return self.api_stats.track(method, url, send, kwargs)
+
+    def _http(self, data: t.Any = None) -> _Session:
+        if self._unix_http is not None:
+            # UnixHTTPSession offers the parts of requests.Session's interface
+            # that are used here
+            return t.cast("_Session", self._unix_http)
+        if hasattr(data, "send_to"):
+            # Sized bodies can copy files straight into the socket with
+            # sendfile() when the connection is not encrypted; requests
+            # would copy every block of the file through Python
+            direct_http = self._get_direct_http()
+            if direct_http is not None:
+                return t.cast("_Session", direct_http)
+        return self
+
+    def _get_direct_http(self) -> UnixHTTPSession | None:
+        # Uploads can happen from several threads at once
+        with self._direct_http_lock:
+            return self._create_direct_http()
+
+    def _create_direct_http(self) -> UnixHTTPSession | None:
+        if self._direct_http is not None:
+            return self._direct_http
+        url = self._connection_url
+        if url.startswith("http+unix://"):
+            self._direct_http = UnixHTTPSession(
+                url[len("http+unix://") :], max_pool_size=self._max_pool_size
+            )
+        elif url.startswith("http://"):
+            parts = urlsplit(url)
+            if parts.hostname is None or parts.port is None:
+                return None
+            if getproxies().get("http") and not proxy_bypass(parts.hostname):
+                # requests would send the request through the proxy
+                return None
+            self._direct_http = TCPHTTPSession(
+                parts.hostname, parts.port, max_pool_size=self._max_pool_size
+            )
+        else:
+            return None
+        self._direct_http.headers["User-Agent"] = self.headers["User-Agent"]
+        return self._direct_http
 
     def _url(self, pathfmt: str, *args: str, versioned_api: bool = True) -> str:
         for arg in args:
@@ -287,8 +412,12 @@ class APIClient(_Session):
         q_args = [quote(arg, safe="/:") for arg in args]
 
         if versioned_api:
-            return f"{self.base_url}/v{self._version}{pathfmt.format(*q_args)}"
-        return f"{self.base_url}{pathfmt.format(*q_args)}"
+            url = f"{self.base_url}/v{self._version}{pathfmt.format(*q_args)}"
+        else:
+            url = f"{self.base_url}{pathfmt.format(*q_args)}"
+        if self.api_stats is not None:
+            self.api_stats.remember_template(url, pathfmt)
+        return url
 
     def _raise_for_status(self, response: Response) -> None:
         """Raises stored :class:`APIError`, if one occurred."""
@@ -365,6 +494,8 @@ class APIClient(_Session):
 
     def _get_raw_response_socket(self, response: Response) -> SocketLike:
         self._raise_for_status(response)
+        if isinstance(response, UnixHTTPResponse):  # type: ignore[unreachable]
+            return response.socket  # type: ignore[unreachable]
         if self.base_url == "http+docker://localnpipe":
             sock = response.raw._fp.fp.raw.sock  # type: ignore[union-attr]
         elif self.base_url.startswith("http+docker://ssh"):
@@ -385,36 +516,72 @@ class APIClient(_Session):
 
         return sock
 
+    def _read_chunks(self, response: Response) -> t.Generator[bytes]:
+        """Generator for the chunks of a chunked-encoded HTTP response."""
+        reader = response.raw
+        if reader.chunked and reader.supports_chunked_reads():  # type: ignore[union-attr]
+            # urllib3 reads every chunk with a single read call
+            for data in reader.read_chunked():  # type: ignore[union-attr]
+                if data:
+                    yield data
+            return
+
+        while not reader.closed:
+            # this read call will block until we get a chunk
+            data = reader.read(1)
+            if not data:
+                break
+            if reader._fp.chunk_left:  # type: ignore[union-attr]
+                data += reader.read(reader._fp.chunk_left)  # type: ignore[union-attr]
+            yield data
+
     @t.overload
     def _stream_helper(
-        self, response: Response, *, decode: t.Literal[False] = False
+        self,
+        response: Response,
+        *,
+        decode: t.Literal[False] = False,
+        coalesce: bool = False,
     ) -> t.Generator[bytes | str]: ...
 
     @t.overload
     def _stream_helper(
-        self, response: Response, *, decode: t.Literal[True]
+        self, response: Response, *, decode: t.Literal[True], coalesce: bool = False
     ) -> t.Generator[t.Any]: ...
 
     def _stream_helper(
-        self, response: Response, *, decode: bool = False
+        self, response: Response, *, decode: bool = False, coalesce: bool = False
     ) -> t.Generator[t.Any]:
-        """Generator for data coming from a chunked-encoded HTTP response."""
+        """Generator for data coming from a chunked-encoded HTTP response.
+
+        If ``coalesce`` is ``True``, consecutive small chunks are combined
+        into blocks of up to ``DEFAULT_STREAM_COALESCE_SIZE`` bytes before
+        they are yielded. This is useful for the many small progress messages
+        emitted by pulls, pushes and builds when the caller reads the whole
+        stream anyway.
+        """
 
-        if response.raw._fp.chunked:  # type: ignore[union-attr]
+        if isinstance(response, UnixHTTPResponse):  # type: ignore[unreachable]
+            chunked = response.raw.chunked  # type: ignore[unreachable]
+        else:
+            chunked = response.raw._fp.chunked  # type: ignore[union-attr]
+        if chunked:
             if decode:
                 yield from json_stream.json_stream(
-                    self._stream_helper(response, decode=False)
+                    self._stream_helper(response, decode=False, coalesce=coalesce)
+                )
+            elif coalesce:
+                yield from utils.coalesce_chunks(
+                    count_response_bytes(
+                        getattr(response, "_api_call", None),
+                        self._read_chunks(response),
+                    ),
+                    DEFAULT_STREAM_COALESCE_SIZE,
                 )
             else:
-                reader = response.raw
-                while not reader.closed:
-                    # this read call will block until we get a chunk
-                    data = reader.read(1)
-                    if not data:
-                        break
-                    if reader._fp.chunk_left:  # type: ignore[union-attr]
-                        data += reader.read(reader._fp.chunk_left)  # type: ignore[union-attr]
-                    yield data
+                yield from count_response_bytes(
+                    getattr(response, "_api_call", None), self._read_chunks(response)
+                )
         else:
             # Response is not chunked, meaning we probably
             # encountered an error immediately
@@ -446,6 +613,7 @@ class APIClient(_Session):
         # Read timed out(s) for long running processes
         socket = self._get_raw_response_socket(response)
         self._disable_socket_timeout(socket)
+        call = getattr(response, "_api_call", None)
 
         while True:
             header = response.raw.read(STREAM_HEADER_SIZE_BYTES)
@@ -457,6 +625,8 @@ class APIClient(_Session):
             data = response.raw.read(length)
             if not data:
                 break
+            if call is not None:
+                call.add_response_bytes(len(header) + len(data))
             yield data
 
     @t.overload
@@ -480,7 +650,10 @@ class APIClient(_Session):
         socket = self._get_raw_response_socket(response)
         self._disable_socket_timeout(socket)
 
-        yield from response.iter_content(chunk_size, decode)
+        yield from count_response_bytes(
+            getattr(response, "_api_call", None),
+            response.iter_content(chunk_size, decode),
+        )
 
     @t.overload
     def _read_from_socket(
@@ -555,31 +728,29 @@ class APIClient(_Session):
         caller is responsible for closing the response.
         """
         socket = self._get_raw_response_socket(response)
+        call = getattr(response, "_api_call", None)
 
-        gen = frames_iter(socket, tty)
-
-        if demux:
-            # The generator will output tuples (stdout, stderr)
-            demux_gen: t.Generator[tuple[bytes | None, bytes | None]] = (
-                demux_adaptor(*frame) for frame in gen
-            )
-            if stream:
-                return demux_gen
-            try:
-                # Wait for all the frames, concatenate them, and return the result
-                return consume_socket_output(demux_gen, demux=True)
-            finally:
-                response.close()
-        else:
-            # The generator will output strings
-            mux_gen: t.Generator[bytes] = (data for (dummy, data) in gen)
-            if stream:
-                return mux_gen
+        if not stream:
             try:
                 # Wait for all the frames, concatenate them, and return the result
-                return consume_socket_output(mux_gen, demux=False)
+                result = consume_frames(FrameReader(socket, tty=tty), demux=demux)
             finally:
                 response.close()
+            if call is not None:
+                call.add_response_bytes(
+                    sum(len(part or b"") for part in result)
+                    if isinstance(result, tuple)
+                    else len(result)
+                )
+            return result
+
+        gen = frames_iter(socket, tty)
+
+        if demux:
+            # The generator will output tuples (stdout, stderr)
+            return count_response_bytes(call, (demux_adaptor(*frame) for frame in gen))
+        # The generator will output strings
+        return count_response_bytes(call, (data for (dummy, data) in gen))
 
     def _disable_socket_timeout(self, socket: SocketLike) -> None:
         """Depending on the combination of python version and whether we are
@@ -645,6 +816,16 @@ class APIClient(_Session):
             return self._multiplexed_response_stream_helper(res)
         return sep.join(list(self._multiplexed_buffer_helper(res)))
 
+    def close(self) -> None:
+        if self._unix_http is not None:
+            self._unix_http.close()
+        if self._direct_http is not None:
+            self._direct_http.close()
+        if REQUESTS_IMPORT_ERROR is None:
+            # pylint finds our Session stub instead of requests.Session:
+            # pylint: disable-next=no-member
+            super().close()
+
     def _unmount(self, *args: t.Any) -> None:
         for proto in args:
             self.adapters.pop(proto)
@@ -734,6 +915,19 @@ class APIClient(_Session):
         self._raise_for_status(res)
         return self._stream_raw_result(res, chunk_size=chunk_size, decode=False)
 
+    def get_raw_response(self, pathfmt: str, *args: str, **kwargs: t.Any) -> Response:
+        """
+        Send a GET request and return the response without reading its body.
+        The body can be read directly from ``response.raw``; the caller must
+        close the response.
+        """
+        res = self._get(
+            self._url(pathfmt, *args, versioned_api=True), stream=True, **kwargs
+        )
+        self._raise_for_status(res)
+        self._disable_socket_timeout(self._get_raw_response_socket(res))
+        return res
+
     def delete_call(self, pathfmt: str, *args: str, **kwargs: t.Any) -> None:
         self._raise_for_status(
             self._delete(self._url(pathfmt, *args, versioned_api=True), **kwargs)
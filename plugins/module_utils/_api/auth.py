@@ -17,14 +17,15 @@ import logging
 import typing as t
 
 from . import errors
-from .credentials.errors import CredentialsNotFound, StoreError
-from .credentials.store import Store
 from .utils import config
 
 if t.TYPE_CHECKING:
     from ansible_collections.community.docker.plugins.module_utils._api.api.client import (
         APIClient,
     )
+    from ansible_collections.community.docker.plugins.module_utils._api.credentials.store import (
+        Store,
+    )
 
 
 INDEX_NAME = "docker.io"
@@ -271,6 +272,13 @@ class AuthConfig(dict):
             # docker.io - in that case, it seems the full URL is necessary.
             registry = INDEX_URL
         log.debug("Looking for auth entry for %s", repr(registry))
+        # Only import the credential helper machinery when a credential store
+        # is actually configured
+        from .credentials.errors import (
+            CredentialsNotFound,
+            StoreError,
+        )
+
         store = self._get_store_instance(credstore_name)
         try:
             data = store.get(registry)
@@ -295,6 +303,10 @@ class AuthConfig(dict):
 
     def _get_store_instance(self, name: str) -> Store:
         if name not in self._stores:
+            from .credentials.store import (
+                Store,
+            )
+
             self._stores[name] = Store(name, environment=self._credstore_env)
         return self._stores[name]
 
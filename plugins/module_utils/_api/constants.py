@@ -38,3 +38,7 @@ DEFAULT_NUM_POOLS_SSH = 9
 DEFAULT_MAX_POOL_SIZE = 10
 
 DEFAULT_DATA_CHUNK_SIZE = 1024 * 2048
+
+DEFAULT_FRAME_BUFFER_SIZE = 1024 * 256
+
+DEFAULT_STREAM_COALESCE_SIZE = 1024 * 64
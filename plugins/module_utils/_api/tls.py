@@ -15,7 +15,6 @@ import os
 import typing as t
 
 from . import errors
-from .transport.ssladapter import SSLHTTPAdapter
 
 if t.TYPE_CHECKING:
     from ansible_collections.community.docker.plugins.module_utils._api.api.client import (
@@ -32,7 +31,8 @@ class TLSConfig:
         ca_cert (str): Path to CA cert file.
         verify (bool or str): This can be ``False`` or a path to a CA cert
             file.
-        assert_hostname (bool): Verify the hostname of the server.
+        assert_hostname (bool or str): Verify the hostname of the server,
+            or verify it against this host name.
 
     .. _`SSL version`:
         https://docs.python.org/3.5/library/ssl.html#ssl.PROTOCOL_TLSv1
@@ -47,7 +47,7 @@ class TLSConfig:
         client_cert: tuple[str, str] | None = None,
         ca_cert: str | None = None,
         verify: bool | None = None,
-        assert_hostname: bool | None = None,
+        assert_hostname: str | bool | None = None,
     ):
         # Argument compatibility/mapping with
         # https://docs.docker.com/engine/articles/https/
@@ -86,9 +86,12 @@ class TLSConfig:
                 "Invalid CA certificate provided for `ca_cert`."
             )
 
-    def configure_client(self, client: APIClient) -> None:
+    def configure_client(self, client: APIClient, session_cache: bool = False) -> None:
         """
         Configure a client with these TLS options.
+
+        If ``session_cache`` is ``True``, TLS sessions are resumed for new
+        connections made in the same process with the same options.
         """
 
         if self.verify and self.ca_cert:
@@ -99,9 +102,22 @@ class TLSConfig:
         if self.cert:
             client.cert = self.cert
 
+        from .transport.ssladapter import (
+            SSLHTTPAdapter,
+        )
+
+        ssl_context = None
+        if session_cache:
+            from .._tls_sessions import get_session_caching_context
+
+            ssl_context = get_session_caching_context(
+                (self.cert, self.ca_cert, self.verify, self.assert_hostname)
+            )
+
         client.mount(
             "https://",
             SSLHTTPAdapter(
                 assert_hostname=self.assert_hostname,
+                ssl_context=ssl_context,
             ),
         )
@@ -39,9 +39,12 @@ if t.TYPE_CHECKING:
 
 RecentlyUsedContainer = urllib3._collections.RecentlyUsedContainer
 
+# Same default as the one of Ansible's ssh connection plugin
+CONTROL_PATH_DIR = "~/.ansible/cp"
+
 
 class SSHSocket(socket.socket):
-    def __init__(self, host: str) -> None:
+    def __init__(self, host: str, control_persist: int | None = None) -> None:
         super().__init__(socket.AF_INET, socket.SOCK_STREAM)
         self.host = host
         self.port = None
@@ -50,9 +53,35 @@ class SSHSocket(socket.socket):
             self.host, self.port = self.host.split(":")
         if "@" in self.host:
             self.user, self.host = self.host.split("@")
+        self.control_persist = control_persist
 
         self.proc: subprocess.Popen | None = None
 
+    def _get_control_args(self) -> list[str]:
+        """
+        Options that make ssh share one connection per host through a control
+        socket, which is kept open for ``control_persist`` seconds after the
+        last use. Later ssh processes, also from other module runs, only open
+        a new channel on that connection instead of doing a full handshake.
+        """
+        if not self.control_persist:
+            return []
+        control_path_dir = os.path.expanduser(CONTROL_PATH_DIR)
+        try:
+            os.makedirs(control_path_dir, mode=0o700, exist_ok=True)
+        except OSError:
+            # Without the directory ssh cannot create the control socket;
+            # connect without multiplexing instead of failing
+            return []
+        return [
+            "-o",
+            "ControlMaster=auto",
+            "-o",
+            f"ControlPersist={self.control_persist}s",
+            "-o",
+            f"ControlPath={os.path.join(control_path_dir, '%C')}",
+        ]
+
     def connect(self, *args_: t.Any, **kwargs: t.Any) -> None:
         args = ["ssh"]
         if self.user:
@@ -61,6 +90,8 @@ class SSHSocket(socket.socket):
         if self.port:
             args = args + ["-p", self.port]
 
+        args = args + self._get_control_args()
+
         args = args + ["--", self.host, "docker system dial-stdio"]
 
         preexec_func = None
@@ -113,6 +144,15 @@ class SSHSocket(socket.socket):
         assert self.proc.stdout is not None
         return self.proc.stdout.read(n)
 
+    def recv_into(self, buffer: Buffer, *args: t.Any, **kwargs: t.Any) -> int:
+        if not self.proc:
+            raise RuntimeError(
+                "SSH subprocess not initiated. connect() must be called first."
+            )
+        assert self.proc.stdout is not None
+        # Return what is available instead of waiting until the buffer is full
+        return self.proc.stdout.readinto1(buffer)  # type: ignore[attr-defined]
+
     def makefile(self, mode: str, *args: t.Any, **kwargs: t.Any) -> t.IO:  # type: ignore
         if not self.proc:
             self.connect()
@@ -140,11 +180,13 @@ class SSHConnection(urllib3_connection.HTTPConnection):
         ssh_transport: paramiko.Transport | None = None,
         timeout: int | float = 60,
         host: str,
+        control_persist: int | None = None,
     ) -> None:
         super().__init__("localhost", timeout=timeout)
         self.ssh_transport = ssh_transport
         self.timeout = timeout
         self.ssh_host = host
+        self.control_persist = control_persist
         self.sock: paramiko.Channel | SSHSocket | None = None
 
     def connect(self) -> None:
@@ -154,7 +196,7 @@ class SSHConnection(urllib3_connection.HTTPConnection):
             channel.exec_command("docker system dial-stdio")
             self.sock = channel
         else:
-            sock = SSHSocket(self.ssh_host)
+            sock = SSHSocket(self.ssh_host, control_persist=self.control_persist)
             sock.settimeout(self.timeout)
             sock.connect()
             self.sock = sock
@@ -170,6 +212,7 @@ class SSHConnectionPool(urllib3.connectionpool.HTTPConnectionPool):
         timeout: int | float = 60,
         maxsize: int = 10,
         host: str,
+        control_persist: int | None = None,
     ) -> None:
         super().__init__("localhost", timeout=timeout, maxsize=maxsize)
         self.ssh_transport: paramiko.Transport | None = None
@@ -177,12 +220,14 @@ class SSHConnectionPool(urllib3.connectionpool.HTTPConnectionPool):
         if ssh_client:
             self.ssh_transport = ssh_client.get_transport()
         self.ssh_host = host
+        self.control_persist = control_persist
 
     def _new_conn(self) -> SSHConnection:
         return SSHConnection(
             ssh_transport=self.ssh_transport,
             timeout=self.timeout,
             host=self.ssh_host,
+            control_persist=self.control_persist,
         )
 
     # When re-using connections, urllib3 calls fileno() on our
@@ -214,6 +259,7 @@ class SSHHTTPAdapter(BaseHTTPAdapter):
         "ssh_client",
         "ssh_params",
         "max_pool_size",
+        "control_persist",
     ]
 
     def __init__(
@@ -223,8 +269,12 @@ class SSHHTTPAdapter(BaseHTTPAdapter):
         pool_connections: int = constants.DEFAULT_NUM_POOLS,
         max_pool_size: int = constants.DEFAULT_MAX_POOL_SIZE,
         shell_out: bool = False,
+        control_persist: int | None = None,
     ) -> None:
         self.ssh_client: paramiko.SSHClient | None = None
+        # Only used with shell_out; paramiko connections cannot be shared
+        # between processes
+        self.control_persist = control_persist
         if not shell_out:
             self._create_paramiko_client(base_url)
             self._connect()
@@ -285,6 +335,7 @@ class SSHHTTPAdapter(BaseHTTPAdapter):
                 timeout=self.timeout,
                 maxsize=self.max_pool_size,
                 host=self.ssh_host,
+                control_persist=self.control_persist,
             )
         with self.pools.lock:
             pool = self.pools.get(url)
@@ -16,6 +16,9 @@ import typing as t
 from .._import_helper import HTTPAdapter, urllib3
 from .basehttpadapter import BaseHTTPAdapter
 
+if t.TYPE_CHECKING:
+    import ssl
+
 # Resolves OpenSSL issues in some servers:
 #   https://lukasa.co.uk/2013/01/Choosing_SSL_Version_In_Requests/
 #   https://github.com/kennethreitz/requests/pull/799
@@ -31,10 +34,12 @@ class SSLHTTPAdapter(BaseHTTPAdapter):
 
     def __init__(
         self,
-        assert_hostname: bool | None = None,
+        assert_hostname: str | bool | None = None,
+        ssl_context: ssl.SSLContext | None = None,
         **kwargs: t.Any,
     ) -> None:
         self.assert_hostname = assert_hostname
+        self.ssl_context = ssl_context
         super().__init__(**kwargs)
 
     def init_poolmanager(
@@ -47,6 +52,8 @@ class SSLHTTPAdapter(BaseHTTPAdapter):
         }
         if self.assert_hostname is not None:
             kwargs["assert_hostname"] = self.assert_hostname
+        if self.ssl_context is not None:
+            kwargs["ssl_context"] = self.ssl_context
 
         self.poolmanager = PoolManager(**kwargs)
 
@@ -11,14 +11,24 @@
 
 from __future__ import annotations
 
+import codecs
 import json
 import json.decoder
+import re
 import typing as t
 
 from ..errors import StreamParseError
 
+_orjson: t.Any = None  # pylint: disable=invalid-name
+try:
+    # use orjson if possible for speedup
+    import orjson
+
+    _orjson = orjson  # pylint: disable=invalid-name
+except ImportError:
+    pass
+
 if t.TYPE_CHECKING:
-    import re
     from collections.abc import Callable
 
     _T = t.TypeVar("_T")
@@ -26,6 +36,8 @@ if t.TYPE_CHECKING:
 
 json_decoder = json.JSONDecoder()
 
+_WHITESPACE: re.Pattern = json.decoder.WHITESPACE  # type: ignore[attr-defined]
+
 
 def stream_as_text(stream: t.Generator[bytes | str]) -> t.Generator[str]:
     """
@@ -47,20 +59,114 @@ def json_splitter(buffer: str) -> tuple[t.Any, str] | None:
     buffer = buffer.strip()
     try:
         obj, index = json_decoder.raw_decode(buffer)
-        ws: re.Pattern = json.decoder.WHITESPACE  # type: ignore[attr-defined]
-        m = ws.match(buffer, index)
+        m = _WHITESPACE.match(buffer, index)
         rest = buffer[m.end() :] if m else buffer[index:]
         return obj, rest
     except ValueError:
         return None
 
 
-def json_stream(stream: t.Generator[str | bytes]) -> t.Generator[t.Any]:
+class JSONStreamDecoder:
+    """Incrementally decode a stream of concatenated JSON objects.
+
+    The decoder keeps an offset into its buffer instead of slicing off every
+    decoded object. New data is collected in a list, and the buffer is only
+    rebuilt from the unconsumed rest and the new data when decoding is
+    attempted. This keeps decoding linear in the size of the stream, even if
+    a single chunk contains thousands of objects.
+
+    Incomplete objects are only retried once new data contains a newline, or
+    once the amount of pending data has doubled. This avoids decoding a large
+    object over and over again while it arrives in small pieces.
+
+    If ``orjson`` is available, newline-delimited objects are decoded with it.
+    """
+
+    def __init__(self, use_orjson: bool = True) -> None:
+        self._buffer = ""
+        self._pos = 0
+        self._pending: list[str] = []
+        self._pending_size = 0
+        self._retry_size = 0
+        self._orjson = _orjson if use_orjson else None
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")("replace")
+
+    def _compact(self) -> None:
+        self._buffer = self._buffer[self._pos :] + "".join(self._pending)
+        self._pos = 0
+        self._pending = []
+        self._pending_size = 0
+
+    def _decode_line(self) -> tuple[t.Any, int] | None:
+        if self._orjson is None:
+            return None
+        end = self._buffer.find("\n", self._pos)
+        if end < 0:
+            return None
+        try:
+            return self._orjson.loads(self._buffer[self._pos : end]), end + 1
+        except ValueError:
+            # For example several objects on one line; let the json module
+            # decide what to do
+            return None
+
+    def _decode_all(self) -> t.Generator[t.Any]:
+        self._compact()
+        buffer_length = len(self._buffer)
+        while True:
+            m = _WHITESPACE.match(self._buffer, self._pos)
+            if m:
+                self._pos = m.end()
+            if self._pos >= buffer_length:
+                self._retry_size = 0
+                return
+            result = self._decode_line()
+            if result is None:
+                try:
+                    result = json_decoder.raw_decode(self._buffer, self._pos)
+                except ValueError:
+                    self._retry_size = buffer_length - self._pos
+                    return
+            obj, self._pos = result
+            yield obj
+
+    def feed(self, data: str | bytes) -> t.Generator[t.Any]:
+        """Add data to the buffer and return all objects that are complete."""
+        if not isinstance(data, str):
+            data = self._text_decoder.decode(data)
+        if not data:
+            return
+        self._pending.append(data)
+        self._pending_size += len(data)
+        if (
+            self._retry_size
+            and "\n" not in data
+            and self._pending_size < self._retry_size
+        ):
+            return
+        yield from self._decode_all()
+
+    def finish(self) -> t.Generator[t.Any]:
+        """Return all remaining objects. Raises ``StreamParseError`` if the
+        stream ends with an incomplete or invalid object."""
+        self._pending.append(self._text_decoder.decode(b"", final=True))
+        yield from self._decode_all()
+        if self._pos < len(self._buffer):
+            try:
+                yield json_decoder.decode(self._buffer[self._pos :])
+            except Exception as e:
+                raise StreamParseError(e) from e
+
+
+def json_stream(stream: t.Iterable[str | bytes]) -> t.Generator[t.Any]:
     """Given a stream of text, return a stream of json objects.
     This handles streams which are inconsistently buffered (some entries may
     be newline delimited, and others are not).
     """
-    return split_buffer(stream, json_splitter, json_decoder.decode)
+    decoder = JSONStreamDecoder()
+    for data in stream:
+        yield from decoder.feed(data)
+    yield from decoder.finish()
 
 
 def line_splitter(buffer: str, separator: str = "\n") -> tuple[str, str] | None:
@@ -16,9 +16,10 @@ import os
 import select
 import socket as pysocket
 import struct
+import sys
 import typing as t
 
-from ..transport.npipesocket import NpipeSocket
+from ..constants import DEFAULT_FRAME_BUFFER_SIZE, STREAM_HEADER_SIZE_BYTES
 
 if t.TYPE_CHECKING:
     from collections.abc import Sequence
@@ -38,22 +39,58 @@ class SocketError(Exception):
 # pywintypes.error: (109, 'ReadFile', 'The pipe has been ended.')
 NPIPE_ENDED = 109
 
+_NPIPESOCKET_MODULE = __name__.rsplit(".", 2)[0] + ".transport.npipesocket"
 
-def read(socket: SocketLike, n: int = 4096) -> bytes | None:
+
+def _is_npipe_socket(socket: SocketLike) -> bool:
+    # An NpipeSocket can only exist once its module has been imported, which
+    # only happens for npipe:// connections. This avoids importing it (and
+    # trying to import pywin32) for all other connections.
+    module = sys.modules.get(_NPIPESOCKET_MODULE)
+    return module is not None and isinstance(socket, module.NpipeSocket)
+
+
+class SocketWaiter:
+    """
+    Waits until a socket is readable.
+
+    The poll object is created once and re-used for every wait, instead of
+    creating a new one before every single read.
+    """
+
+    def __init__(self, socket: SocketLike) -> None:
+        self._poll: t.Any = None
+        self._select_socket: SocketLike | None = None
+        if _is_npipe_socket(socket):
+            return
+        if hasattr(select, "poll"):
+            self._poll = select.poll()
+            self._poll.register(socket, select.POLLIN | select.POLLPRI)
+        else:
+            # Limited to 1024
+            self._select_socket = socket
+
+    def wait(self) -> None:
+        if self._poll is not None:
+            self._poll.poll()
+        elif self._select_socket is not None:
+            select.select([self._select_socket], [], [])
+
+
+def _is_pipe_ended(socket: SocketLike, e: Exception) -> bool:
+    return _is_npipe_socket(socket) and len(e.args) > 0 and e.args[0] == NPIPE_ENDED
+
+
+def read(
+    socket: SocketLike, n: int = 4096, waiter: SocketWaiter | None = None
+) -> bytes | None:
     """
     Reads at most n bytes from socket
     """
 
     recoverable_errors = (errno.EINTR, errno.EDEADLK, errno.EWOULDBLOCK)
 
-    if not isinstance(socket, NpipeSocket):  # type: ignore[unreachable]
-        if not hasattr(select, "poll"):
-            # Limited to 1024
-            select.select([socket], [], [])
-        else:
-            poll = select.poll()
-            poll.register(socket, select.POLLIN | select.POLLPRI)
-            poll.poll()
+    (waiter or SocketWaiter(socket)).wait()
 
     try:
         if hasattr(socket, "recv"):
@@ -66,30 +103,202 @@ def read(socket: SocketLike, n: int = 4096) -> bytes | None:
             raise
         return None  # TODO ???
     except Exception as e:
-        is_pipe_ended = (
-            isinstance(socket, NpipeSocket)  # type: ignore[unreachable]
-            and len(e.args) > 0
-            and e.args[0] == NPIPE_ENDED
-        )
-        if is_pipe_ended:
+        if _is_pipe_ended(socket, e):
             # npipes do not support duplex sockets, so we interpret
             # a PIPE_ENDED error as a close operation (0-length read).
             return b""
         raise
 
 
+def read_into(
+    socket: SocketLike, buffer: memoryview, waiter: SocketWaiter | None = None
+) -> int | None:
+    """
+    Reads at most len(buffer) bytes from socket into buffer.
+
+    Returns the number of bytes read, 0 on EOF, or None if the read should
+    be retried.
+    """
+
+    recoverable_errors = (errno.EINTR, errno.EDEADLK, errno.EWOULDBLOCK)
+
+    (waiter or SocketWaiter(socket)).wait()
+
+    try:
+        if hasattr(socket, "recv_into"):
+            return socket.recv_into(buffer)
+        if hasattr(socket, "recv"):
+            # For example paramiko channels, which have no recv_into()
+            data = socket.recv(len(buffer))
+            buffer[: len(data)] = data
+            return len(data)
+        if isinstance(socket, pysocket.SocketIO):  # type: ignore
+            return socket.readinto(buffer)  # type: ignore[unreachable]
+        return os.readv(socket.fileno(), [buffer])
+    except EnvironmentError as e:
+        if e.errno not in recoverable_errors:
+            raise
+        return None
+    except Exception as e:
+        if _is_pipe_ended(socket, e):
+            return 0
+        raise
+
+
 def read_exactly(socket: SocketLike, n: int) -> bytes:
     """
     Reads exactly n bytes from socket
     Raises SocketError if there is not enough data
     """
-    data = b""
+    waiter = SocketWaiter(socket)
+    data = bytearray()
     while len(data) < n:
-        next_data = read(socket, n - len(data))
+        next_data = read(socket, n - len(data), waiter=waiter)
         if not next_data:
             raise SocketError("Unexpected EOF")
         data += next_data
-    return data
+    return bytes(data)
+
+
+class FrameReader:
+    """
+    Reads frames from an attach or exec socket into a single preallocated
+    buffer.
+
+    The frames are yielded as ``(stream, data)`` tuples, where ``data`` is a
+    ``memoryview`` into the reader's buffer. The view is only valid until the
+    next frame is requested, so callers have to copy or consume it before
+    continuing the iteration.
+
+    If ``tty`` is enabled, the data is not multiplexed and everything is
+    reported as ``STDOUT``. Otherwise the stream is parsed according to the
+    protocol defined here:
+
+    https://docs.docker.com/engine/api/v1.24/#attach-to-a-container
+    """
+
+    def __init__(
+        self,
+        socket: SocketLike,
+        *,
+        tty: bool = False,
+        buffer_size: int = DEFAULT_FRAME_BUFFER_SIZE,
+    ) -> None:
+        self._socket = socket
+        self._tty = tty
+        self._buffer = bytearray(max(buffer_size, STREAM_HEADER_SIZE_BYTES))
+        self._view = memoryview(self._buffer)
+        self._waiter = SocketWaiter(socket)
+        self._start = 0
+        self._end = 0
+
+    def _fill(self) -> bool:
+        """
+        Read more data into the buffer. Returns ``False`` on EOF.
+        """
+        if self._start == self._end:
+            self._start = self._end = 0
+        elif self._end == len(self._buffer):
+            # Only an incomplete frame header can be left over, since frame
+            # data is handed out as soon as it arrives.
+            remaining = bytes(self._view[self._start : self._end])
+            self._buffer[: len(remaining)] = remaining
+            self._start, self._end = 0, len(remaining)
+        while True:
+            count = read_into(self._socket, self._view[self._end :], self._waiter)
+            if count is None:
+                continue
+            if count == 0:
+                return False
+            self._end += count
+            return True
+
+    def _frames_tty(self) -> t.Generator[tuple[int, memoryview]]:
+        while self._fill():
+            yield STDOUT, self._view[self._start : self._end]
+            self._start = self._end
+
+    def _frames_no_tty(self) -> t.Generator[tuple[int, memoryview]]:
+        while True:
+            while self._end - self._start < STREAM_HEADER_SIZE_BYTES:
+                if not self._fill():
+                    return
+            stream, length = struct.unpack_from(">BxxxL", self._buffer, self._start)
+            self._start += STREAM_HEADER_SIZE_BYTES
+            while length > 0:
+                if self._start == self._end and not self._fill():
+                    # We have reached EOF
+                    return
+                size = min(length, self._end - self._start)
+                yield stream, self._view[self._start : self._start + size]
+                self._start += size
+                length -= size
+
+    def frames(self) -> t.Generator[tuple[int, memoryview]]:
+        """
+        Return a generator of ``(stream, data)`` frames.
+        """
+        if self._tty:
+            return self._frames_tty()
+        return self._frames_no_tty()
+
+
+class DemuxAccumulator:
+    """
+    Collects frame data per stream and joins every stream once at the end.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: dict[int, list[bytes]] = {STDOUT: [], STDERR: []}
+
+    def add(self, stream_id: int, data: bytes | memoryview) -> None:
+        try:
+            chunks = self._chunks[stream_id]
+        except KeyError:
+            raise ValueError(f"{stream_id} is not a valid stream") from None
+        chunks.append(bytes(data))
+
+    def _join(self, stream_id: int) -> bytes | None:
+        chunks = self._chunks[stream_id]
+        return b"".join(chunks) if chunks else None
+
+    def result(self) -> tuple[bytes | None, bytes | None]:
+        return self._join(STDOUT), self._join(STDERR)
+
+
+@t.overload
+def consume_frames(reader: FrameReader, demux: t.Literal[False] = False) -> bytes: ...
+
+
+@t.overload
+def consume_frames(
+    reader: FrameReader, demux: t.Literal[True]
+) -> tuple[bytes | None, bytes | None]: ...
+
+
+@t.overload
+def consume_frames(
+    reader: FrameReader, demux: bool = False
+) -> bytes | tuple[bytes | None, bytes | None]: ...
+
+
+def consume_frames(
+    reader: FrameReader, demux: bool = False
+) -> bytes | tuple[bytes | None, bytes | None]:
+    """
+    Read all frames from the reader and return the result.
+
+    If ``demux`` is ``False``, the result is the concatenation of all frames.
+    Otherwise it is a 2-tuple with the concatenated stdout and stderr data.
+    A stream that did not receive any data is reported as ``None``.
+    """
+    if not demux:
+        return b"".join([bytes(data) for dummy, data in reader.frames()])
+
+    accumulator = DemuxAccumulator()
+    for stream, data in reader.frames():
+        accumulator.add(stream, data)
+    return accumulator.result()
 
 
 def next_frame_header(socket: SocketLike) -> tuple[int, int]:
@@ -116,9 +325,8 @@ def frames_iter(socket: SocketLike, tty: bool) -> t.Generator[tuple[int, bytes]]
     If the tty setting is enabled, the streams are multiplexed into the stdout
     stream.
     """
-    if tty:
-        return ((STDOUT, frame) for frame in frames_iter_tty(socket))
-    return frames_iter_no_tty(socket)
+    reader = FrameReader(socket, tty=tty)
+    return ((stream, bytes(data)) for stream, data in reader.frames())
 
 
 def frames_iter_no_tty(socket: SocketLike) -> t.Generator[tuple[int, bytes]]:
@@ -126,20 +334,7 @@ def frames_iter_no_tty(socket: SocketLike) -> t.Generator[tuple[int, bytes]]:
     Returns a generator of data read from the socket when the tty setting is
     not enabled.
     """
-    while True:
-        stream, n = next_frame_header(socket)
-        if n < 0:
-            break
-        while n > 0:
-            result = read(socket, n)
-            if result is None:
-                continue
-            data_length = len(result)
-            if data_length == 0:
-                # We have reached EOF
-                return
-            n -= data_length
-            yield (stream, result)
+    return frames_iter(socket, False)
 
 
 def frames_iter_tty(socket: SocketLike) -> t.Generator[bytes]:
@@ -147,12 +342,7 @@ def frames_iter_tty(socket: SocketLike) -> t.Generator[bytes]:
     Return a generator of data read from the socket when the tty setting is
     enabled.
     """
-    while True:
-        result = read(socket)
-        if not result:
-            # We have reached EOF
-            return
-        yield result
+    return (data for dummy, data in frames_iter(socket, True))
 
 
 @t.overload
@@ -210,7 +400,7 @@ def consume_socket_output(
 
     # If the streams are demultiplexed, the generator yields tuples
     # (stdout, stderr)
-    out: list[bytes | None] = [None, None]
+    accumulator = DemuxAccumulator()
     frame: tuple[bytes | None, bytes | None]
     for frame in frames:  # type: ignore
         # It is guaranteed that for each frame, one and only one stream
@@ -218,16 +408,10 @@ def consume_socket_output(
         if frame == (None, None):
             raise AssertionError(f"frame must be (None, None), but got {frame}")
         if frame[0] is not None:
-            if out[0] is None:
-                out[0] = frame[0]
-            else:
-                out[0] += frame[0]
+            accumulator.add(STDOUT, frame[0])
         else:
-            if out[1] is None:
-                out[1] = frame[1]
-            else:
-                out[1] += frame[1]  # type: ignore[operator]
-    return tuple(out)  # type: ignore
+            accumulator.add(STDERR, frame[1])  # type: ignore[arg-type]
+    return accumulator.result()  # type: ignore
 
 
 def demux_adaptor(stream_id: int, data: bytes) -> tuple[bytes | None, bytes | None]:
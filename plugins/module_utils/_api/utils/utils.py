@@ -517,3 +517,27 @@ def format_extra_hosts(extra_hosts: Mapping[str, str], task: bool = False) -> li
         return [f"{v} {k}" for k, v in sorted(extra_hosts.items())]
 
     return [f"{k}:{v}" for k, v in sorted(extra_hosts.items())]
+
+
+def coalesce_chunks(chunks: t.Iterable[bytes], size: int) -> t.Generator[bytes]:
+    """
+    Combine consecutive chunks into blocks of at most ``size`` bytes.
+
+    Small chunks are copied into a reusable buffer. Chunks that do not fit
+    into the buffer are passed through unchanged.
+    """
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    fill = 0
+    for data in chunks:
+        length = len(data)
+        if fill and fill + length > size:
+            yield bytes(view[:fill])
+            fill = 0
+        if length >= size:
+            yield data
+            continue
+        view[fill : fill + length] = data
+        fill += length
+    if fill:
+        yield bytes(view[:fill])
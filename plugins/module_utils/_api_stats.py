@@ -0,0 +1,269 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# Note that this module util is **PRIVATE** to the collection. It can have breaking changes at any time.
+# Do not use this from other collections or standalone plugins/modules!
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+import time
+import typing as t
+from urllib.parse import urlsplit
+
+from ansible.module_utils.parsing.convert_bool import BOOLEANS_TRUE
+
+if t.TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+
+API_STATS_ENV_VAR = "ANSIBLE_DOCKER_API_STATS"
+
+_VERSION_PREFIX = re.compile(r"^/v[0-9.]+(?=/)")
+
+# The request currently sent by this thread, for attributing TLS handshakes
+# and retries
+_current = threading.local()
+
+
+def is_api_stats_enabled() -> bool:
+    return os.environ.get(API_STATS_ENV_VAR, "").lower() in BOOLEANS_TRUE
+
+
+class APICall:
+    """
+    Information on one request to the Docker daemon.
+
+    ``latency`` is the time until the response header has been received.
+    ``duration`` also includes reading the body of streamed responses.
+    """
+
+    def __init__(self, method: str, endpoint: str) -> None:
+        self.method = method
+        self.endpoint = endpoint
+        self.status: int | None = None
+        self.error: str | None = None
+        self.latency = 0.0
+        self.duration = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.retries = 0
+        self.tls_handshake: str | None = None
+        self._start = time.monotonic()
+
+    def response_received(self, status: int) -> None:
+        self.status = status
+        self.latency = self.duration = time.monotonic() - self._start
+
+    def failed(self, exc: BaseException) -> None:
+        self.error = type(exc).__name__
+        self.latency = self.duration = time.monotonic() - self._start
+
+    def add_response_bytes(self, size: int) -> None:
+        self.response_bytes += size
+        self.duration = time.monotonic() - self._start
+
+    def to_dict(self) -> dict[str, t.Any]:
+        result = {
+            "method": self.method,
+            "endpoint": self.endpoint,
+            "status": self.status,
+            "latency": round(self.latency, 6),
+            "duration": round(self.duration, 6),
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "retries": self.retries,
+        }
+        if self.error is not None:
+            result["error"] = self.error
+        if self.tls_handshake is not None:
+            result["tls_handshake"] = self.tls_handshake
+        return result
+
+
+class APIStats:
+    """
+    Collects an ``APICall`` record for every request an ``APIClient`` sends.
+
+    Requests are identified by their endpoint template, like
+    ``/containers/{0}/json``, so that calls for different objects are
+    aggregated. Body sizes do not include the HTTP headers.
+    """
+
+    def __init__(self) -> None:
+        self.calls: list[APICall] = []
+        self._templates: dict[str, str] = {}
+
+    def remember_template(self, url: str, pathfmt: str) -> None:
+        self._templates[url] = pathfmt
+
+    def _get_endpoint(self, url: str) -> str:
+        template = self._templates.get(url)
+        if template is not None:
+            return template
+        return _VERSION_PREFIX.sub("", urlsplit(url).path)
+
+    def start(self, method: str, url: str) -> APICall:
+        call = APICall(method, self._get_endpoint(url))
+        self.calls.append(call)
+        return call
+
+    def track_request_body(self, call: APICall, data: t.Any) -> t.Any:
+        """
+        Count the size of a request body. Returns the body to send instead
+        of ``data``.
+        """
+        if data is None:
+            return None
+        if isinstance(data, str):
+            call.request_bytes = len(data.encode("utf-8"))
+            return data
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            call.request_bytes = len(data)
+            return data
+        if hasattr(data, "send_to"):
+            # Sized bodies, see APIClient._http()
+            call.request_bytes = len(data)
+            return data
+        if hasattr(data, "fileno") and hasattr(data, "tell"):
+            try:
+                call.request_bytes = os.fstat(data.fileno()).st_size - data.tell()
+            except (OSError, ValueError):
+                pass
+            return data
+        if hasattr(data, "__next__"):
+            return self._count_sent(call, data)
+        return data
+
+    @staticmethod
+    def _count_sent(call: APICall, data: Iterator[bytes]) -> t.Generator[bytes]:
+        for chunk in data:
+            call.request_bytes += len(chunk)
+            yield chunk
+
+    def track(
+        self,
+        method: str,
+        url: str,
+        send: Callable[..., t.Any],
+        kwargs: dict[str, t.Any],
+    ) -> t.Any:
+        """
+        Send a request with ``send(url, **kwargs)`` and record it.
+        """
+        call = self.start(method, url)
+        if "data" in kwargs:
+            kwargs["data"] = self.track_request_body(call, kwargs["data"])
+        _current.call = call
+        try:
+            response = send(url, **kwargs)
+        except Exception as exc:
+            call.failed(exc)
+            raise
+        finally:
+            _current.call = None
+        call.response_received(response.status_code)
+        if kwargs.get("stream"):
+            # The body is counted by the stream helpers while it is read
+            response._api_call = call
+        else:
+            call.add_response_bytes(len(response.content or b""))
+        return response
+
+    def clear(self) -> None:
+        self.calls = []
+        self._templates = {}
+
+    def summarize(self) -> dict[str, t.Any]:
+        """
+        Summarize the recorded requests. The endpoints are ordered by the
+        total time spent on them, longest first.
+        """
+        calls = self.calls
+        endpoints: dict[tuple[str, str], dict[str, t.Any]] = {}
+        for call in calls:
+            entry = endpoints.get((call.method, call.endpoint))
+            if entry is None:
+                entry = endpoints[(call.method, call.endpoint)] = {
+                    "method": call.method,
+                    "endpoint": call.endpoint,
+                    "count": 0,
+                    "duration": 0.0,
+                    "max_duration": 0.0,
+                    "request_bytes": 0,
+                    "response_bytes": 0,
+                    "retries": 0,
+                    "status": {},
+                }
+            entry["count"] += 1
+            entry["duration"] += call.duration
+            entry["max_duration"] = max(entry["max_duration"], call.duration)
+            entry["request_bytes"] += call.request_bytes
+            entry["response_bytes"] += call.response_bytes
+            entry["retries"] += call.retries
+            status = str(call.status) if call.error is None else call.error
+            entry["status"][status] = entry["status"].get(status, 0) + 1
+        for entry in endpoints.values():
+            entry["duration"] = round(entry["duration"], 6)
+            entry["max_duration"] = round(entry["max_duration"], 6)
+        return {
+            "count": len(calls),
+            "duration": round(sum(call.duration for call in calls), 6),
+            "request_bytes": sum(call.request_bytes for call in calls),
+            "response_bytes": sum(call.response_bytes for call in calls),
+            "retries": sum(call.retries for call in calls),
+            "tls_handshakes": {
+                kind: sum(1 for call in calls if call.tls_handshake == kind)
+                for kind in ("full", "resumed")
+            },
+            "endpoints": sorted(
+                endpoints.values(), key=lambda entry: entry["duration"], reverse=True
+            ),
+            "requests": [call.to_dict() for call in calls],
+        }
+
+
+def note_tls_handshake(resumed: bool) -> None:
+    """
+    Record that a new TLS connection was made for the request this thread is
+    sending, and whether a previous session was resumed.
+    """
+    call = getattr(_current, "call", None)
+    if call is not None:
+        call.tls_handshake = "resumed" if resumed else "full"
+
+
+def note_retry() -> None:
+    """
+    Record that the request this thread is sending had to be sent again.
+    """
+    call = getattr(_current, "call", None)
+    if call is not None:
+        call.retries += 1
+
+
+def count_response_bytes(
+    call: APICall | None, data: Iterable[t.Any]
+) -> t.Generator[t.Any]:
+    """
+    Pass through the blocks of a streamed response, and add their size to
+    ``call``. Blocks can be bytes, strings, or tuples of those (for example
+    demultiplexed stdout/stderr pairs).
+    """
+    if call is None:
+        yield from data
+        return
+    for block in data:
+        call.add_response_bytes(_get_size(block))
+        yield block
+
+
+def _get_size(block: t.Any) -> int:
+    if isinstance(block, tuple):
+        return sum(_get_size(part) for part in block)
+    if block is None:
+        return 0
+    return len(block)
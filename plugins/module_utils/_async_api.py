@@ -0,0 +1,379 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# Note that this module util is **PRIVATE** to the collection. It can have breaking changes at any time.
+# Do not use this from other collections or standalone plugins/modules!
+
+"""
+Concurrent read-only requests to the Docker daemon with asyncio.
+
+Inventory plugins and info modules often need to inspect many objects. Doing
+this one request after the other is dominated by round trips. The helpers in
+here send the requests of a batch concurrently over a small pool of
+connections, using the connection and TLS configuration of an ``APIClient``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ssl
+import typing as t
+from urllib.parse import urlsplit
+from urllib.request import getproxies, proxy_bypass
+
+from ansible_collections.community.docker.plugins.module_utils._api.errors import (
+    DockerException,
+)
+from ansible_collections.community.docker.plugins.module_utils._api.tls import (
+    TLSConfig,
+)
+from ansible_collections.community.docker.plugins.module_utils._unix_http import (
+    BufferedHTTPResponse,
+    build_request_head,
+    get_body_framing,
+    get_request_target,
+    is_reusable,
+    parse_response_head,
+)
+
+if t.TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from ansible_collections.community.docker.plugins.module_utils._api.api.client import (
+        APIClient,
+    )
+    from ansible_collections.community.docker.plugins.module_utils._api_stats import (
+        APICall,
+    )
+
+
+DEFAULT_MAX_CONCURRENCY = 16
+
+
+class AsyncHTTPError(DockerException):
+    pass
+
+
+class GetJSON(t.NamedTuple):
+    """
+    A ``GET`` request whose result is JSON. The arguments are the same as for
+    ``APIClient.get_json()``.
+    """
+
+    pathfmt: str
+    args: Sequence[str] = ()
+    params: dict[str, t.Any] | None = None
+
+
+def _create_ssl_context(tls: bool | TLSConfig) -> ssl.SSLContext:
+    # Mirror what requests does with the options set by TLSConfig.configure_client()
+    ca_cert = tls.ca_cert if isinstance(tls, TLSConfig) and tls.verify else None
+    if ca_cert:
+        # Only the given CA is trusted, not the system's default CAs
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        context.load_verify_locations(cafile=ca_cert)
+    else:
+        context = ssl.create_default_context()
+    if isinstance(tls, TLSConfig):
+        if not tls.verify:
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        if tls.assert_hostname is False:
+            context.check_hostname = False
+        if tls.cert:
+            context.load_cert_chain(*tls.cert)
+    if context.verify_mode != ssl.CERT_NONE and not ca_cert:
+        try:
+            import certifi
+        except ImportError:
+            pass
+        else:
+            context.load_verify_locations(cafile=certifi.where())
+    return context
+
+
+def _uses_proxy(url: str) -> bool:
+    parts = urlsplit(url)
+    return bool(getproxies().get(parts.scheme)) and not proxy_bypass(
+        parts.hostname or ""
+    )
+
+
+class AsyncAPIClient:
+    """
+    Sends ``GET`` requests concurrently to the daemon ``client`` talks to.
+
+    Supports Unix sockets and TCP connections with and without TLS. At most
+    ``max_concurrency`` requests are in flight at the same time; connections
+    are kept open and reused until ``close()`` is called.
+
+    Results and errors are the same as those of ``client.get_json()``.
+    """
+
+    def __init__(
+        self, client: APIClient, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> None:
+        if not self.is_supported(client):
+            raise DockerException(
+                f"Cannot send concurrent requests to {client._connection_url}"
+            )
+        self.client = client
+        self.max_concurrency = max(max_concurrency, 1)
+        url = client._connection_url
+        self._unix_path: str | None = None
+        self._ssl: ssl.SSLContext | None = None
+        self._server_hostname: str | None = None
+        if url.startswith("http+unix://"):
+            self._unix_path = url[len("http+unix://") :]
+            self._host_header = "localhost"
+        else:
+            parts = urlsplit(url)
+            self._host = parts.hostname or "localhost"
+            self._port = parts.port or (443 if parts.scheme == "https" else 80)
+            self._host_header = parts.netloc
+            if parts.scheme == "https":
+                self._ssl = _create_ssl_context(client._tls)
+                tls = client._tls
+                if isinstance(tls, TLSConfig) and isinstance(tls.assert_hostname, str):
+                    self._server_hostname = tls.assert_hostname
+        self._idle: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._semaphore: asyncio.Semaphore | None = None
+
+    @staticmethod
+    def is_supported(client: APIClient) -> bool:
+        """
+        Whether requests to the daemon of ``client`` can be sent concurrently.
+        This is not the case for SSH and named pipe connections, and for TCP
+        connections that have to go through a proxy.
+        """
+        url = client._connection_url
+        if url.startswith("http+unix://"):
+            return hasattr(asyncio, "open_unix_connection")
+        if url.startswith(("http://", "https://")):
+            return not _uses_proxy(url)
+        return False
+
+    def _get_headers(self) -> dict[str, t.Any]:
+        headers: dict[str, t.Any] = {
+            "Host": self._host_header,
+            "User-Agent": self.client._http().headers.get("User-Agent"),
+            "Accept": "application/json",
+        }
+        headers.update(self.client._general_configs.get("HttpHeaders") or {})
+        return headers
+
+    async def _connect(
+        self,
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter, bool]:
+        while self._idle:
+            reader, writer = self._idle.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                return reader, writer, True
+            writer.close()
+        if self._unix_path is not None:
+            reader, writer = await asyncio.open_unix_connection(self._unix_path)
+        else:
+            reader, writer = await asyncio.open_connection(
+                self._host,
+                self._port,
+                ssl=self._ssl,
+                server_hostname=self._server_hostname if self._ssl else None,
+            )
+        return reader, writer, False
+
+    async def _read_response(
+        self, reader: asyncio.StreamReader, url: str
+    ) -> tuple[BufferedHTTPResponse, bool]:
+        version, status_code, reason, headers = parse_response_head(
+            await reader.readuntil(b"\r\n\r\n")
+        )
+        chunked, length = get_body_framing("GET", status_code, headers)
+        if chunked:
+            parts = []
+            while True:
+                line = await reader.readline()
+                try:
+                    size = int(line.split(b";", 1)[0], 16)
+                except ValueError as exc:
+                    raise AsyncHTTPError(f"Invalid chunk header {line!r}") from exc
+                if not size:
+                    # Skip trailers
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                parts.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            content = b"".join(parts)
+        elif length is None:
+            content = await reader.read()
+        else:
+            content = await reader.readexactly(length)
+        response = BufferedHTTPResponse(url, status_code, reason, headers, content)
+        return response, is_reusable(version, status_code, headers, chunked, length)
+
+    async def _request_once(
+        self, url: str, params: dict[str, t.Any] | None
+    ) -> BufferedHTTPResponse | None:
+        """
+        Send a request. Returns ``None`` if a reused connection turned out
+        to be closed by the daemon.
+        """
+        reader, writer, reused = await self._connect()
+        try:
+            writer.write(
+                build_request_head(
+                    "GET", get_request_target(url, params), self._get_headers()
+                )
+            )
+            await writer.drain()
+            response, reusable = await self._read_response(reader, url)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+            if reused:
+                return None
+            raise
+        except BaseException:
+            writer.close()
+            raise
+        if reusable:
+            self._idle.append((reader, writer))
+        else:
+            writer.close()
+        return response
+
+    async def _request(
+        self, url: str, params: dict[str, t.Any] | None, call: APICall | None
+    ) -> BufferedHTTPResponse:
+        while True:
+            response = await self._request_once(url, params)
+            if response is not None:
+                return response
+            # The daemon closed an idle connection. Since GET requests can
+            # safely be repeated, try again; once the idle connections are
+            # used up, a new one is opened.
+            if call is not None:
+                call.retries += 1
+
+    async def _request_with_timeout(
+        self, url: str, params: dict[str, t.Any] | None, call: APICall | None
+    ) -> BufferedHTTPResponse:
+        try:
+            return await asyncio.wait_for(
+                self._request(url, params, call), self.client.timeout
+            )
+        except asyncio.TimeoutError as exc:  # noqa: UP041
+            raise AsyncHTTPError(f"Timeout while requesting {url}") from exc
+        except (
+            OSError,
+            asyncio.IncompleteReadError,
+            asyncio.LimitOverrunError,
+        ) as exc:
+            raise AsyncHTTPError(f"Error while requesting {url}: {exc}") from exc
+
+    async def get_json(
+        self,
+        pathfmt: str,
+        *args: str,
+        params: dict[str, t.Any] | None = None,
+    ) -> t.Any:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        url = self.client._url(pathfmt, *args, versioned_api=True)
+        async with self._semaphore:
+            stats = self.client.api_stats
+            call = stats.start("GET", url) if stats is not None else None
+            try:
+                response = await self._request_with_timeout(url, params, call)
+            except Exception as exc:
+                if call is not None:
+                    call.failed(exc)
+                raise
+            if call is not None:
+                call.response_received(response.status_code)
+                call.add_response_bytes(len(response.content))
+        # BufferedHTTPResponse offers the parts of requests.Response that are
+        # needed to process the result in the same way as the sync path does
+        return self.client._result(t.cast("t.Any", response), get_json=True)
+
+    async def get_json_batch(
+        self, calls: Sequence[GetJSON], *, return_exceptions: bool = False
+    ) -> list[t.Any]:
+        """
+        Run all ``calls`` concurrently. The results are returned in the same
+        order as ``calls``. If ``return_exceptions`` is ``True``, exceptions
+        are returned in place of results, otherwise the first one is raised.
+        """
+        return await asyncio.gather(
+            *(
+                self.get_json(call.pathfmt, *call.args, params=call.params)
+                for call in calls
+            ),
+            return_exceptions=return_exceptions,
+        )
+
+    async def close(self) -> None:
+        idle = self._idle
+        self._idle = []
+        for dummy, writer in idle:
+            writer.close()
+        for dummy, writer in idle:
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+
+def _get_json_serially(
+    client: APIClient, calls: Sequence[GetJSON], return_exceptions: bool
+) -> list[t.Any]:
+    results: list[t.Any] = []
+    for call in calls:
+        try:
+            results.append(
+                client.get_json(call.pathfmt, *call.args, params=call.params)
+            )
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            if not return_exceptions:
+                raise
+            results.append(exc)
+    return results
+
+
+def _is_loop_running() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def get_json_batch(
+    client: APIClient,
+    calls: Sequence[GetJSON],
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    return_exceptions: bool = False,
+) -> list[t.Any]:
+    """
+    Run ``client.get_json()`` for all ``calls`` and return the results in the
+    same order as ``calls``.
+
+    The requests are sent concurrently if the connection allows that (see
+    ``AsyncAPIClient.is_supported()``), and one after the other otherwise.
+    If ``return_exceptions`` is ``True``, exceptions are returned in place of
+    results, otherwise the first one is raised.
+    """
+    if len(calls) < 2 or not AsyncAPIClient.is_supported(client) or _is_loop_running():
+        return _get_json_serially(client, calls, return_exceptions)
+
+    async def run() -> list[t.Any]:
+        async_client = AsyncAPIClient(client, max_concurrency=max_concurrency)
+        try:
+            return await async_client.get_json_batch(
+                calls, return_exceptions=return_exceptions
+            )
+        finally:
+            await async_client.close()
+
+    return asyncio.run(run())
@@ -47,6 +47,19 @@ from ansible_collections.community.docker.plugins.module_utils._api.utils.utils
     convert_filters,
     parse_repository_tag,
 )
+from ansible_collections.community.docker.plugins.module_utils._api_stats import (
+    is_api_stats_enabled,
+)
+from ansible_collections.community.docker.plugins.module_utils._daemon_cache import (
+    DaemonMetadataCache,
+    is_cache_enabled,
+)
+from ansible_collections.community.docker.plugins.module_utils._tls_sessions import (
+    is_tls_session_cache_enabled,
+)
+from ansible_collections.community.docker.plugins.module_utils._unix_http import (
+    is_minimal_http_enabled,
+)
 from ansible_collections.community.docker.plugins.module_utils._util import (
     DEFAULT_DOCKER_HOST,
     DEFAULT_TIMEOUT_SECONDS,
@@ -63,6 +76,28 @@ if t.TYPE_CHECKING:
     from collections.abc import Callable
 
 
+SSH_CONTROL_PERSIST_ENV_VAR = "ANSIBLE_DOCKER_SSH_CONTROL_PERSIST"
+
+DEFAULT_SSH_CONTROL_PERSIST = 60
+
+
+def get_ssh_control_persist() -> int | None:
+    """
+    Return for how many seconds shared SSH connections should be kept open,
+    or ``None`` if SSH connections should not be shared.
+    """
+    value = os.environ.get(SSH_CONTROL_PERSIST_ENV_VAR, "").strip().lower()
+    if not value or value in BOOLEANS_FALSE:
+        return None
+    if value in BOOLEANS_TRUE:
+        return DEFAULT_SSH_CONTROL_PERSIST
+    try:
+        seconds = int(value)
+    except ValueError:
+        return DEFAULT_SSH_CONTROL_PERSIST
+    return seconds if seconds > 0 else None
+
+
 def _get_tls_config(
     fail_function: Callable[[str], t.NoReturn], **kwargs: t.Any
 ) -> TLSConfig:
@@ -112,18 +147,41 @@ def get_connect_params(
             tls_config["client_cert"] = (auth_data["cert_path"], auth_data["key_path"])
         result["tls"] = _get_tls_config(**tls_config)
 
+    if "tls" in result and is_tls_session_cache_enabled():
+        result["tls_session_cache"] = True
+
     if auth_data.get("use_ssh_client"):
         result["use_ssh_client"] = True
+        ssh_control_persist = get_ssh_control_persist()
+        if ssh_control_persist is not None:
+            result["ssh_control_persist"] = ssh_control_persist
+
+    if is_minimal_http_enabled():
+        result["use_minimal_http"] = True
+
+    if is_api_stats_enabled():
+        result["collect_stats"] = True
 
     # No TLS
     return result
 
 
 class AnsibleDockerClientBase(Client):
-    def __init__(self, min_docker_api_version: str | None = None) -> None:
+    def __init__(
+        self,
+        min_docker_api_version: str | None = None,
+        metadata_cache: bool = False,
+    ) -> None:
         self._connect_params = get_connect_params(
             self.auth_params, fail_function=self.fail
         )
+        self._metadata_cache: DaemonMetadataCache | None = None
+        if metadata_cache or is_cache_enabled():
+            self._metadata_cache = DaemonMetadataCache(
+                self._connect_params["base_url"],
+                tls=self._connect_params.get("tls"),
+                use_ssh_client=self._connect_params.get("use_ssh_client", False),
+            )
 
         try:
             super().__init__(**self._connect_params)
@@ -144,6 +202,35 @@ class AnsibleDockerClientBase(Client):
                 f"Docker API version is {self.docker_api_version_str}. Minimum version required is {min_docker_api_version}."
             )
 
+    def version(self, api_version: bool = True) -> dict[str, t.Any]:
+        if self._metadata_cache is None:
+            return super().version(api_version=api_version)
+        result = self._metadata_cache.get("version")
+        if result is None:
+            result = super().version(api_version=api_version)
+            self._metadata_cache.set("version", result)
+        return result
+
+    def info(self) -> dict[str, t.Any]:
+        result = super().info()
+        if self._metadata_cache is not None:
+            self._metadata_cache.set("info", result)
+        return result
+
+    def cached_info(self) -> dict[str, t.Any]:
+        """
+        Return the daemon information from ``GET /info``.
+
+        If the daemon metadata cache is enabled, the result can come from the
+        cache. Only use this for information that does not change while the
+        daemon is running, like ``OSType`` or ``Architecture``.
+        """
+        if self._metadata_cache is not None:
+            result = self._metadata_cache.get("info")
+            if result is not None:
+                return result
+        return self.info()
+
     def log(self, msg: t.Any, pretty_print: bool = False) -> None:
         pass
         # if self.debug:
@@ -562,7 +649,7 @@ class AnsibleDockerClientBase(Client):
                 timeout=None,
             )
             self._raise_for_status(response)
-            for line in self._stream_helper(response, decode=True):
+            for line in self._stream_helper(response, decode=True, coalesce=True):
                 self.log(line, pretty_print=True)
                 if line.get("error") or line.get("errorDetail"):
                     if line.get("errorDetail"):
@@ -643,7 +730,18 @@ class AnsibleDockerClient(AnsibleDockerClientBase):
 
     def fail(self, msg: str, **kwargs: t.Any) -> t.NoReturn:
         self.fail_results.update(kwargs)
-        self.module.fail_json(msg=msg, **sanitize_result(self.fail_results))
+        self.module.fail_json(
+            msg=msg, **sanitize_result(self.add_api_stats(self.fail_results))
+        )
+
+    def add_api_stats(self, result: dict[str, t.Any]) -> dict[str, t.Any]:
+        """
+        Add a summary of the requests sent to the daemon to the module's
+        result, if ANSIBLE_DOCKER_API_STATS is enabled. Returns ``result``.
+        """
+        if self.api_stats is not None:
+            result["debug_api_stats"] = self.api_stats.summarize()
+        return result
 
     def deprecate(
         self,
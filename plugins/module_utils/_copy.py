@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import base64
 import datetime
+import hashlib
 import io
 import json
 import os
@@ -26,9 +27,11 @@ from ansible_collections.community.docker.plugins.module_utils._api.errors impor
 )
 
 if t.TYPE_CHECKING:
-    from collections.abc import Callable
+    import socket
+    from collections.abc import Callable, Sequence
 
     from _typeshed import WriteableBuffer
+    from requests import Response
 
     from ansible_collections.community.docker.plugins.module_utils._api.api.client import (
         APIClient,
@@ -48,10 +51,11 @@ class DockerFileNotFound(DockerFileCopyError):
 
 
 def _put_archive(
-    client: APIClient, container: str, path: str, data: bytes | t.Generator[bytes]
+    client: APIClient, container: str, path: str, data: bytes | t.Iterable[bytes]
 ) -> bool:
     # data can also be file object for streaming. This is because _put uses requests's put().
     # See https://requests.readthedocs.io/en/latest/user/advanced/#streaming-uploads
+    # Bodies with a send_to() method are sent with the minimal HTTP client if possible.
     url = client._url("/containers/{0}/archive", container)
     res = client._put(url, params={"path": path}, data=data)
     client._raise_for_status(res)
@@ -92,7 +96,7 @@ def _symlink_tar_creator(
     return bio.getvalue()
 
 
-def _symlink_tar_generator(
+def _symlink_tar_body(
     b_in_path: bytes,
     file_stat: os.stat_result,
     out_file: str | bytes,
@@ -100,13 +104,149 @@ def _symlink_tar_generator(
     group_id: int,
     mode: int | None = None,
     user_name: str | None = None,
-) -> t.Generator[bytes]:
-    yield _symlink_tar_creator(
-        b_in_path, file_stat, out_file, user_id, group_id, mode, user_name
+) -> _TarBody:
+    return _TarBody(
+        [
+            _symlink_tar_creator(
+                b_in_path, file_stat, out_file, user_id, group_id, mode, user_name
+            )
+        ]
     )
 
 
-def _regular_file_tar_generator(
+def _tar_trailer(header_size: int, size: int) -> bytes:
+    """
+    Return what follows the content of a single archive member: the padding
+    to a full block, the end of archive marker, and the padding to a full
+    record.
+    """
+    # We need to write a multiple of 512 bytes. Fill up with zeros.
+    # End with two zeroed blocks
+    trailer = tarfile.NUL * (-size % tarfile.BLOCKSIZE + 2 * tarfile.BLOCKSIZE)
+    total_size = header_size + size + len(trailer)
+    return trailer + tarfile.NUL * (-total_size % tarfile.RECORDSIZE)
+
+
+_COALESCE_SIZE = 65536
+
+
+class _CoalescingWriter:
+    """
+    Collects small pieces of data and passes them on to ``write`` in pieces
+    of at least ``size`` bytes. Larger pieces are passed on directly.
+    """
+
+    def __init__(
+        self, write: Callable[[bytes], t.Any], size: int = _COALESCE_SIZE
+    ) -> None:
+        self._write = write
+        self._size = size
+        self._buffer = bytearray()
+
+    @property
+    def free(self) -> int:
+        """
+        How many bytes can be added before the collected data is passed on.
+        """
+        return self._size - len(self._buffer)
+
+    def write(self, data: bytes) -> None:
+        if len(data) >= self._size:
+            self.flush()
+            self._write(data)
+            return
+        self._buffer += data
+        if len(self._buffer) >= self._size:
+            self.flush()
+
+    def write_zeros(self, size: int) -> None:
+        while size > 0:
+            to_write = min(size, self._size)
+            self.write(tarfile.NUL * to_write)
+            size -= to_write
+
+    def flush(self) -> None:
+        if self._buffer:
+            self._write(bytes(self._buffer))
+            self._buffer.clear()
+
+
+class _FileContent(t.NamedTuple):
+    b_path: bytes
+    size: int
+
+
+class _TarBody:
+    """
+    A tar archive to be used as a request body. It consists of parts that
+    are either bytes, or the content of a local file.
+
+    Its size is known in advance, so it is sent with ``Content-Length``
+    instead of chunked encoding. Small parts are coalesced, so that the
+    archive is sent in few large writes. Iterating over the body yields the
+    archive in these writes. ``send_to()`` writes it to a socket, and lets
+    the kernel copy the content of larger files with ``sendfile()`` where
+    possible.
+    """
+
+    def __init__(self, parts: Sequence[bytes | _FileContent]) -> None:
+        self._parts = parts
+
+    def __len__(self) -> int:
+        return sum(
+            part.size if isinstance(part, _FileContent) else len(part)
+            for part in self._parts
+        )
+
+    @staticmethod
+    def _read_file(part: _FileContent, writer: _CoalescingWriter) -> t.Generator[None]:
+        size = part.size
+        with open(part.b_path, "rb") as f:
+            while size > 0:
+                # Top up the data collected by the writer first
+                buf = f.read(min(size, writer.free))
+                if not buf:
+                    break
+                size -= len(buf)
+                writer.write(buf)
+                yield
+        # If for some reason the file shrunk, fill up to the announced size with zeros.
+        # (If it enlarged, ignore the remainder.)
+        writer.write_zeros(size)
+
+    def __iter__(self) -> t.Iterator[bytes]:
+        chunks: list[bytes] = []
+        writer = _CoalescingWriter(chunks.append)
+        for part in self._parts:
+            if isinstance(part, _FileContent):
+                for dummy in self._read_file(part, writer):
+                    yield from chunks
+                    chunks.clear()
+            else:
+                writer.write(part)
+            yield from chunks
+            chunks.clear()
+        writer.flush()
+        yield from chunks
+
+    def send_to(self, sock: socket.socket) -> None:
+        writer = _CoalescingWriter(sock.sendall)
+        for part in self._parts:
+            if not isinstance(part, _FileContent):
+                writer.write(part)
+            elif part.size <= writer.free:
+                # Not worth the additional system calls
+                for dummy in self._read_file(part, writer):
+                    pass
+            else:
+                writer.flush()
+                with open(part.b_path, "rb") as f:
+                    sent = sock.sendfile(f, 0, part.size)
+                writer.write_zeros(part.size - sent)
+        writer.flush()
+
+
+def _regular_file_tar_body(
     b_in_path: bytes,
     file_stat: os.stat_result,
     out_file: str | bytes,
@@ -114,7 +254,7 @@ def _regular_file_tar_generator(
     group_id: int,
     mode: int | None = None,
     user_name: str | None = None,
-) -> t.Generator[bytes]:
+) -> _TarBody:
     if not stat.S_ISREG(file_stat.st_mode):
         raise DockerUnexpectedError("stat information is not for a regular file")
     tarinfo = tarfile.TarInfo()
@@ -132,47 +272,23 @@ def _regular_file_tar_generator(
         tarinfo.uname = user_name
 
     tarinfo_buf = tarinfo.tobuf()
-    total_size = len(tarinfo_buf)
-    yield tarinfo_buf
-
-    size = tarinfo.size
-    total_size += size
-    with open(b_in_path, "rb") as f:
-        while size > 0:
-            to_read = min(size, 65536)
-            buf = f.read(to_read)
-            if not buf:
-                break
-            size -= len(buf)
-            yield buf
-    if size:
-        # If for some reason the file shrunk, fill up to the announced size with zeros.
-        # (If it enlarged, ignore the remainder.)
-        yield tarfile.NUL * size
-
-    remainder = tarinfo.size % tarfile.BLOCKSIZE
-    if remainder:
-        # We need to write a multiple of 512 bytes. Fill up with zeros.
-        yield tarfile.NUL * (tarfile.BLOCKSIZE - remainder)
-        total_size += tarfile.BLOCKSIZE - remainder
-
-    # End with two zeroed blocks
-    yield tarfile.NUL * (2 * tarfile.BLOCKSIZE)
-    total_size += 2 * tarfile.BLOCKSIZE
-
-    remainder = total_size % tarfile.RECORDSIZE
-    if remainder > 0:
-        yield tarfile.NUL * (tarfile.RECORDSIZE - remainder)
+    return _TarBody(
+        [
+            tarinfo_buf,
+            _FileContent(b_in_path, tarinfo.size),
+            _tar_trailer(len(tarinfo_buf), tarinfo.size),
+        ]
+    )
 
 
-def _regular_content_tar_generator(
+def _regular_content_tar_body(
     content: bytes,
     out_file: str | bytes,
     user_id: int,
     group_id: int,
     mode: int,
     user_name: str | None = None,
-) -> t.Generator[bytes]:
+) -> _TarBody:
     tarinfo = tarfile.TarInfo()
     tarinfo.name = (
         os.path.splitdrive(to_text(out_file))[1].replace(os.sep, "/").lstrip("/")
@@ -188,53 +304,36 @@ def _regular_content_tar_generator(
         tarinfo.uname = user_name
 
     tarinfo_buf = tarinfo.tobuf()
-    total_size = len(tarinfo_buf)
-    yield tarinfo_buf
-
-    total_size += len(content)
-    yield content
-
-    remainder = tarinfo.size % tarfile.BLOCKSIZE
-    if remainder:
-        # We need to write a multiple of 512 bytes. Fill up with zeros.
-        yield tarfile.NUL * (tarfile.BLOCKSIZE - remainder)
-        total_size += tarfile.BLOCKSIZE - remainder
-
-    # End with two zeroed blocks
-    yield tarfile.NUL * (2 * tarfile.BLOCKSIZE)
-    total_size += 2 * tarfile.BLOCKSIZE
-
-    remainder = total_size % tarfile.RECORDSIZE
-    if remainder > 0:
-        yield tarfile.NUL * (tarfile.RECORDSIZE - remainder)
+    return _TarBody(
+        [tarinfo_buf, content, _tar_trailer(len(tarinfo_buf), len(content))]
+    )
 
 
-def put_file(
-    client: APIClient,
-    container: str,
+def create_file_tar_body(
     in_path: str,
-    out_path: str,
+    out_file: str,
     user_id: int,
     group_id: int,
     mode: int | None = None,
     user_name: str | None = None,
     follow_links: bool = False,
-) -> None:
-    """Transfer a file from local to Docker container."""
+) -> _TarBody:
+    """
+    Create the archive that ``put_file()`` uploads. It can be uploaded with
+    ``put_tar_body()``, also several times.
+    """
     if not os.path.exists(to_bytes(in_path, errors="surrogate_or_strict")):
         raise DockerFileNotFound(f"file or module does not exist: {to_text(in_path)}")
 
     b_in_path = to_bytes(in_path, errors="surrogate_or_strict")
 
-    out_dir, out_file = os.path.split(out_path)
-
     if follow_links:
         file_stat = os.stat(b_in_path)
     else:
         file_stat = os.lstat(b_in_path)
 
     if stat.S_ISREG(file_stat.st_mode):
-        stream = _regular_file_tar_generator(
+        return _regular_file_tar_body(
             b_in_path,
             file_stat,
             out_file,
@@ -243,8 +342,8 @@ def put_file(
             mode=mode,
             user_name=user_name,
         )
-    elif stat.S_ISLNK(file_stat.st_mode):
-        stream = _symlink_tar_generator(
+    if stat.S_ISLNK(file_stat.st_mode):
+        return _symlink_tar_body(
             b_in_path,
             file_stat,
             out_file,
@@ -253,19 +352,67 @@ def put_file(
             mode=mode,
             user_name=user_name,
         )
-    else:
-        file_part = " referenced by" if follow_links else ""
-        raise DockerFileCopyError(
-            f"File{file_part} {in_path} is neither a regular file nor a symlink (stat mode {oct(file_stat.st_mode)})."
-        )
+    file_part = " referenced by" if follow_links else ""
+    raise DockerFileCopyError(
+        f"File{file_part} {in_path} is neither a regular file nor a symlink (stat mode {oct(file_stat.st_mode)})."
+    )
+
+
+def create_content_tar_body(
+    content: bytes,
+    out_file: str,
+    user_id: int,
+    group_id: int,
+    mode: int,
+    user_name: str | None = None,
+) -> _TarBody:
+    """
+    Create the archive that ``put_file_content()`` uploads. It can be
+    uploaded with ``put_tar_body()``, also several times.
+    """
+    return _regular_content_tar_body(
+        content, out_file, user_id, group_id, mode, user_name=user_name
+    )
+
 
-    ok = _put_archive(client, container, out_dir, stream)
+def put_tar_body(
+    client: APIClient, container: str, out_path: str, body: _TarBody
+) -> None:
+    """
+    Upload an archive created for the file name ``os.path.basename(out_path)``
+    to the directory of ``out_path``.
+    """
+    ok = _put_archive(client, container, os.path.dirname(out_path), body)
     if not ok:
         raise DockerUnexpectedError(
             f'Unknown error while creating file "{out_path}" in container "{container}".'
         )
 
 
+def put_file(
+    client: APIClient,
+    container: str,
+    in_path: str,
+    out_path: str,
+    user_id: int,
+    group_id: int,
+    mode: int | None = None,
+    user_name: str | None = None,
+    follow_links: bool = False,
+) -> None:
+    """Transfer a file from local to Docker container."""
+    body = create_file_tar_body(
+        in_path,
+        os.path.basename(out_path),
+        user_id,
+        group_id,
+        mode=mode,
+        user_name=user_name,
+        follow_links=follow_links,
+    )
+    put_tar_body(client, container, out_path, body)
+
+
 def put_file_content(
     client: APIClient,
     container: str,
@@ -277,17 +424,33 @@ def put_file_content(
     user_name: str | None = None,
 ) -> None:
     """Transfer a file from local to Docker container."""
-    out_dir, out_file = os.path.split(out_path)
-
-    stream = _regular_content_tar_generator(
-        content, out_file, user_id, group_id, mode, user_name=user_name
+    body = create_content_tar_body(
+        content,
+        os.path.basename(out_path),
+        user_id,
+        group_id,
+        mode,
+        user_name=user_name,
     )
+    put_tar_body(client, container, out_path, body)
 
-    ok = _put_archive(client, container, out_dir, stream)
-    if not ok:
+
+def _parse_stat_header(
+    container: str, in_path: str, header: str | None
+) -> dict[str, t.Any]:
+    try:
+        if header is None:
+            raise ValueError("x-docker-container-path-stat header not present")
+        return json.loads(base64.b64decode(header))
+    except Exception as exc:
         raise DockerUnexpectedError(
-            f'Unknown error while creating file "{out_path}" in container "{container}".'
-        )
+            f"When retrieving information for {in_path} from {container}, obtained header {header!r} that cannot be loaded as JSON: {exc}"
+        ) from exc
+
+
+def _is_symlink_stat(stat_data: dict[str, t.Any]) -> bool:
+    # https://pkg.go.dev/io/fs#FileMode: bit 32 - 5 means ModeSymlink
+    return stat_data["mode"] & (1 << (32 - 5)) != 0
 
 
 def stat_file(
@@ -327,18 +490,11 @@ def stat_file(
         if response.status_code == 404:
             return in_path, None, None
         client._raise_for_status(response)
-        header = response.headers.get("x-docker-container-path-stat")
-        try:
-            if header is None:
-                raise ValueError("x-docker-container-path-stat header not present")
-            stat_data = json.loads(base64.b64decode(header))
-        except Exception as exc:
-            raise DockerUnexpectedError(
-                f"When retrieving information for {in_path} from {container}, obtained header {header!r} that cannot be loaded as JSON: {exc}"
-            ) from exc
-
-        # https://pkg.go.dev/io/fs#FileMode: bit 32 - 5 means ModeSymlink
-        if stat_data["mode"] & (1 << (32 - 5)) != 0:
+        stat_data = _parse_stat_header(
+            container, in_path, response.headers.get("x-docker-container-path-stat")
+        )
+
+        if _is_symlink_stat(stat_data):
             link_target = stat_data["linkTarget"]
             if not follow_links:
                 return in_path, stat_data, link_target
@@ -349,41 +505,57 @@ def stat_file(
 
 
 class _RawGeneratorFileobj(io.RawIOBase):
-    def __init__(self, stream: t.Generator[bytes]):
+    def __init__(self, stream: t.Iterator[bytes]):
         self._stream = stream
-        self._buf = b""
+        # The current chunk and how much of it has been read. Slicing the
+        # memoryview does not copy the rest of the chunk.
+        self._chunk = memoryview(b"")
+        self._offset = 0
 
     def readable(self) -> bool:
         return True
 
-    def _readinto_from_buf(self, b: WriteableBuffer, index: int, length: int) -> int:
-        cpy = min(length - index, len(self._buf))
-        if cpy:
-            b[index : index + cpy] = self._buf[:cpy]  # type: ignore # TODO!
-            self._buf = self._buf[cpy:]
-            index += cpy
-        return index
-
     def readinto(self, b: WriteableBuffer) -> int:
-        index = 0
-        length = len(b)  # type: ignore # TODO!
+        view = memoryview(b).cast("B")
+        while self._offset >= len(self._chunk):
+            try:
+                self._chunk = memoryview(next(self._stream)).cast("B")
+            except StopIteration:
+                return 0
+            self._offset = 0
+        size = min(len(view), len(self._chunk) - self._offset)
+        view[:size] = self._chunk[self._offset : self._offset + size]
+        self._offset += size
+        return size
+
+
+def _stream_generator_to_fileobj(stream: t.Iterator[bytes]) -> io.BufferedReader:
+    """Given a generator that generates chunks of bytes, create a readable buffered stream."""
+    raw = _RawGeneratorFileobj(stream)
+    return io.BufferedReader(raw)
 
-        index = self._readinto_from_buf(b, index, length)
-        if index == length:
-            return index
 
-        try:
-            self._buf += next(self._stream)
-        except StopIteration:
-            return index
+_FETCH_BUFFER_SIZE = 65536
 
-        return self._readinto_from_buf(b, index, length)
 
+class _RawResponseFileobj(io.RawIOBase):
+    """
+    Reads the body of a streamed response directly into the caller's buffer,
+    without splitting it into chunks first.
+    """
 
-def _stream_generator_to_fileobj(stream: t.Generator[bytes]) -> io.BufferedReader:
-    """Given a generator that generates chunks of bytes, create a readable buffered stream."""
-    raw = _RawGeneratorFileobj(stream)
-    return io.BufferedReader(raw)
+    def __init__(self, response: Response) -> None:
+        self._raw = response.raw
+        self._api_call = getattr(response, "_api_call", None)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: WriteableBuffer) -> int:
+        size = self._raw.readinto(b) or 0
+        if self._api_call is not None:
+            self._api_call.add_response_bytes(size)
+        return size
 
 
 _T = t.TypeVar("_T")
@@ -400,20 +572,25 @@ def fetch_file_ex(
     follow_links: bool = False,
     log: Callable[[str], None] | None = None,
 ) -> _T:
-    """Fetch a file (as a tar file entry) from a Docker container to local."""
-    considered_in_paths: set[str] = set()
+    """Fetch a file (as a tar file entry) from a Docker container to local.
+
+    If ``follow_links=True``, symbolic links are recognized by the stat data
+    the daemon sends along with every archive, like for ``stat_file()``, so
+    that only the archive of the final target is parsed.
+    """
+    # The link targets found so far
+    link_targets: dict[str, str] = {}
 
     while True:
-        if in_path in considered_in_paths:
+        if in_path in link_targets:
             raise DockerFileCopyError(
                 f'Found infinite symbolic link loop when trying to fetch "{in_path}"'
             )
-        considered_in_paths.add(in_path)
 
         if log:
             log(f'FETCH: Fetching "{in_path}"')
         try:
-            stream = client.get_raw_stream(
+            response = client.get_raw_response(
                 "/containers/{0}/archive",
                 container,
                 params={"path": in_path},
@@ -422,9 +599,26 @@ def fetch_file_ex(
         except NotFound:
             return process_none(in_path)
 
-        with tarfile.open(
-            fileobj=_stream_generator_to_fileobj(stream), mode="r|"
-        ) as tar:
+        header = response.headers.get("x-docker-container-path-stat")
+        if follow_links and header is not None:
+            stat_data = _parse_stat_header(container, in_path, header)
+            if _is_symlink_stat(stat_data):
+                # The archive only contains the symbolic link. Read it
+                # without parsing, so that the connection can be re-used.
+                with response:
+                    response.content  # noqa: B018, pylint: disable=pointless-statement
+                link_targets[in_path] = stat_data["linkTarget"]
+                in_path = os.path.join(os.path.split(in_path)[0], link_targets[in_path])
+                if log:
+                    log(f'FETCH: Following symbolic link to "{in_path}"')
+                continue
+
+        # tarfile reads 10 KiB at a time; reading larger blocks from the
+        # response avoids much of the per-read overhead of urllib3
+        fileobj = io.BufferedReader(
+            _RawResponseFileobj(response), buffer_size=_FETCH_BUFFER_SIZE
+        )
+        with response, tarfile.open(fileobj=fileobj, mode="r|") as tar:
             symlink_member: tarfile.TarInfo | None = None
             result: _T | None = None
             found = False
@@ -444,6 +638,8 @@ def fetch_file_ex(
             if symlink_member:
                 if not follow_links:
                     return process_symlink(in_path, symlink_member)
+                # In case the daemon did not send the stat data
+                link_targets[in_path] = symlink_member.linkname
                 in_path = os.path.join(
                     os.path.split(in_path)[0], symlink_member.linkname
                 )
@@ -568,6 +764,46 @@ def _execute_command(
     return rc, stdout, stderr
 
 
+# Prints the owner's user and group ID, and the SHA-256 checksum of the file
+# "$1". Uses BusyBox if the container has no sha256sum on the PATH.
+_CHECKSUM_SCRIPT = (
+    "if command -v sha256sum >/dev/null 2>&1; then b=; else b=busybox; fi; "
+    '$b stat -c "%u %g" -- "$1" && $b sha256sum -- "$1"'
+)
+
+
+def get_file_checksum(
+    client: APIClient,
+    container: str,
+    path: str,
+    log: Callable[[str], None] | None = None,
+) -> tuple[int, int, str] | None:
+    """
+    Compute the SHA-256 checksum of the file ``path`` in the container.
+    Returns the user ID, group ID, and the hex digest of the file, or
+    ``None`` if it cannot be determined this way, for example because the
+    container is not running or has no shell.
+    """
+    try:
+        rc, stdout, dummy_stderr = _execute_command(
+            client, container, ["/bin/sh", "-c", _CHECKSUM_SCRIPT, "sh", path], log=log
+        )
+    except (DockerFileCopyError, APIError):
+        return None
+    lines = stdout.splitlines()
+    if rc != 0 or len(lines) != 2:
+        return None
+    ids = lines[0].split()
+    checksum = to_text(lines[1].split(b" ", 1)[0]).lower()
+    if len(ids) != 2 or len(checksum) != 64:
+        return None
+    try:
+        int(checksum, 16)
+        return int(ids[0]), int(ids[1]), checksum
+    except ValueError:
+        return None
+
+
 def determine_user_group(
     client: APIClient, container: str, log: Callable[[str], None] | None = None
 ) -> tuple[int, int]:
@@ -588,3 +824,274 @@ def determine_user_group(
         raise DockerUnexpectedError(
             f"Expected two-line output with numeric IDs to obtain user and group ID for container {container}, but got {user_id!r} and {group_id!r} instead"
         ) from exc
+
+
+class TreeEntry(t.NamedTuple):
+    """
+    A filesystem object in a directory tree. ``mode`` is the full mode
+    including the file type, ``mtime`` is in whole seconds. ``link_target``
+    is only set for symbolic links, and ``checksum`` (the hex SHA-256 digest)
+    only for regular files, and only if it was requested.
+    """
+
+    mode: int
+    uid: int
+    gid: int
+    size: int
+    mtime: int
+    link_target: str | None = None
+    checksum: str | None = None
+
+
+# Lists the tree below "$1" in three sections separated by NUL bytes: one line
+# of stat information per object, the NUL-separated names and targets of all
+# symbolic links, and the checksums of all regular files if "$2" is 1. Paths
+# containing newlines cannot be parsed and are missing from the result.
+_TREE_MANIFEST_SCRIPT = r"""
+if command -v sha256sum >/dev/null 2>&1; then b=; else b=busybox; fi
+cd -- "$1" || exit 1
+$b find . -exec $b stat -c '%f %u %g %s %Y %n' -- {} + || exit 1
+printf '\0'
+$b find . -type l -exec /bin/sh -c 'for l; do printf "%s\0%s\0" "$l" "$($0 readlink -- "$l")"; done' "$b" {} + || exit 1
+printf '\0'
+if [ "$2" = 1 ]; then
+  $b find . -type f -exec $b sha256sum -- {} + || exit 1
+fi
+"""
+
+
+def _manifest_path(name: bytes) -> str | None:
+    if name == b".":
+        return ""
+    if not name.startswith(b"./"):
+        return None
+    return to_text(name[2:], errors="surrogate_or_strict")
+
+
+def _parse_tree_manifest(stdout: bytes, checksums: bool) -> dict[str, TreeEntry]:
+    stat_section, dummy, rest = stdout.partition(b"\0")
+    tokens = rest.split(b"\0")
+    links = dict(zip(tokens[:-2:2], tokens[1:-2:2]))
+    hashes: dict[bytes, str] = {}
+    for line in tokens[-1].splitlines() if checksums else []:
+        # sha256sum escapes file names with special characters and marks them with a backslash
+        digest, sep, name = line.partition(b"  ")
+        if sep and not digest.startswith(b"\\"):
+            hashes[name] = to_text(digest).lower()
+
+    result: dict[str, TreeEntry] = {}
+    for line in stat_section.splitlines():
+        fields = line.split(b" ", 5)
+        if len(fields) != 6:
+            continue
+        path = _manifest_path(fields[5])
+        if path is None:
+            continue
+        try:
+            mode = int(fields[0], 16)
+            uid, gid, size, mtime = (int(field) for field in fields[1:5])
+        except ValueError:
+            continue
+        link_target = None
+        checksum = None
+        if stat.S_ISLNK(mode):
+            if fields[5] not in links:
+                continue
+            link_target = to_text(links[fields[5]], errors="surrogate_or_strict")
+        elif stat.S_ISREG(mode) and checksums:
+            if fields[5] not in hashes:
+                continue
+            checksum = hashes[fields[5]]
+        result[path] = TreeEntry(mode, uid, gid, size, mtime, link_target, checksum)
+    return result
+
+
+def get_tree_manifest(
+    client: APIClient,
+    container: str,
+    path: str,
+    checksums: bool = False,
+    log: Callable[[str], None] | None = None,
+) -> dict[str, TreeEntry] | None:
+    """
+    List the directory tree ``path`` in the container with one command.
+    Returns a dictionary mapping paths relative to ``path`` (with ``""`` for
+    ``path`` itself) to their entries, or ``None`` if the command cannot be
+    run, for example because the container is not running or has no shell.
+    """
+    try:
+        rc, stdout, dummy_stderr = _execute_command(
+            client,
+            container,
+            [
+                "/bin/sh",
+                "-c",
+                _TREE_MANIFEST_SCRIPT,
+                "sh",
+                path,
+                "1" if checksums else "0",
+            ],
+            log=log,
+        )
+    except (DockerFileCopyError, APIError):
+        return None
+    if rc != 0:
+        return None
+    return _parse_tree_manifest(stdout, checksums)
+
+
+def fetch_tree_manifest(
+    client: APIClient,
+    container: str,
+    path: str,
+    log: Callable[[str], None] | None = None,
+) -> dict[str, TreeEntry]:
+    """
+    Like ``get_tree_manifest()``, but downloads the tree as an archive instead
+    of running a command in the container. Checksums are always computed.
+    """
+    if log:
+        log(f'FETCH: Fetching tree "{path}"')
+    try:
+        response = client.get_raw_response(
+            "/containers/{0}/archive",
+            container,
+            params={"path": path},
+            headers={"Accept-Encoding": "identity"},
+        )
+    except NotFound:
+        return {}
+
+    result: dict[str, TreeEntry] = {}
+    fileobj = io.BufferedReader(
+        _RawResponseFileobj(response), buffer_size=_FETCH_BUFFER_SIZE
+    )
+    with response, tarfile.open(fileobj=fileobj, mode="r|") as tar:
+        for member in tar:
+            # The members are named relative to the parent directory of path
+            dummy, dummy2, name = member.name.partition("/")
+            link_target = None
+            checksum = None
+            if member.isdir():
+                mode = stat.S_IFDIR
+            elif member.issym():
+                mode = stat.S_IFLNK
+                link_target = member.linkname
+            elif member.isfile():
+                mode = stat.S_IFREG
+                digest = hashlib.sha256()
+                reader = tar.extractfile(member)
+                if reader:
+                    with reader:
+                        while True:
+                            block = reader.read(_FETCH_BUFFER_SIZE)
+                            if not block:
+                                break
+                            digest.update(block)
+                checksum = digest.hexdigest()
+            else:
+                # Never equal to a local file, directory, or symbolic link
+                mode = 0
+            result[name] = TreeEntry(
+                mode | member.mode,
+                member.uid,
+                member.gid,
+                member.size,
+                int(member.mtime),
+                link_target,
+                checksum,
+            )
+    return result
+
+
+def put_tree(
+    client: APIClient,
+    container: str,
+    in_path: str,
+    out_path: str,
+    paths: Sequence[str],
+    user_id: int,
+    group_id: int,
+    mode: int | None = None,
+    follow_links: bool = False,
+) -> None:
+    """
+    Transfer the given paths of the local directory tree ``in_path`` to the
+    directory ``out_path`` in the container, in a single archive.
+
+    ``paths`` are relative to ``in_path``, with ``""`` for ``in_path`` itself,
+    and must list directories before their contents. ``mode`` applies to
+    regular files only; directories and files without ``mode`` keep their
+    local permissions.
+    """
+    out_dir, out_name = os.path.split(out_path)
+    parts: list[bytes | _FileContent] = []
+    total_size = 0
+    for path in paths:
+        b_path = to_bytes(os.path.join(in_path, path), errors="surrogate_or_strict")
+        file_stat = os.stat(b_path) if follow_links else os.lstat(b_path)
+        tarinfo = tarfile.TarInfo(f"{out_name}/{path}" if path else out_name)
+        tarinfo.mode = stat.S_IMODE(file_stat.st_mode)
+        tarinfo.uid = user_id
+        tarinfo.gid = group_id
+        tarinfo.mtime = int(file_stat.st_mtime)
+        if stat.S_ISDIR(file_stat.st_mode):
+            tarinfo.type = tarfile.DIRTYPE
+        elif stat.S_ISLNK(file_stat.st_mode):
+            tarinfo.type = tarfile.SYMTYPE
+            tarinfo.linkname = to_text(
+                os.readlink(b_path), errors="surrogate_or_strict"
+            )
+        elif stat.S_ISREG(file_stat.st_mode):
+            tarinfo.type = tarfile.REGTYPE
+            tarinfo.size = file_stat.st_size
+            if mode is not None:
+                tarinfo.mode = mode
+        else:
+            raise DockerFileCopyError(
+                f"File {to_text(b_path)} is neither a directory, a regular file, nor a symlink (stat mode {oct(file_stat.st_mode)})."
+            )
+        tarinfo_buf = tarinfo.tobuf()
+        parts.append(tarinfo_buf)
+        if tarinfo.size:
+            parts.append(_FileContent(b_path, tarinfo.size))
+            parts.append(tarfile.NUL * (-tarinfo.size % tarfile.BLOCKSIZE))
+        total_size += (
+            len(tarinfo_buf) + tarinfo.size + (-tarinfo.size % tarfile.BLOCKSIZE)
+        )
+    total_size += 2 * tarfile.BLOCKSIZE
+    parts.append(
+        tarfile.NUL * (2 * tarfile.BLOCKSIZE + -total_size % tarfile.RECORDSIZE)
+    )
+
+    ok = _put_archive(client, container, out_dir, _TarBody(parts))
+    if not ok:
+        raise DockerUnexpectedError(
+            f'Unknown error while creating files in "{out_path}" in container "{container}".'
+        )
+
+
+# Upper bound for the length of the paths passed to a single rm command
+_MAX_REMOVE_ARGS_SIZE = 65536
+
+
+def remove_paths(
+    client: APIClient,
+    container: str,
+    paths: Sequence[str],
+    log: Callable[[str], None] | None = None,
+) -> None:
+    """Recursively remove the given absolute paths in the container."""
+    index = 0
+    while index < len(paths):
+        batch: list[str] = []
+        size = 0
+        while index < len(paths) and (
+            not batch or size + len(paths[index]) <= _MAX_REMOVE_ARGS_SIZE
+        ):
+            batch.append(paths[index])
+            size += len(paths[index]) + 1
+            index += 1
+        _execute_command(
+            client, container, ["rm", "-rf", "--", *batch], check_rc=True, log=log
+        )
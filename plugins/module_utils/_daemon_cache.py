@@ -0,0 +1,223 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# Note that this module util is **PRIVATE** to the collection. It can have breaking changes at any time.
+# Do not use this from other collections or standalone plugins/modules!
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+import typing as t
+
+from ansible.module_utils.parsing.convert_bool import BOOLEANS_TRUE
+
+from ansible_collections.community.docker.plugins.module_utils._api.tls import (
+    TLSConfig,
+)
+
+CACHE_ENV_VAR = "ANSIBLE_DOCKER_METADATA_CACHE"
+CACHE_TTL_ENV_VAR = "ANSIBLE_DOCKER_METADATA_CACHE_TTL"
+CACHE_DIR_ENV_VAR = "ANSIBLE_DOCKER_METADATA_CACHE_DIR"
+
+DEFAULT_CACHE_TTL = 600
+
+_CACHE_FORMAT = 1
+
+
+def is_cache_enabled() -> bool:
+    return os.environ.get(CACHE_ENV_VAR, "").lower() in BOOLEANS_TRUE
+
+
+def get_cache_dir() -> str:
+    cache_dir = os.environ.get(CACHE_DIR_ENV_VAR)
+    if cache_dir:
+        return os.path.expanduser(cache_dir)
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "ansible-community-docker", "daemon")
+
+
+def get_cache_ttl() -> int:
+    try:
+        return int(os.environ.get(CACHE_TTL_ENV_VAR, DEFAULT_CACHE_TTL))
+    except ValueError:
+        return DEFAULT_CACHE_TTL
+
+
+def read_cache_file(path: str) -> t.Any | None:
+    """
+    Read a JSON cache file. Returns ``None`` if it does not exist or cannot
+    be parsed.
+    """
+    try:
+        with open(path, "rb") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_cache_file(path: str, data: t.Any) -> None:
+    """
+    Atomically replace a JSON cache file, so that concurrent readers in other
+    processes never see a partially written file. Errors are ignored.
+    """
+    cache_dir = os.path.dirname(path)
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        # The cache is an optimization; if it cannot be written, the
+        # data will simply be fetched again next time
+        pass
+
+
+def _file_identity(path: str | None) -> list[t.Any] | None:
+    if not path:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return [path]
+    return [path, stat.st_ino, stat.st_mtime_ns]
+
+
+def _tls_identity(tls: bool | TLSConfig | None) -> list[t.Any] | bool | None:
+    if not isinstance(tls, TLSConfig):
+        return bool(tls)
+    cert = tls.cert
+    return [
+        tls.verify,
+        tls.assert_hostname,
+        _file_identity(tls.ca_cert),
+        _file_identity(cert[0] if cert else None),
+        _file_identity(cert[1] if cert else None),
+    ]
+
+
+def get_daemon_fingerprint(base_url: str) -> list[t.Any] | None:
+    """
+    Return something that changes when the daemon restarts, if that can be
+    determined without talking to the daemon.
+
+    For Unix sockets this is the identity of the socket file, which the daemon
+    re-creates on every start. For other connections ``None`` is returned.
+    """
+    for prefix in ("http+unix://", "unix://"):
+        if base_url.startswith(prefix):
+            path = base_url[len(prefix) :]
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return None
+            return [stat.st_ino, stat.st_ctime_ns]
+    return None
+
+
+class DaemonMetadataCache:
+    """
+    File-based cache for daemon metadata that rarely changes, like the result
+    of ``GET /version`` and the static parts of ``GET /info``.
+
+    Entries are stored per connection (``base_url`` plus TLS identity) in the
+    current user's cache directory. An entry is discarded once it is older
+    than the TTL, once the daemon's Unix socket has been re-created (which
+    happens on every daemon start), or once a fresh ``/info`` result reports
+    a different daemon ID or daemon version than the cached one.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        tls: bool | TLSConfig | None = None,
+        use_ssh_client: bool = False,
+        cache_dir: str | None = None,
+        ttl: int | None = None,
+    ) -> None:
+        self.base_url = base_url
+        self.cache_dir = cache_dir or get_cache_dir()
+        self.ttl = get_cache_ttl() if ttl is None else ttl
+        key = json.dumps([base_url, _tls_identity(tls), use_ssh_client], sort_keys=True)
+        self.path = os.path.join(
+            self.cache_dir, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json"
+        )
+        self._fingerprint = get_daemon_fingerprint(base_url)
+        self._data = self._load()
+
+    def _load(self) -> dict[str, t.Any]:
+        data = read_cache_file(self.path)
+        if (
+            not isinstance(data, dict)
+            or data.get("format") != _CACHE_FORMAT
+            or data.get("base_url") != self.base_url
+            or data.get("fingerprint") != self._fingerprint
+            or not isinstance(data.get("entries"), dict)
+        ):
+            return {}
+        return data["entries"]
+
+    def _store(self) -> None:
+        write_cache_file(
+            self.path,
+            {
+                "format": _CACHE_FORMAT,
+                "base_url": self.base_url,
+                "fingerprint": self._fingerprint,
+                "entries": self._data,
+            },
+        )
+
+    def get(self, name: str) -> t.Any | None:
+        entry = self._data.get(name)
+        if (
+            not isinstance(entry, dict)
+            or not isinstance(entry.get("time"), (int, float))
+            or not 0 <= time.time() - entry["time"] <= self.ttl
+        ):
+            return None
+        return entry.get("value")
+
+    def set(self, name: str, value: t.Any) -> None:
+        if name == "info" and isinstance(value, dict):
+            old_info = (self._data.get("info") or {}).get("value")
+            if isinstance(old_info, dict) and _daemon_identity(
+                old_info
+            ) != _daemon_identity(value):
+                # Different daemon, or the daemon was restarted with a new
+                # version: everything else we know about it might be
+                # outdated as well
+                self._data = {}
+        self._data[name] = {"time": time.time(), "value": value}
+        self._store()
+
+    def invalidate(self) -> None:
+        self._data = {}
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+
+def _daemon_identity(info: dict[str, t.Any]) -> list[t.Any]:
+    # The daemon does not report its start time directly. Its version and the
+    # versions of its runtime components change whenever it is upgraded and
+    # restarted, which are the cases that matter for the cached data.
+    return [
+        info.get("ID"),
+        info.get("ServerVersion"),
+        (info.get("ContainerdCommit") or {}).get("ID"),
+        (info.get("RuncCommit") or {}).get("ID"),
+        info.get("KernelVersion"),
+    ]
@@ -194,7 +194,7 @@ class DockerAPIEngineDriver(EngineDriver[AnsibleDockerClient]):
         return client.module, active_options, client
 
     def get_host_info(self, client: AnsibleDockerClient) -> dict[str, t.Any]:
-        return client.info()
+        return client.cached_info()
 
     def get_api_version(self, client: AnsibleDockerClient) -> LooseVersion:
         return client.docker_api_version
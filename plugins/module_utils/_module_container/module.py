@@ -1346,6 +1346,6 @@ def run_module(engine_driver: EngineDriver) -> None:
     def execute() -> t.NoReturn:
         cm = ContainerManager(module, engine_driver, client, active_options)
         cm.run()
-        module.exit_json(**sanitize_result(cm.results))
+        module.exit_json(**sanitize_result(client.add_api_stats(cm.results)))
 
     engine_driver.run(execute, client)
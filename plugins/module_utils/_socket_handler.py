@@ -7,11 +7,13 @@
 
 from __future__ import annotations
 
+import io
 import os
 import os.path
 import selectors
 import socket as pysocket
 import struct
+import threading
 import typing as t
 
 from ansible_collections.community.docker.plugins.module_utils._api.utils import (
@@ -33,14 +35,102 @@ if t.TYPE_CHECKING:
         SocketLike,
     )
 
-
-PARAMIKO_POLL_TIMEOUT = 0.01  # 10 milliseconds
+    class BinaryWriter(t.Protocol):
+        def write(self, data: bytes, /) -> object: ...
 
 
 def _empty_writer(msg: str) -> None:
     pass
 
 
+def _is_paramiko_channel(sock: SocketLike) -> bool:
+    return hasattr(sock, "send_ready") and "paramiko" in str(type(sock))
+
+
+class _ChannelWriter:
+    """
+    Writes to a paramiko channel from a background thread.
+
+    When the SSH transport is used, Docker SDK for Python internally uses
+    Paramiko, whose Channel object supports select(), but only for reading
+    (https://github.com/paramiko/paramiko/issues/695). Instead of polling the
+    channel, the thread does blocking writes, and wakes up ``select()`` through
+    a pipe if writing failed.
+    """
+
+    def __init__(self, channel: SocketLike, log: Callable[[str], None]) -> None:
+        self._channel = channel
+        self._log = log
+        self._condition = threading.Condition()
+        self._buffer = bytearray()
+        self._end_of_writing = False
+        self._closed = False
+        self._error: BaseException | None = None
+        self.wakeup_fd, self._wakeup_write_fd = os.pipe()
+        os.set_blocking(self.wakeup_fd, False)
+        # The channel is only read from once its fileno() signals that data
+        # is available, so blocking mode only affects the writes
+        channel.settimeout(None)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            while True:
+                with self._condition:
+                    while not self._buffer and not self._end_of_writing:
+                        if self._closed:
+                            return
+                        self._condition.wait()
+                    if self._closed:
+                        return
+                    data = bytes(self._buffer)
+                    self._buffer.clear()
+                if not data:
+                    self._log("Shutting socket down for writing")
+                    shutdown_writing(self._channel, self._log)
+                    return
+                self._channel.sendall(data)
+                self._log(f"wrote {len(data)} bytes")
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            with self._condition:
+                self._error = exc
+                if not self._closed:
+                    os.write(self._wakeup_write_fd, b"\0")
+
+    def check(self) -> None:
+        """
+        Raise the exception writing failed with, if it failed.
+        """
+        try:
+            os.read(self.wakeup_fd, 1)
+        except BlockingIOError:
+            pass
+        with self._condition:
+            if self._error is not None:
+                raise self._error
+
+    def write(self, data: bytes) -> None:
+        self.check()
+        with self._condition:
+            self._buffer += data
+            self._condition.notify()
+
+    def end_of_writing(self) -> None:
+        with self._condition:
+            self._end_of_writing = True
+            self._condition.notify()
+
+    def close(self) -> None:
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+            os.close(self.wakeup_fd)
+            os.close(self._wakeup_write_fd)
+
+
 class DockerSocketHandlerBase:
     def __init__(
         self, sock: SocketLike, log: Callable[[str], None] | None = None
@@ -48,25 +138,29 @@ class DockerSocketHandlerBase:
         make_unblocking(sock)
 
         self._log = log or _empty_writer
-        self._paramiko_read_workaround = hasattr(
-            sock, "send_ready"
-        ) and "paramiko" in str(type(sock))
 
         self._sock = sock
         self._block_done_callback: Callable[[int, bytes], None] | None = None
         self._block_buffer: list[tuple[int, bytes]] = []
         self._eof = False
-        self._read_buffer = b""
-        self._write_buffer = b""
+        self._read_buffer = bytearray()
+        self._write_buffer = bytearray()
         self._end_of_writing = False
 
         self._current_stream: int | None = None
         self._current_missing = 0
-        self._current_buffer = b""
+        self._current_buffer = bytearray()
 
         self._selector = selectors.DefaultSelector()
         self._selector.register(self._sock, selectors.EVENT_READ)
 
+        self._channel_writer: _ChannelWriter | None = None
+        if _is_paramiko_channel(sock):
+            self._channel_writer = _ChannelWriter(sock, self._log)
+            self._selector.register(
+                self._channel_writer.wakeup_fd, selectors.EVENT_READ
+            )
+
     def __enter__(self) -> t.Self:
         return self
 
@@ -76,15 +170,20 @@ class DockerSocketHandlerBase:
         value: BaseException | None,
         tb: TracebackType | None,
     ) -> None:
+        self.close()
+
+    def close(self) -> None:
         self._selector.close()
+        if self._channel_writer is not None:
+            self._channel_writer.close()
 
     def set_block_done_callback(
         self, block_done_callback: Callable[[int, bytes], None]
     ) -> None:
         self._block_done_callback = block_done_callback
         if self._block_done_callback is not None:
-            while self._block_buffer:
-                elt = self._block_buffer.pop(0)
+            block_buffer, self._block_buffer = self._block_buffer, []
+            for elt in block_buffer:
                 self._block_done_callback(*elt)
 
     def _add_block(self, stream_id: int, data: bytes) -> None:
@@ -120,27 +219,47 @@ class DockerSocketHandlerBase:
             # Stream EOF
             self._eof = True
             return
-        self._read_buffer += data
-        while len(self._read_buffer) > 0:
-            if self._current_missing > 0:
-                n = min(len(self._read_buffer), self._current_missing)
-                self._current_buffer += self._read_buffer[:n]
-                self._read_buffer = self._read_buffer[n:]
-                self._current_missing -= n
-                if self._current_missing == 0:
-                    assert self._current_stream is not None
-                    self._add_block(self._current_stream, self._current_buffer)
-                    self._current_buffer = b""
+        self._parse_frames(data)
+
+    def _parse_frames(self, data: bytes) -> None:
+        # The frames are parsed in place with an offset into the data that was
+        # read. Only an incomplete frame header is kept in the read buffer, and
+        # only a block that is split over several reads in the current buffer.
+        size = len(data)
+        offset = 0
+        if self._read_buffer:
+            offset = min(8 - len(self._read_buffer), size)
+            self._read_buffer += data[:offset]
             if len(self._read_buffer) < 8:
-                break
+                return
             self._current_stream, self._current_missing = struct.unpack(
-                ">BxxxL", self._read_buffer[:8]
+                ">BxxxL", self._read_buffer
             )
-            self._read_buffer = self._read_buffer[8:]
-            if self._current_missing < 0:
-                # Stream EOF (as reported by docker daemon)
-                self._eof = True
-                break
+            self._read_buffer.clear()
+        with memoryview(data) as view:
+            while offset < size:
+                if self._current_missing > 0:
+                    n = min(size - offset, self._current_missing)
+                    self._current_missing -= n
+                    if self._current_missing > 0 or self._current_buffer:
+                        self._current_buffer += view[offset : offset + n]
+                        block = None
+                    else:
+                        block = bytes(view[offset : offset + n])
+                    offset += n
+                    if self._current_missing == 0:
+                        assert self._current_stream is not None
+                        if block is None:
+                            block = bytes(self._current_buffer)
+                            self._current_buffer.clear()
+                        self._add_block(self._current_stream, block)
+                if size - offset < 8:
+                    break
+                self._current_stream, self._current_missing = struct.unpack_from(
+                    ">BxxxL", data, offset
+                )
+                offset += 8
+        self._read_buffer += data[offset:]
 
     def _handle_end_of_writing(self) -> None:
         if self._end_of_writing and len(self._write_buffer) == 0:
@@ -151,7 +270,7 @@ class DockerSocketHandlerBase:
     def _write(self) -> None:
         if len(self._write_buffer) > 0:
             written = write_to_socket(self._sock, self._write_buffer)
-            self._write_buffer = self._write_buffer[written:]
+            del self._write_buffer[:written]
             self._log(f"wrote {written} bytes, {len(self._write_buffer)} are left")
             if len(self._write_buffer) > 0:
                 self._selector.modify(
@@ -161,31 +280,7 @@ class DockerSocketHandlerBase:
                 self._selector.modify(self._sock, selectors.EVENT_READ)
             self._handle_end_of_writing()
 
-    def select(
-        self, timeout: int | float | None = None, _internal_recursion: bool = False
-    ) -> bool:
-        if (
-            not _internal_recursion
-            and self._paramiko_read_workaround
-            and len(self._write_buffer) > 0
-        ):
-            # When the SSH transport is used, Docker SDK for Python internally uses Paramiko, whose
-            # Channel object supports select(), but only for reading
-            # (https://github.com/paramiko/paramiko/issues/695).
-            if self._sock.send_ready():  # type: ignore
-                self._write()
-                return True
-            while timeout is None or timeout > PARAMIKO_POLL_TIMEOUT:
-                result = int(
-                    self.select(PARAMIKO_POLL_TIMEOUT, _internal_recursion=True)
-                )
-                if self._sock.send_ready():  # type: ignore
-                    self._read()
-                    result += 1
-                if result > 0:
-                    return True
-                if timeout is not None:
-                    timeout -= PARAMIKO_POLL_TIMEOUT
+    def select(self, timeout: int | float | None = None) -> bool:
         self._log(f"select... ({timeout})")
         events = self._selector.select(timeout)
         for key, event in events:
@@ -197,39 +292,51 @@ class DockerSocketHandlerBase:
                     self._read()
                 if event & selectors.EVENT_WRITE != 0:
                     self._write()
-        result = len(events)
-        if self._paramiko_read_workaround and len(self._write_buffer) > 0 and self._sock.send_ready():  # type: ignore
-            self._write()
-            result += 1
-        return result > 0
+            elif self._channel_writer is not None:
+                self._channel_writer.check()
+        return len(events) > 0
 
     def is_eof(self) -> bool:
         return self._eof
 
     def end_of_writing(self) -> None:
+        if self._channel_writer is not None:
+            self._channel_writer.end_of_writing()
+            return
         self._end_of_writing = True
         self._handle_end_of_writing()
 
-    def consume(self) -> tuple[bytes, bytes]:
-        stdout = []
-        stderr = []
+    def consume_to(self, stdout: BinaryWriter, stderr: BinaryWriter) -> None:
+        """
+        Close the input, and write stdout and stderr to the given file objects
+        as they arrive, until the stream ends. Unlike ``consume()``, this does
+        not keep the output in memory, unless the file objects do.
+        """
 
-        def append_block(stream_id: int, data: bytes) -> None:
+        def write_block(stream_id: int, data: bytes) -> None:
             if stream_id == docker_socket.STDOUT:
-                stdout.append(data)
+                stdout.write(data)
             elif stream_id == docker_socket.STDERR:
-                stderr.append(data)
+                stderr.write(data)
             else:
                 raise ValueError(f"{stream_id} is not a valid stream ID")
 
         self.end_of_writing()
 
-        self.set_block_done_callback(append_block)
+        self.set_block_done_callback(write_block)
         while not self._eof:
             self.select()
-        return b"".join(stdout), b"".join(stderr)
+
+    def consume(self) -> tuple[bytes, bytes]:
+        stdout = io.BytesIO()
+        stderr = io.BytesIO()
+        self.consume_to(stdout, stderr)
+        return stdout.getvalue(), stderr.getvalue()
 
     def write(self, str_to_write: bytes) -> None:
+        if self._channel_writer is not None:
+            self._channel_writer.write(str_to_write)
+            return
         self._write_buffer += str_to_write
         if len(self._write_buffer) == len(str_to_write):
             self._write()
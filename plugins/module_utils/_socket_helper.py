@@ -69,7 +69,7 @@ def shutdown_writing(
         log("No idea how to signal end of writing")
 
 
-def write_to_socket(sock: SocketLike, data: bytes) -> int:
+def write_to_socket(sock: SocketLike, data: bytes | bytearray) -> int:
     if hasattr(sock, "_send_until_done"):
         # WrappedSocket (urllib3/contrib/pyopenssl) does not have `send`, but
         # only `sendall`, which uses `_send_until_done` under the hood.
@@ -0,0 +1,171 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# Note that this module util is **PRIVATE** to the collection. It can have breaking changes at any time.
+# Do not use this from other collections or standalone plugins/modules!
+
+"""
+TLS session resumption for TCP+TLS connections to the Docker daemon.
+
+Every new TLS connection costs a full handshake, including certificate
+verification and, with client certificates, a signature on the client side.
+When a daemon closes idle keep-alive connections, or a process uses several
+clients, the next connection can resume the previous session instead.
+
+Python's ``ssl.SSLSession`` objects cannot be serialized, and can only be
+used with the ``SSLContext`` that created them. Sessions are therefore kept
+per process, in one shared context per TLS configuration.
+"""
+
+from __future__ import annotations
+
+import os
+import ssl
+import threading
+import time
+import typing as t
+import weakref
+
+from ansible.module_utils.parsing.convert_bool import BOOLEANS_TRUE
+
+from ansible_collections.community.docker.plugins.module_utils._api_stats import (
+    note_tls_handshake,
+)
+
+if t.TYPE_CHECKING:
+    import socket
+
+    _SessionKey = tuple[str | None, t.Any]
+
+
+TLS_SESSION_CACHE_ENV_VAR = "ANSIBLE_DOCKER_TLS_SESSION_CACHE"
+
+
+def is_tls_session_cache_enabled() -> bool:
+    return os.environ.get(TLS_SESSION_CACHE_ENV_VAR, "").lower() in BOOLEANS_TRUE
+
+
+def _is_valid(session: ssl.SSLSession, now: float) -> bool:
+    expires = session.time + session.timeout
+    if session.has_ticket and session.ticket_lifetime_hint:
+        expires = min(expires, session.time + session.ticket_lifetime_hint)
+    return now < expires
+
+
+class _SessionSavingSSLSocket(ssl.SSLSocket):
+    _session_key: _SessionKey | None = None
+
+    def _real_close(self) -> None:
+        # The session is no longer available once the socket is closed
+        context = self.context
+        if self._session_key is not None and isinstance(
+            context, SessionCachingSSLContext
+        ):
+            context.save_session(self._session_key, self)
+        super()._real_close()  # type: ignore[misc]
+
+
+class SessionCachingSSLContext(ssl.SSLContext):
+    """
+    A client-side SSL context that remembers the session of the last
+    connection to every server, and tries to resume it for the next one.
+
+    Servers are identified by their address and the host name sent with SNI.
+    Since the client certificate is part of the context, sessions are also
+    kept per client certificate. Expired sessions are not offered.
+    """
+
+    sslsocket_class = _SessionSavingSSLSocket
+
+    def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
+        super().__init__()
+        self._lock = threading.RLock()
+        self._sessions: dict[_SessionKey, ssl.SSLSession] = {}
+        self._sockets: dict[_SessionKey, weakref.ref[ssl.SSLSocket]] = {}
+
+    def save_session(self, key: _SessionKey, sock: ssl.SSLSocket) -> None:
+        try:
+            session = sock.session
+        except (OSError, ValueError):
+            return
+        if session is not None and (session.has_ticket or session.id):
+            with self._lock:
+                self._sessions[key] = session
+
+    def get_session(self, key: _SessionKey) -> ssl.SSLSession | None:
+        with self._lock:
+            # With TLS 1.3, the server sends session tickets after the
+            # handshake. They are processed while reading from the socket,
+            # so the session of an open connection is taken as late as possible.
+            ref = self._sockets.get(key)
+            sock = ref() if ref is not None else None
+            if sock is not None:
+                self.save_session(key, sock)
+            session = self._sessions.get(key)
+            if session is not None and not _is_valid(session, time.time()):
+                del self._sessions[key]
+                session = None
+            return session
+
+    def wrap_socket(  # type: ignore[override]
+        self,
+        sock: socket.socket,
+        server_side: bool = False,
+        do_handshake_on_connect: bool = True,
+        suppress_ragged_eofs: bool = True,
+        server_hostname: str | None = None,
+        session: ssl.SSLSession | None = None,
+    ) -> ssl.SSLSocket:
+        key: _SessionKey | None = None
+        if not server_side and session is None:
+            try:
+                key = (server_hostname, sock.getpeername()[:2])
+            except OSError:
+                key = None
+            if key is not None:
+                session = self.get_session(key)
+        ssl_sock = super().wrap_socket(
+            sock,
+            server_side=server_side,
+            do_handshake_on_connect=do_handshake_on_connect,
+            suppress_ragged_eofs=suppress_ragged_eofs,
+            server_hostname=server_hostname,
+            session=session,
+        )
+        if key is not None:
+            ssl_sock._session_key = key  # type: ignore[attr-defined]
+            with self._lock:
+                self._sockets[key] = weakref.ref(ssl_sock)
+            if do_handshake_on_connect:
+                note_tls_handshake(bool(ssl_sock.session_reused))
+        return ssl_sock
+
+
+_CONTEXTS: dict[t.Hashable, SessionCachingSSLContext] = {}
+_CONTEXTS_LOCK = threading.Lock()
+
+
+def _create_context() -> SessionCachingSSLContext:
+    # Same defaults as urllib3's create_urllib3_context(), except that session
+    # tickets are allowed. urllib3 sets the verification mode and loads the
+    # certificates for every connection, and checks the host name itself.
+    context = SessionCachingSSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.check_hostname = False
+    context.minimum_version = ssl.TLSVersion.TLSv1_2
+    context.options |= ssl.OP_NO_COMPRESSION
+    if getattr(context, "post_handshake_auth", None) is not None:
+        context.post_handshake_auth = True
+    return context
+
+
+def get_session_caching_context(key: t.Hashable) -> SessionCachingSSLContext:
+    """
+    Return the context shared by all clients in this process whose TLS
+    configuration is identified by ``key``.
+    """
+    with _CONTEXTS_LOCK:
+        context = _CONTEXTS.get(key)
+        if context is None:
+            context = _CONTEXTS[key] = _create_context()
+        return context
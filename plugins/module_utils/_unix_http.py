@@ -0,0 +1,787 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# Note that this module util is **PRIVATE** to the collection. It can have breaking changes at any time.
+# Do not use this from other collections or standalone plugins/modules!
+
+"""
+A minimal HTTP/1.1 client for talking to the Docker daemon over a Unix socket.
+
+This only implements the parts of ``requests.Session`` and ``requests.Response``
+that ``APIClient`` uses, and only depends on the Python standard library.
+"""
+
+from __future__ import annotations
+
+import codecs
+import io
+import json
+import os
+import select
+import socket
+import typing as t
+from urllib.parse import urlencode, urlsplit
+
+from ansible.module_utils.parsing.convert_bool import BOOLEANS_TRUE
+
+from ansible_collections.community.docker.plugins.module_utils._api._import_helper import (
+    HTTPError as _HTTPError,
+)
+from ansible_collections.community.docker.plugins.module_utils._api.errors import (
+    DockerException,
+)
+from ansible_collections.community.docker.plugins.module_utils._api_stats import (
+    note_retry,
+)
+
+if t.TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
+    from _typeshed import WriteableBuffer
+
+
+MINIMAL_HTTP_ENV_VAR = "ANSIBLE_DOCKER_MINIMAL_HTTP"
+
+_READ_SIZE = 1024 * 64
+_MAX_HEAD_SIZE = 1024 * 64
+_MAX_LINE_SIZE = 1024 * 64
+
+
+def is_minimal_http_enabled() -> bool:
+    return os.environ.get(MINIMAL_HTTP_ENV_VAR, "").lower() in BOOLEANS_TRUE
+
+
+class UnixHTTPError(DockerException):
+    """
+    The connection to the daemon failed, or the daemon sent an invalid response.
+    """
+
+
+class UnixHTTPStatusError(_HTTPError):
+    """
+    The daemon responded with an error status. Like ``requests.HTTPError``,
+    the response is available as ``response``.
+    """
+
+    response: BufferedHTTPResponse  # type: ignore[assignment]
+
+
+class UnixHTTPHeaders(dict):
+    """
+    Response headers. Lookups are case-insensitive.
+    """
+
+    def __getitem__(self, key: str) -> str:
+        return super().__getitem__(key.lower())
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and super().__contains__(key.lower())
+
+    def get(self, key: str, default: t.Any = None) -> t.Any:  # type: ignore[override]
+        return super().get(key.lower(), default)
+
+
+def _recv_exactly(sock: socket.socket, length: int) -> bytes:
+    data = bytearray()
+    while len(data) < length:
+        chunk = sock.recv(length - len(data))
+        if not chunk:
+            raise UnixHTTPError("Connection closed while reading the response header")
+        data += chunk
+    return bytes(data)
+
+
+class _NoResponseError(UnixHTTPError):
+    pass
+
+
+def _read_head(sock: socket.socket) -> bytes:
+    """
+    Read the status line and the headers of a response.
+
+    The data is peeked at first, so that nothing after the empty line that
+    ends the header is consumed. That way the socket can be handed over to
+    readers of hijacked connections (attach, exec) without losing data.
+    """
+    head = bytearray()
+    while True:
+        data = sock.recv(_READ_SIZE, socket.MSG_PEEK)
+        if not data:
+            if not head:
+                raise _NoResponseError(
+                    "Connection closed before the daemon sent a response"
+                )
+            raise UnixHTTPError("Connection closed while reading the response header")
+        # The end of the header can be split between two reads
+        start = max(len(head) - 3, 0)
+        index = (bytes(head[start:]) + data).find(b"\r\n\r\n")
+        if index >= 0:
+            head += _recv_exactly(sock, start + index + 4 - len(head))
+            return bytes(head)
+        head += _recv_exactly(sock, len(data))
+        if len(head) > _MAX_HEAD_SIZE:
+            raise UnixHTTPError("Response header is too long")
+
+
+def parse_response_head(head: bytes) -> tuple[str, int, str, UnixHTTPHeaders]:
+    """
+    Parse status line and headers of a response. Returns the HTTP version,
+    the status code, the reason and the headers.
+    """
+    lines = head.decode("iso-8859-1").split("\r\n")
+    parts = lines[0].split(" ", 2)
+    try:
+        if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+            raise ValueError(lines[0])
+        status_code = int(parts[1])
+    except ValueError as exc:
+        raise UnixHTTPError(f"Invalid status line {lines[0]!r}") from exc
+    headers = UnixHTTPHeaders()
+    for line in lines[1:]:
+        if not line:
+            continue
+        name, sep, value = line.partition(":")
+        if not sep:
+            raise UnixHTTPError(f"Invalid header line {line!r}")
+        name = name.strip().lower()
+        value = value.strip()
+        if name in headers:
+            value = f"{headers[name]}, {value}"
+        dict.__setitem__(headers, name, value)
+    return parts[0], status_code, parts[2] if len(parts) > 2 else "", headers
+
+
+def get_body_framing(
+    method: str, status_code: int, headers: UnixHTTPHeaders
+) -> tuple[bool, int | None]:
+    """
+    Determine how the body of a response is delimited. Returns whether it
+    is chunked, and its length. A length of ``None`` means that the body
+    ends when the connection is closed.
+    """
+    if status_code == 101:
+        # Switching protocols: everything that follows belongs to the
+        # upgraded connection
+        return False, None
+    if method == "HEAD" or status_code in (204, 304):
+        return False, 0
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        return True, None
+    if "content-length" not in headers:
+        return False, None
+    try:
+        return False, int(headers["content-length"])
+    except ValueError as exc:
+        raise UnixHTTPError(
+            f"Invalid Content-Length header {headers['content-length']!r}"
+        ) from exc
+
+
+def is_reusable(
+    version: str,
+    status_code: int,
+    headers: UnixHTTPHeaders,
+    chunked: bool,
+    length: int | None,
+) -> bool:
+    """
+    Whether the connection can be used for another request once the body
+    of the response has been read.
+    """
+    # Bodies without length are terminated by closing the connection.
+    # This includes upgraded (hijacked) connections.
+    return (
+        version == "HTTP/1.1"
+        and status_code != 101
+        and (chunked or length is not None)
+        and "close" not in headers.get("connection", "").lower()
+    )
+
+
+def _get_encoding(headers: UnixHTTPHeaders) -> str | None:
+    # Same rules as requests.utils.get_encoding_from_headers()
+    content_type = headers.get("content-type")
+    if not content_type:
+        return None
+    params = content_type.split(";")
+    for param in params[1:]:
+        key, dummy, value = param.strip().partition("=")
+        if key.strip().lower() == "charset":
+            return value.strip("'\" ")
+    mime_type = params[0].strip().lower()
+    if mime_type.startswith("text/"):
+        return "ISO-8859-1"
+    if mime_type == "application/json":
+        return "utf-8"
+    return None
+
+
+def encode_params(params: Mapping[str, t.Any] | Iterable[tuple[str, t.Any]]) -> str:
+    # Same rules as requests: None values are dropped, lists are repeated
+    items = params.items() if hasattr(params, "items") else params
+    result = []
+    for key, values in items:
+        if isinstance(values, (str, bytes)) or not hasattr(values, "__iter__"):
+            values = [values]
+        for value in values:
+            if value is not None:
+                result.append((key, value))
+    return urlencode(result, doseq=True)
+
+
+def build_request_head(
+    method: str, target: str, headers: Mapping[str, str | bytes | None]
+) -> bytes:
+    """
+    Build request line and headers. Headers with value ``None`` are omitted.
+    """
+    lines = [f"{method} {target} HTTP/1.1".encode("ascii")]
+    for name, value in headers.items():
+        if value is not None:
+            if not isinstance(value, bytes):
+                value = str(value).encode("latin-1")
+            lines.append(name.encode("latin-1") + b": " + value)
+    lines.append(b"\r\n")
+    return b"\r\n".join(lines)
+
+
+def get_request_target(
+    url: str, params: Mapping[str, t.Any] | Iterable[tuple[str, t.Any]] | None
+) -> str:
+    """
+    Return path and query of ``url``, with ``params`` added to the query.
+    """
+    parts = urlsplit(url)
+    query = parts.query
+    if params:
+        encoded = encode_params(params)
+        if encoded:
+            query = f"{query}&{encoded}" if query else encoded
+    return (parts.path or "/") + (f"?{query}" if query else "")
+
+
+class UnixHTTPBody:
+    """
+    The body of a response.
+
+    Offers the parts of ``urllib3.response.HTTPResponse`` that ``APIClient``
+    uses: ``read()``, ``read_chunked()``, ``chunked`` and ``closed``.
+    """
+
+    def __init__(
+        self,
+        sock: socket.socket,
+        *,
+        chunked: bool = False,
+        length: int | None = None,
+        on_complete: Callable[[], None] | None = None,
+    ) -> None:
+        self._sock = sock
+        self._fp: io.BufferedReader | None = None
+        self.chunked = chunked
+        # Remaining bytes for Content-Length, None to read until the
+        # connection is closed
+        self._remaining = length
+        self._chunk_left = 0
+        self._on_complete = on_complete
+        self.complete = False
+        self.closed = False
+        if not chunked and length == 0:
+            self._complete()
+
+    @property
+    def _file(self) -> io.BufferedReader:
+        # Only create the buffered reader once the body is read through the
+        # response, so that hijacked sockets can be read directly
+        if self._fp is None:
+            self._fp = t.cast(
+                "io.BufferedReader",
+                self._sock.makefile("rb", buffering=_READ_SIZE),
+            )
+        return self._fp
+
+    def supports_chunked_reads(self) -> bool:
+        return True
+
+    def _complete(self) -> None:
+        self.complete = True
+        self.closed = True
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+        if self._on_complete is not None:
+            on_complete = self._on_complete
+            self._on_complete = None
+            on_complete()
+        else:
+            self._sock.close()
+
+    def _read_line(self) -> bytes:
+        line = self._file.readline(_MAX_LINE_SIZE)
+        if not line.endswith(b"\n"):
+            raise UnixHTTPError("Connection closed while reading a chunk header")
+        return line
+
+    def _next_chunk_size(self) -> int:
+        line = self._read_line().split(b";", 1)[0].strip()
+        try:
+            size = int(line, 16)
+        except ValueError as exc:
+            raise UnixHTTPError(f"Invalid chunk header {line!r}") from exc
+        if size == 0:
+            # Skip trailers
+            while self._read_line().strip():
+                pass
+            self._complete()
+        return size
+
+    def _read_exactly(self, length: int) -> bytes:
+        data = self._file.read(length)
+        if len(data) < length:
+            raise UnixHTTPError(
+                f"Connection closed while reading the response body ({length - len(data)} bytes missing)"
+            )
+        return data
+
+    def _read_chunked(self, amt: int | None) -> bytes:
+        parts = []
+        while not self.complete and (amt is None or amt > 0):
+            if not self._chunk_left:
+                self._chunk_left = self._next_chunk_size()
+                continue
+            size = self._chunk_left if amt is None else min(amt, self._chunk_left)
+            parts.append(self._read_exactly(size))
+            self._chunk_left -= size
+            if amt is not None:
+                amt -= size
+            if not self._chunk_left:
+                self._read_exactly(2)
+        return b"".join(parts)
+
+    def read(self, amt: int | None = None) -> bytes:
+        if self.closed:
+            return b""
+        try:
+            if self.chunked:
+                return self._read_chunked(amt)
+            if self._remaining is None:
+                data = self._file.read() if amt is None else self._file.read(amt)
+                if amt is None or len(data) < amt:
+                    self._complete()
+                return data
+            size = self._remaining if amt is None else min(amt, self._remaining)
+            data = self._read_exactly(size)
+            self._remaining -= size
+            if not self._remaining:
+                self._complete()
+            return data
+        except OSError as exc:
+            raise UnixHTTPError(f"Error while reading the response: {exc}") from exc
+
+    def readinto(self, b: WriteableBuffer) -> int:
+        """
+        Read up to ``len(b)`` bytes of the body directly into ``b``. Returns
+        ``0`` once the body is complete.
+        """
+        view = memoryview(b).cast("B")
+        if self.closed or not len(view):
+            return 0
+        try:
+            if self.chunked:
+                while not self._chunk_left:
+                    self._chunk_left = self._next_chunk_size()
+                    if self.complete:
+                        return 0
+                size = self._file.readinto(view[: min(len(view), self._chunk_left)])
+                if not size:
+                    raise UnixHTTPError(
+                        "Connection closed while reading the response body"
+                    )
+                self._chunk_left -= size
+                if not self._chunk_left:
+                    self._read_exactly(2)
+                return size
+            if self._remaining is None:
+                size = self._file.readinto(view)
+                if not size:
+                    self._complete()
+                return size
+            size = self._file.readinto(view[: min(len(view), self._remaining)])
+            if not size:
+                raise UnixHTTPError(
+                    f"Connection closed while reading the response body ({self._remaining} bytes missing)"
+                )
+            self._remaining -= size
+            if not self._remaining:
+                self._complete()
+            return size
+        except OSError as exc:
+            raise UnixHTTPError(f"Error while reading the response: {exc}") from exc
+
+    def read_chunked(self, amt: int | None = None) -> t.Generator[bytes]:
+        """
+        Yield the chunks of a chunked response as they were sent by the
+        daemon. Chunks larger than ``amt`` are split.
+        """
+        if not self.chunked:
+            raise UnixHTTPError("Response is not chunked")
+        try:
+            while not self.closed:
+                if not self._chunk_left:
+                    self._chunk_left = self._next_chunk_size()
+                    continue
+                size = self._chunk_left if amt is None else min(amt, self._chunk_left)
+                data = self._read_exactly(size)
+                self._chunk_left -= size
+                if not self._chunk_left:
+                    self._read_exactly(2)
+                yield data
+        except OSError as exc:
+            raise UnixHTTPError(f"Error while reading the response: {exc}") from exc
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        self._on_complete = None
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+        # The rest of the body was not read, so the connection cannot be
+        # used for another request
+        self._sock.close()
+
+
+class BufferedHTTPResponse:
+    """
+    A response whose body has been read completely. Offers the parts of
+    ``requests.Response`` that ``APIClient._result()`` uses.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        status_code: int,
+        reason: str,
+        headers: UnixHTTPHeaders,
+        content: bytes | None = None,
+    ) -> None:
+        self.url = url
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.encoding = _get_encoding(headers)
+        self._content = content
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def content(self) -> bytes:
+        return self._content or b""
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", "replace")
+
+    def json(self) -> t.Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if 400 <= self.status_code < 500:
+            kind = "Client"
+        elif 500 <= self.status_code < 600:
+            kind = "Server"
+        else:
+            return
+        error = UnixHTTPStatusError(
+            f"{self.status_code} {kind} Error: {self.reason} for url: {self.url}"
+        )
+        error.response = self
+        raise error
+
+
+class UnixHTTPResponse(BufferedHTTPResponse):
+    """
+    A response whose body is read from the socket on demand. Offers the parts
+    of ``requests.Response`` that ``APIClient`` uses.
+    """
+
+    def __init__(
+        self,
+        sock: socket.socket,
+        url: str,
+        status_code: int,
+        reason: str,
+        headers: UnixHTTPHeaders,
+        raw: UnixHTTPBody,
+    ) -> None:
+        super().__init__(url, status_code, reason, headers)
+        self.socket = sock
+        self.raw = raw
+
+    @property
+    def content(self) -> bytes:
+        if self._content is None:
+            self._content = self.raw.read()
+        return self._content
+
+    def iter_content(
+        self, chunk_size: int = 1, decode_unicode: bool = False
+    ) -> t.Generator[bytes | str]:
+        def generate() -> t.Generator[bytes]:
+            if self._content is not None:
+                for index in range(0, len(self._content), chunk_size):
+                    yield self._content[index : index + chunk_size]
+            elif self.raw.chunked:
+                yield from self.raw.read_chunked(chunk_size)
+            else:
+                while True:
+                    data = self.raw.read(chunk_size)
+                    if not data:
+                        break
+                    yield data
+
+        if not decode_unicode or self.encoding is None:
+            yield from generate()
+            return
+        decoder = codecs.getincrementaldecoder(self.encoding)(errors="replace")
+        for data in generate():
+            text = decoder.decode(data)
+            if text:
+                yield text
+        text = decoder.decode(b"", final=True)
+        if text:
+            yield text
+
+    def close(self) -> None:
+        self.raw.close()
+
+    def __enter__(self) -> t.Self:
+        return self
+
+    def __exit__(self, *args: t.Any) -> None:
+        self.close()
+
+
+class UnixHTTPSession:
+    """
+    Sends HTTP/1.1 requests over a Unix socket. Idle connections are kept
+    open and re-used for later requests.
+
+    Offers the parts of ``requests.Session`` that ``APIClient`` uses.
+    """
+
+    def __init__(
+        self,
+        socket_path: str,
+        max_pool_size: int = 10,
+    ) -> None:
+        self.socket_path = socket_path
+        self.max_pool_size = max_pool_size
+        self.headers: dict[str, str | bytes] = {}
+        self._idle: list[socket.socket] = []
+
+    @property
+    def _address(self) -> str:
+        return f"unix://{self.socket_path}"
+
+    def _new_socket(self) -> tuple[socket.socket, t.Any]:
+        return socket.socket(socket.AF_UNIX, socket.SOCK_STREAM), self.socket_path
+
+    def _connect(self, timeout: int | float | None) -> tuple[socket.socket, bool]:
+        """
+        Return an idle connection, or a new one if there is none. Also returns
+        whether the connection was re-used.
+        """
+        while True:
+            try:
+                # Other threads might take idle connections at the same time
+                sock = self._idle.pop()
+            except IndexError:
+                break
+            # An idle connection that is readable was closed by the daemon
+            readable = select.select([sock], [], [], 0)[0]
+            if not readable:
+                sock.settimeout(timeout)
+                return sock, True
+            sock.close()
+        sock, address = self._new_socket()
+        sock.settimeout(timeout)
+        try:
+            sock.connect(address)
+        except OSError as exc:
+            sock.close()
+            raise UnixHTTPError(
+                f"Cannot connect to the Docker daemon at {self._address}: {exc}"
+            ) from exc
+        return sock, False
+
+    def _release(self, sock: socket.socket) -> None:
+        if len(self._idle) < self.max_pool_size:
+            self._idle.append(sock)
+        else:
+            sock.close()
+
+    def _send_body(self, sock: socket.socket, data: t.Any) -> None:
+        if hasattr(data, "read"):
+            chunks: Iterable[t.Any] = iter(lambda: data.read(_READ_SIZE), b"")
+        else:
+            chunks = data
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode("utf-8")
+            if not chunk:
+                continue
+            header = f"{len(chunk):x}\r\n".encode("ascii")
+            if len(chunk) < _READ_SIZE:
+                sock.sendall(b"".join((header, chunk, b"\r\n")))
+            else:
+                sock.sendall(header)
+                sock.sendall(chunk)
+                sock.sendall(b"\r\n")
+        sock.sendall(b"0\r\n\r\n")
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Mapping[str, t.Any] | Iterable[tuple[str, t.Any]] | None = None,
+        data: t.Any = None,
+        headers: Mapping[str, str | bytes | None] | None = None,
+        stream: bool = False,
+        timeout: int | float | None = None,
+        allow_redirects: bool = True,  # pylint: disable=unused-argument
+    ) -> UnixHTTPResponse:
+        target = get_request_target(url, params)
+
+        all_headers: dict[str, str | bytes | None] = {"Host": "localhost"}
+        all_headers.update(self.headers)
+        if headers:
+            all_headers.update(headers)
+
+        body: bytes | None = None
+        # Bodies that know their size and write themselves to the socket,
+        # for example with sendfile()
+        sized = hasattr(data, "send_to")
+        if sized:
+            all_headers["Content-Length"] = str(len(data))
+        elif isinstance(data, str):
+            body = data.encode("utf-8")
+        elif isinstance(data, (bytes, bytearray, memoryview)):
+            body = bytes(data)
+        elif data is None and method in ("POST", "PUT", "PATCH"):
+            body = b""
+        if body is not None:
+            all_headers["Content-Length"] = str(len(body))
+        elif data is not None and not sized:
+            all_headers["Transfer-Encoding"] = "chunked"
+
+        head = build_request_head(method, target, all_headers)
+        # Streamed bodies cannot be sent a second time
+        can_resend = data is None or body is not None or sized
+        while True:
+            sock, reused = self._connect(timeout)
+            try:
+                if body is not None and len(body) < _READ_SIZE:
+                    sock.sendall(head + body)
+                else:
+                    sock.sendall(head)
+                    if body:
+                        sock.sendall(body)
+                    elif sized:
+                        data.send_to(sock)
+                    elif data is not None:
+                        self._send_body(sock, data)
+                version, status_code, reason, response_headers = parse_response_head(
+                    _read_head(sock)
+                )
+                break
+            except (OSError, _NoResponseError) as exc:
+                sock.close()
+                if reused and can_resend and not isinstance(exc, socket.timeout):
+                    # The daemon closed the idle connection while the request
+                    # was sent, so it has not processed it. Try again; once
+                    # the idle connections are used up, a new one is opened.
+                    note_retry()
+                    continue
+                if isinstance(exc, UnixHTTPError):
+                    raise
+                raise UnixHTTPError(
+                    f"Error while talking to the Docker daemon at {self._address}: {exc}"
+                ) from exc
+            except Exception:
+                sock.close()
+                raise
+
+        try:
+            chunked, length = get_body_framing(method, status_code, response_headers)
+        except UnixHTTPError:
+            sock.close()
+            raise
+        reusable = is_reusable(version, status_code, response_headers, chunked, length)
+        raw = UnixHTTPBody(
+            sock,
+            chunked=chunked,
+            length=length,
+            on_complete=(lambda: self._release(sock)) if reusable else None,
+        )
+        response = UnixHTTPResponse(
+            sock, url, status_code, reason, response_headers, raw
+        )
+        if not stream:
+            try:
+                # Read the whole body so that the connection can be re-used
+                response._content = response.raw.read()
+            finally:
+                response.close()
+        return response
+
+    def get(self, url: str, **kwargs: t.Any) -> UnixHTTPResponse:
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url: str, **kwargs: t.Any) -> UnixHTTPResponse:
+        return self.request("HEAD", url, **kwargs)
+
+    def post(self, url: str, **kwargs: t.Any) -> UnixHTTPResponse:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: t.Any) -> UnixHTTPResponse:
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: t.Any) -> UnixHTTPResponse:
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self) -> None:
+        while self._idle:
+            self._idle.pop().close()
+
+
+class TCPHTTPSession(UnixHTTPSession):
+    """
+    Like ``UnixHTTPSession``, but talks to a daemon over TCP without TLS.
+    """
+
+    def __init__(self, host: str, port: int, max_pool_size: int = 10) -> None:
+        super().__init__("", max_pool_size=max_pool_size)
+        self.host = host
+        self.port = port
+
+    @property
+    def _address(self) -> str:
+        return f"tcp://{self.host}:{self.port}"
+
+    def _new_socket(self) -> tuple[socket.socket, t.Any]:
+        try:
+            family, kind, proto, dummy, address = socket.getaddrinfo(
+                self.host, self.port, type=socket.SOCK_STREAM
+            )[0]
+        except OSError as exc:
+            raise UnixHTTPError(
+                f"Cannot connect to the Docker daemon at {self._address}: {exc}"
+            ) from exc
+        sock = socket.socket(family, kind, proto)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock, address
@@ -36,11 +36,33 @@ options:
   container:
     description:
       - The name of the container to copy files to.
+      - Mutually exclusive with O(containers). One of O(container) and O(containers) is required.
     type: str
-    required: true
+  containers:
+    description:
+      - The names of several containers to copy the same file or content to.
+      - The local file is read and hashed, and the archive to upload is created, only once for all containers. The containers
+        are handled concurrently, see O(parallelism).
+      - The results for the single containers are returned in RV(results). The module fails if copying fails for any of
+        the containers.
+      - Cannot be used if O(path) is a directory.
+      - Mutually exclusive with O(container). One of O(container) and O(containers) is required.
+    type: list
+    elements: str
+    version_added: 5.3.0
+  parallelism:
+    description:
+      - How many of the containers in O(containers) are handled at the same time.
+    type: int
+    default: 4
+    version_added: 5.3.0
   path:
     description:
       - Path to a file on the managed node.
+      - If O(path) is a directory, its whole tree is copied to the directory O(container_path). Only the directories, files, and
+        symbolic links that differ from the ones in the container are uploaded, all of them in a single archive. The tree in the
+        container is listed with a single command, which needs C(/bin/sh), C(find), and C(stat) in the container; if that
+        does not work, the tree is downloaded instead. Copying directories is supported since community.docker 5.3.0.
       - Mutually exclusive with O(content). One of O(content) and O(path) is required.
     type: path
   content:
@@ -93,6 +115,8 @@ options:
     description:
       - The file mode to use when writing the file to disk.
       - Will use the file's mode from the source system if this option is not provided.
+      - If O(path) is a directory, this is used for all regular files in it. Directories always keep the mode from the source
+        system.
       - This option is parsed depending on how O(mode_parse) is set.
     type: raw
   mode_parse:
@@ -121,7 +145,29 @@ options:
       - If this option is not specified, the module will be idempotent. To verify idempotency, it will try to get information
         on the filesystem object in the container, and if everything seems to match will download the file from the container
         to compare it to the file to upload.
+      - If O(path) is a directory and this option is not specified, regular files with the same size, mode, owner, and group
+        are considered equal if their modification times match, unless O(checksum_in_container=true).
+    type: bool
+  checksum_in_container:
+    description:
+      - If set to V(true), the idempotency check compares the SHA-256 checksum of the file in the container with the checksum
+        of the file or content to copy, instead of downloading the file from the container.
+      - This needs C(/bin/sh), C(stat), and C(sha256sum) in the container, either as commands or as BusyBox applets. The
+        container must be running, and its default user must be able to read the file. If the checksum cannot be computed
+        in the container, the file is downloaded instead.
+      - The file is still downloaded if its content is needed for a diff.
+      - If O(path) is a directory, the checksums of all regular files in the container are computed when listing the tree.
     type: bool
+    default: false
+    version_added: 5.3.0
+  delete_extra:
+    description:
+      - If set to V(true) and O(path) is a directory, remove everything in the directory O(container_path) that does not
+        exist in O(path).
+      - This needs C(rm) in the container, and the container must be running.
+    type: bool
+    default: false
+    version_added: 5.3.0
 
 extends_documentation_fragment:
   - community.docker._docker.api_documentation
@@ -152,6 +198,25 @@ EXAMPLES = r"""
     group_id: 0 # root
     mode: "0755" # readable and executable by all users, writable by root
     mode_parse: modern # ensure that strings passed for 'mode' are passed as octal numbers
+
+- name: Copy a file into all replicas of a service
+  community.docker.docker_container_copy_into:
+    containers:
+      - web-1
+      - web-2
+      - web-3
+    path: /home/user/config/app.conf
+    container_path: /etc/app.conf
+    checksum_in_container: true
+
+- name: Synchronize a directory tree into the container, removing files that no longer exist locally
+  community.docker.docker_container_copy_into:
+    container: mydata
+    path: /home/user/config/
+    container_path: /etc/myapp
+    owner_id: 0 # root
+    group_id: 0 # root
+    delete_extra: true
 """
 
 RETURN = r"""
@@ -160,15 +225,69 @@ container_path:
     - The actual path in the container.
     - Can only be different from O(container_path) when O(follow=true).
   type: str
-  returned: success
+  returned: success and O(container) is specified
+results:
+  description:
+    - One result for every container in O(containers), in the same order.
+  type: list
+  elements: dict
+  returned: success or failure, if O(containers) is specified
+  version_added: 5.3.0
+  contains:
+    container:
+      description:
+        - The name of the container.
+      type: str
+      returned: always
+    container_path:
+      description:
+        - The actual path in the container.
+        - Can only be different from O(container_path) when O(follow=true).
+      type: str
+      returned: success
+    changed:
+      description:
+        - Whether the file was, or in check mode would have been, changed in the container.
+      type: bool
+      returned: always
+    failed:
+      description:
+        - Whether copying into the container failed.
+      type: bool
+      returned: failure
+    msg:
+      description:
+        - The reason why copying into the container failed.
+      type: str
+      returned: failure
+updated_paths:
+  description:
+    - The paths relative to O(container_path) that were, or in check mode would have been, uploaded. V("") stands for
+      O(container_path) itself.
+  type: list
+  elements: str
+  returned: success and O(path) is a directory
+  version_added: 5.3.0
+deleted_paths:
+  description:
+    - The paths relative to O(container_path) that were, or in check mode would have been, removed. Only the top-most removed
+      paths are listed, and not their contents.
+  type: list
+  elements: str
+  returned: success, O(path) is a directory, and O(delete_extra=true)
+  version_added: 5.3.0
 """
 
 import base64
+import hashlib
 import io
 import os
+import posixpath
 import stat
+import threading
 import traceback
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
 
 from ansible.module_utils.common.text.converters import to_bytes, to_text
 from ansible.module_utils.common.validation import check_type_int
@@ -186,10 +305,19 @@ from ansible_collections.community.docker.plugins.module_utils._copy import (
     DockerFileCopyError,
     DockerFileNotFound,
     DockerUnexpectedError,
+    TreeEntry,
+    create_content_tar_body,
+    create_file_tar_body,
     determine_user_group,
     fetch_file_ex,
+    fetch_tree_manifest,
+    get_file_checksum,
+    get_tree_manifest,
     put_file,
     put_file_content,
+    put_tar_body,
+    put_tree,
+    remove_paths,
     stat_file,
 )
 from ansible_collections.community.docker.plugins.module_utils._scramble import (
@@ -199,6 +327,7 @@ from ansible_collections.community.docker.plugins.module_utils._scramble import
 
 if t.TYPE_CHECKING:
     import tarfile
+    from collections.abc import Callable
 
 
 def are_fileobjs_equal(f1: t.IO[bytes], f2: t.IO[bytes]) -> bool:
@@ -473,6 +602,48 @@ def add_diff_dst_from_regular_member(
         diff["before"] = to_text(content)
 
 
+def get_local_file_checksum(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(1024 * 1024)
+            if not block:
+                return digest.hexdigest()
+            digest.update(block)
+
+
+def is_checksum_equal(
+    client: AnsibleDockerClient,
+    container: str,
+    container_path: str,
+    owner_id: int,
+    group_id: int,
+    size: int,
+    get_checksum: Callable[[], str],
+    diff: dict[str, t.Any] | None,
+    max_file_size_for_diff: int,
+) -> bool | None:
+    """
+    Compare owner, group, and checksum of the regular file in the container
+    with the expected ones. Returns ``None`` if the file has to be downloaded
+    instead, because its content is needed for the diff, or because the
+    checksum cannot be computed in the container.
+    """
+    if diff is not None and not size > max_file_size_for_diff > 0:
+        return None
+    remote = get_file_checksum(client, container, container_path)
+    if remote is None:
+        return None
+    if diff is not None:
+        diff["dst_larger"] = max_file_size_for_diff
+    remote_owner_id, remote_group_id, remote_checksum = remote
+    return (
+        remote_owner_id == owner_id
+        and remote_group_id == group_id
+        and remote_checksum == get_checksum()
+    )
+
+
 def copy_dst_to_src(diff: dict[str, t.Any] | None) -> None:
     if diff is None:
         return
@@ -501,6 +672,8 @@ def is_file_idempotent(
     force: bool | None = False,
     diff: dict[str, t.Any] | None = None,
     max_file_size_for_diff: int = 1,
+    checksum_in_container: bool = False,
+    local_checksum: Callable[[], str] | None = None,
 ) -> tuple[str, int, bool]:
     # Retrieve information of local file
     try:
@@ -668,6 +841,22 @@ def is_file_idempotent(
         )
         return container_path, mode, False
 
+    # Compare checksums instead of fetching the file
+    if checksum_in_container:
+        is_equal = is_checksum_equal(
+            client,
+            container,
+            container_path,
+            owner_id,
+            group_id,
+            file_stat.st_size,
+            local_checksum or (lambda: get_local_file_checksum(managed_path)),
+            diff,
+            max_file_size_for_diff,
+        )
+        if is_equal is not None:
+            return container_path, mode, is_equal
+
     # Fetch file from container
     def process_none(in_path: str) -> tuple[str, int, bool]:
         return container_path, mode, False
@@ -747,6 +936,7 @@ def copy_file_into_container(
     force: bool | None = False,
     do_diff: bool = False,
     max_file_size_for_diff: int = 1,
+    checksum_in_container: bool = False,
 ) -> t.NoReturn:
     diff: dict[str, t.Any] | None
     diff = {} if do_diff else None
@@ -764,6 +954,7 @@ def copy_file_into_container(
         force=force,
         diff=diff,
         max_file_size_for_diff=max_file_size_for_diff,
+        checksum_in_container=checksum_in_container,
     )
     changed = not idempotent
 
@@ -785,7 +976,7 @@ def copy_file_into_container(
     }
     if diff:
         result["diff"] = diff
-    client.module.exit_json(**result)
+    client.module.exit_json(**client.add_api_stats(result))
 
 
 def is_content_idempotent(
@@ -800,6 +991,8 @@ def is_content_idempotent(
     force: bool | None = False,
     diff: dict[str, t.Any] | None = None,
     max_file_size_for_diff: int = 1,
+    checksum_in_container: bool = False,
+    local_checksum: Callable[[], str] | None = None,
 ) -> tuple[str, int, bool]:
     if diff is not None:
         if len(content) > max_file_size_for_diff > 0:
@@ -920,6 +1113,22 @@ def is_content_idempotent(
         )
         return container_path, mode, False
 
+    # Compare checksums instead of fetching the file
+    if checksum_in_container:
+        is_equal = is_checksum_equal(
+            client,
+            container,
+            container_path,
+            owner_id,
+            group_id,
+            len(content),
+            local_checksum or (lambda: hashlib.sha256(content).hexdigest()),
+            diff,
+            max_file_size_for_diff,
+        )
+        if is_equal is not None:
+            return container_path, mode, is_equal
+
     # Fetch file from container
     def process_none(in_path: str) -> tuple[str, int, bool]:
         if diff is not None:
@@ -992,6 +1201,7 @@ def copy_content_into_container(
     force: bool | None = False,
     do_diff: bool = False,
     max_file_size_for_diff: int = 1,
+    checksum_in_container: bool = False,
 ) -> t.NoReturn:
     diff: dict[str, t.Any] | None = {} if do_diff else None
 
@@ -1007,6 +1217,7 @@ def copy_content_into_container(
         force=force,
         diff=diff,
         max_file_size_for_diff=max_file_size_for_diff,
+        checksum_in_container=checksum_in_container,
     )
     changed = not idempotent
 
@@ -1026,14 +1237,423 @@ def copy_content_into_container(
         "changed": changed,
     }
     if diff:
-        # Since the content is no_log, make sure that the before/after strings look sufficiently different
-        key = generate_insecure_key()
-        diff["scrambled_diff"] = base64.b64encode(key)
-        for k in ("before", "after"):
-            if k in diff:
-                diff[k] = scramble(diff[k], key)
+        scramble_diff(diff)
+        result["diff"] = diff
+    client.module.exit_json(**client.add_api_stats(result))
+
+
+def scramble_diff(diff: dict[str, t.Any]) -> None:
+    # Since the content is no_log, make sure that the before/after strings look sufficiently different
+    key = generate_insecure_key()
+    diff["scrambled_diff"] = base64.b64encode(key)
+    for k in ("before", "after"):
+        if k in diff:
+            diff[k] = scramble(diff[k], key)
+
+
+class SharedSource:
+    """
+    The file or content copied into several containers. Its checksum and
+    the archives to upload are computed only once, also when used from
+    several threads.
+    """
+
+    def __init__(
+        self,
+        managed_path: str | None,
+        content: bytes | None,
+        local_follow_links: bool,
+    ) -> None:
+        self.managed_path = managed_path
+        self.content = content
+        self.local_follow_links = local_follow_links
+        self._lock = threading.Lock()
+        self._checksum: str | None = None
+        self._bodies: dict[tuple[str, int, int, int], t.Any] = {}
+
+    def get_checksum(self) -> str:
+        with self._lock:
+            if self._checksum is None:
+                if self.content is not None:
+                    self._checksum = hashlib.sha256(self.content).hexdigest()
+                else:
+                    assert self.managed_path is not None
+                    self._checksum = get_local_file_checksum(self.managed_path)
+            return self._checksum
+
+    def get_tar_body(
+        self, out_file: str, owner_id: int, group_id: int, mode: int
+    ) -> t.Any:
+        key = (out_file, owner_id, group_id, mode)
+        with self._lock:
+            if key not in self._bodies:
+                if self.content is not None:
+                    self._bodies[key] = create_content_tar_body(
+                        self.content, out_file, owner_id, group_id, mode
+                    )
+                else:
+                    assert self.managed_path is not None
+                    self._bodies[key] = create_file_tar_body(
+                        self.managed_path,
+                        out_file,
+                        owner_id,
+                        group_id,
+                        mode=mode,
+                        follow_links=self.local_follow_links,
+                    )
+            return self._bodies[key]
+
+
+def copy_into_one_of_containers(
+    client: AnsibleDockerClient,
+    container: str,
+    source: SharedSource,
+    container_path: str,
+    follow_links: bool,
+    owner_id: int | None,
+    group_id: int | None,
+    mode: int | None,
+    force: bool | None = False,
+    do_diff: bool = False,
+    max_file_size_for_diff: int = 1,
+    checksum_in_container: bool = False,
+) -> dict[str, t.Any]:
+    diff: dict[str, t.Any] | None = {} if do_diff else None
+    result: dict[str, t.Any] = {"container": container}
+    try:
+        if owner_id is None or group_id is None:
+            owner_id, group_id = determine_user_group(client, container)
+
+        if source.content is not None:
+            assert mode is not None  # see required_by in main()
+            container_path, mode, idempotent = is_content_idempotent(
+                client,
+                container,
+                source.content,
+                container_path,
+                follow_links,
+                owner_id,
+                group_id,
+                mode,
+                force=force,
+                diff=diff,
+                max_file_size_for_diff=max_file_size_for_diff,
+                checksum_in_container=checksum_in_container,
+                local_checksum=source.get_checksum,
+            )
+        else:
+            assert source.managed_path is not None
+            container_path, mode, idempotent = is_file_idempotent(
+                client,
+                container,
+                source.managed_path,
+                container_path,
+                follow_links,
+                source.local_follow_links,
+                owner_id,
+                group_id,
+                mode,
+                force=force,
+                diff=diff,
+                max_file_size_for_diff=max_file_size_for_diff,
+                checksum_in_container=checksum_in_container,
+                local_checksum=source.get_checksum,
+            )
+        result["container_path"] = container_path
+        result["changed"] = not idempotent
+
+        if result["changed"] and not client.module.check_mode:
+            put_tar_body(
+                client,
+                container,
+                container_path,
+                source.get_tar_body(
+                    os.path.basename(container_path), owner_id, group_id, mode
+                ),
+            )
+    except NotFound as exc:
+        result["msg"] = (
+            f'Could not find container "{container}" or resource in it ({exc})'
+        )
+    except (APIError, DockerException) as exc:
+        result["msg"] = (
+            f'An unexpected Docker error occurred for container "{container}": {exc}'
+        )
+    except RequestException as exc:
+        result["msg"] = (
+            f'An unexpected requests error occurred for container "{container}" when trying to talk to the Docker daemon: {exc}'
+        )
+    except DockerUnexpectedError as exc:
+        result["msg"] = f"Unexpected error: {exc}"
+    except DockerFileCopyError as exc:
+        result["msg"] = to_text(exc)
+    except OSError as exc:
+        result["msg"] = f"Unexpected error: {exc}"
+    if "msg" in result:
+        result["failed"] = True
+        result["changed"] = False
+        return result
+
+    if diff:
+        diff["before_header"] = (
+            f"{container}:{diff.get('before_header', container_path)}"
+        )
+        if source.content is not None:
+            scramble_diff(diff)
         result["diff"] = diff
-    client.module.exit_json(**result)
+    return result
+
+
+def copy_into_containers(
+    client: AnsibleDockerClient,
+    containers: list[str],
+    source: SharedSource,
+    container_path: str,
+    follow_links: bool,
+    owner_id: int | None,
+    group_id: int | None,
+    mode: int | None,
+    force: bool | None = False,
+    do_diff: bool = False,
+    max_file_size_for_diff: int = 1,
+    checksum_in_container: bool = False,
+    parallelism: int = 1,
+) -> t.NoReturn:
+    def copy(container: str) -> dict[str, t.Any]:
+        return copy_into_one_of_containers(
+            client,
+            container,
+            source,
+            container_path,
+            follow_links,
+            owner_id,
+            group_id,
+            mode,
+            force=force,
+            do_diff=do_diff,
+            max_file_size_for_diff=max_file_size_for_diff,
+            checksum_in_container=checksum_in_container,
+        )
+
+    with ThreadPoolExecutor(max_workers=max(1, parallelism)) as executor:
+        results = list(executor.map(copy, containers))
+
+    changed = any(result["changed"] for result in results)
+    diffs = [result.pop("diff") for result in results if "diff" in result]
+    failed = [result["container"] for result in results if result.get("failed")]
+    if failed:
+        client.fail(
+            f"Copying failed for {len(failed)} of {len(results)} containers: {', '.join(failed)}",
+            changed=changed,
+            results=results,
+        )
+    result: dict[str, t.Any] = {"changed": changed, "results": results}
+    if diffs:
+        result["diff"] = diffs
+    client.module.exit_json(**client.add_api_stats(result))
+
+
+def get_local_tree(
+    managed_path: str,
+    local_follow_links: bool,
+    owner_id: int,
+    group_id: int,
+    mode: int | None,
+) -> dict[str, TreeEntry]:
+    """
+    List the local directory tree as it should look like in the container.
+    Directories come before their contents.
+    """
+    result: dict[str, TreeEntry] = {}
+
+    def add(path: str, file_stat: os.stat_result) -> None:
+        rel_path = os.path.relpath(path, managed_path)
+        if rel_path == ".":
+            rel_path = ""
+        if stat.S_ISLNK(file_stat.st_mode):
+            result[rel_path] = TreeEntry(
+                stat.S_IFLNK | 0o777,
+                owner_id,
+                group_id,
+                0,
+                int(file_stat.st_mtime),
+                link_target=os.readlink(path),
+            )
+        elif stat.S_ISDIR(file_stat.st_mode):
+            result[rel_path] = TreeEntry(
+                file_stat.st_mode, owner_id, group_id, 0, int(file_stat.st_mtime)
+            )
+        elif stat.S_ISREG(file_stat.st_mode):
+            file_mode = stat.S_IMODE(file_stat.st_mode) if mode is None else mode
+            result[rel_path] = TreeEntry(
+                stat.S_IFREG | file_mode,
+                owner_id,
+                group_id,
+                file_stat.st_size,
+                int(file_stat.st_mtime),
+            )
+        else:
+            raise DockerFileCopyError(
+                f"Local path {path} is not a directory, symbolic link, or file"
+            )
+
+    add(managed_path, os.stat(managed_path))
+    for dirpath, dirnames, filenames in os.walk(
+        managed_path, followlinks=local_follow_links
+    ):
+        for name in dirnames + filenames:
+            path = os.path.join(dirpath, name)
+            add(path, os.stat(path) if local_follow_links else os.lstat(path))
+    return result
+
+
+def is_tree_entry_equal(local: TreeEntry, remote: TreeEntry, local_path: str) -> bool:
+    if (
+        stat.S_IFMT(local.mode) != stat.S_IFMT(remote.mode)
+        or local.uid != remote.uid
+        or local.gid != remote.gid
+    ):
+        return False
+    if stat.S_ISLNK(local.mode):
+        return local.link_target == remote.link_target
+    if stat.S_IMODE(local.mode) != stat.S_IMODE(remote.mode):
+        return False
+    if stat.S_ISDIR(local.mode):
+        return True
+    if local.size != remote.size:
+        return False
+    if remote.checksum is not None:
+        return remote.checksum == get_local_file_checksum(local_path)
+    return local.mtime == remote.mtime
+
+
+def describe_tree_entry(path: str, entry: TreeEntry) -> str:
+    name = path or "."
+    if stat.S_ISLNK(entry.mode):
+        return f"{name} -> {entry.link_target}\n"
+    if stat.S_ISDIR(entry.mode):
+        name += "/"
+    details = f"mode {stat.S_IMODE(entry.mode):04o}, owner {entry.uid}:{entry.gid}"
+    if stat.S_ISREG(entry.mode):
+        details += f", {entry.size} bytes, modified {entry.mtime}"
+        if entry.checksum is not None:
+            details += f", SHA-256 {entry.checksum}"
+    elif not stat.S_ISDIR(entry.mode):
+        details = "unknown filesystem object"
+    return f"{name} ({details})\n"
+
+
+def copy_directory_into_container(
+    client: AnsibleDockerClient,
+    container: str,
+    managed_path: str,
+    container_path: str,
+    follow_links: bool,
+    local_follow_links: bool,
+    owner_id: int,
+    group_id: int,
+    mode: int | None,
+    force: bool | None = False,
+    delete_extra: bool = False,
+    do_diff: bool = False,
+    checksum_in_container: bool = False,
+) -> t.NoReturn:
+    if container_path == "/":
+        raise DockerFileCopyError("Cannot copy a directory to the root directory")
+    local = get_local_tree(managed_path, local_follow_links, owner_id, group_id, mode)
+
+    # Resolve symlinks in the container (if requested), and list the container's tree
+    real_container_path, container_stat, dummy_link_target = stat_file(
+        client,
+        container,
+        in_path=container_path,
+        follow_links=follow_links,
+    )
+    if follow_links:
+        container_path = real_container_path
+
+    remote: dict[str, TreeEntry] = {}
+    # A non-directory at container_path is replaced as a whole
+    if (
+        container_stat is not None
+        and container_stat["mode"] & (1 << (32 - 1)) != 0  # ModeDir
+        and (not force or delete_extra)
+    ):
+        manifest = get_tree_manifest(
+            client, container, container_path, checksums=checksum_in_container
+        )
+        if manifest is None:
+            manifest = fetch_tree_manifest(client, container, container_path)
+        remote = manifest
+
+    if force:
+        updated = list(local)
+    else:
+        updated = [
+            path
+            for path, entry in local.items()
+            if path not in remote
+            or (
+                force is None
+                and not is_tree_entry_equal(
+                    entry, remote[path], os.path.join(managed_path, path)
+                )
+            )
+        ]
+    deleted: list[str] = []
+    if delete_extra:
+        extra = {path for path in remote if path not in local}
+        for path in remote:
+            if path not in extra:
+                continue
+            # Only remove the top-most paths; their contents go with them
+            parent = posixpath.dirname(path)
+            while parent and parent not in extra:
+                parent = posixpath.dirname(parent)
+            if not parent:
+                deleted.append(path)
+
+    if not client.module.check_mode:
+        if deleted:
+            remove_paths(
+                client,
+                container,
+                [posixpath.join(container_path, path) for path in deleted],
+            )
+        if updated:
+            put_tree(
+                client,
+                container,
+                managed_path,
+                container_path,
+                updated,
+                user_id=owner_id,
+                group_id=group_id,
+                mode=mode,
+                follow_links=local_follow_links,
+            )
+
+    result: dict[str, t.Any] = {
+        "container_path": container_path,
+        "changed": bool(updated or deleted),
+        "updated_paths": updated,
+    }
+    if delete_extra:
+        result["deleted_paths"] = deleted
+    if do_diff:
+        result["diff"] = {
+            "before_header": container_path,
+            "before": "".join(
+                describe_tree_entry(path, remote[path])
+                for path in sorted(set(updated + deleted))
+                if path in remote
+            ),
+            "after_header": managed_path,
+            "after": "".join(
+                describe_tree_entry(path, local[path]) for path in sorted(updated)
+            ),
+        }
+    client.module.exit_json(**client.add_api_stats(result))
 
 
 def parse_modern(mode: str | int) -> int:
@@ -1052,7 +1672,9 @@ def parse_octal_string_only(mode: str) -> int:
 
 def main() -> None:
     argument_spec = {
-        "container": {"type": "str", "required": True},
+        "container": {"type": "str"},
+        "containers": {"type": "list", "elements": "str"},
+        "parallelism": {"type": "int", "default": 4},
         "path": {"type": "path"},
         "container_path": {"type": "str", "required": True},
         "follow": {"type": "bool", "default": False},
@@ -1068,6 +1690,8 @@ def main() -> None:
         "force": {"type": "bool"},
         "content": {"type": "str", "no_log": True},
         "content_is_b64": {"type": "bool", "default": False},
+        "checksum_in_container": {"type": "bool", "default": False},
+        "delete_extra": {"type": "bool", "default": False},
         # Undocumented parameters for use by the action plugin
         "_max_file_size_for_diff": {"type": "int"},
     }
@@ -1076,7 +1700,8 @@ def main() -> None:
         argument_spec=argument_spec,
         min_docker_api_version="1.20",
         supports_check_mode=True,
-        mutually_exclusive=[("path", "content")],
+        mutually_exclusive=[("path", "content"), ("container", "containers")],
+        required_one_of=[("container", "containers")],
         required_together=[("owner_id", "group_id")],
         required_by={
             "content": ["mode"],
@@ -1084,6 +1709,7 @@ def main() -> None:
     )
 
     container: str = client.module.params["container"]
+    containers: list[str] | None = client.module.params["containers"]
     managed_path: str | None = client.module.params["path"]
     container_path: str = client.module.params["container_path"]
     follow: bool = client.module.params["follow"]
@@ -1094,6 +1720,8 @@ def main() -> None:
     force: bool | None = client.module.params["force"]
     content_str: str | None = client.module.params["content"]
     max_file_size_for_diff: int = client.module.params["_max_file_size_for_diff"] or 1
+    checksum_in_container: bool = client.module.params["checksum_in_container"]
+    delete_extra: bool = client.module.params["delete_extra"]
 
     if mode is not None:
         mode_parse: t.Literal["legacy", "modern", "octal_string_only"] = (
@@ -1125,6 +1753,27 @@ def main() -> None:
         container_path = os.path.join(os.path.sep, container_path)
     container_path = os.path.normpath(container_path)
 
+    if containers is not None:
+        if managed_path is not None and os.path.isdir(managed_path):
+            client.fail("containers cannot be used when path is a directory")
+        if managed_path is None and content is None:
+            client.fail("One of path and content must be supplied")
+        copy_into_containers(
+            client,
+            containers,
+            SharedSource(managed_path, content, local_follow),
+            container_path,
+            follow_links=follow,
+            owner_id=owner_id,
+            group_id=group_id,
+            mode=mode,
+            force=force,
+            do_diff=client.module._diff,
+            max_file_size_for_diff=max_file_size_for_diff,
+            checksum_in_container=checksum_in_container,
+            parallelism=client.module.params["parallelism"],
+        )
+
     try:
         if owner_id is None or group_id is None:
             owner_id, group_id = determine_user_group(client, container)
@@ -1143,6 +1792,27 @@ def main() -> None:
                 force=force,
                 do_diff=client.module._diff,
                 max_file_size_for_diff=max_file_size_for_diff,
+                checksum_in_container=checksum_in_container,
+            )
+        elif (
+            managed_path is not None
+            and os.path.isdir(managed_path)
+            and (local_follow or not os.path.islink(managed_path))
+        ):
+            copy_directory_into_container(
+                client,
+                container,
+                managed_path,
+                container_path,
+                follow_links=follow,
+                local_follow_links=local_follow,
+                owner_id=owner_id,
+                group_id=group_id,
+                mode=mode,
+                force=force,
+                delete_extra=delete_extra,
+                do_diff=client.module._diff,
+                checksum_in_container=checksum_in_container,
             )
         elif managed_path is not None:
             copy_file_into_container(
@@ -1158,6 +1828,7 @@ def main() -> None:
                 force=force,
                 do_diff=client.module._diff,
                 max_file_size_for_diff=max_file_size_for_diff,
+                checksum_in_container=checksum_in_container,
             )
         else:
             # Can happen if a user explicitly passes `content: null` or `path: null`...
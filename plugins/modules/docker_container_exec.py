@@ -93,6 +93,51 @@ options:
         string }}").
     type: dict
     version_added: 2.1.0
+  stdout_path:
+    type: path
+    description:
+      - Write the standard output of the command to this file on the target instead of returning it in RV(stdout).
+      - The output is written while the command runs, so its size is not limited by the memory of the target.
+      - The file is created or overwritten.
+      - If O(tty=true), the standard error output is part of the standard output.
+      - If O(output_tail_lines) or O(output_tail_bytes) is specified, RV(stdout) contains the end of the output.
+        Otherwise it is empty.
+    version_added: 5.3.0
+  stderr_path:
+    type: path
+    description:
+      - Write the standard error output of the command to this file on the target instead of returning it in RV(stderr).
+      - See O(stdout_path) for details.
+      - Must not be the same file as O(stdout_path).
+    version_added: 5.3.0
+  output_tail_lines:
+    type: int
+    description:
+      - Only keep the last lines of the standard output and the standard error output of the command for RV(stdout) and
+        RV(stderr).
+      - Earlier output is dropped while the command runs. RV(stdout_truncated) and RV(stderr_truncated) show whether
+        something was dropped.
+      - Can be combined with O(output_tail_bytes); then both limits apply.
+    version_added: 5.3.0
+  output_tail_bytes:
+    type: int
+    description:
+      - Only keep the last bytes of the standard output and the standard error output of the command for RV(stdout) and
+        RV(stderr).
+      - A character that is cut off is dropped completely.
+      - See O(output_tail_lines) for details.
+    version_added: 5.3.0
+  output_checksum:
+    type: str
+    choices:
+      - sha1
+      - sha256
+      - sha512
+    description:
+      - Compute a checksum of the complete standard output and standard error output of the command with this algorithm,
+        and return them in RV(stdout_checksum) and RV(stderr_checksum).
+      - This works independently of O(stdout_path), O(stderr_path), O(output_tail_lines), and O(output_tail_bytes).
+    version_added: 5.3.0
 
 notes:
   - Does B(not work with TCP TLS sockets) when using O(stdin). This is caused by the inability to send C(close_notify) without
@@ -134,6 +179,21 @@ EXAMPLES = r"""
 - name: Print stderr lines
   ansible.builtin.debug:
     var: result.stderr_lines
+
+- name: Dump a database to a file on the Docker host
+  community.docker.docker_container_exec:
+    container: db
+    argv:
+      - pg_dumpall
+      - --username=postgres
+    stdout_path: /var/backups/db.sql
+    output_tail_lines: 20
+    output_checksum: sha256
+  register: result
+
+- name: Print size and checksum of the dump, and the errors at its end
+  ansible.builtin.debug:
+    msg: "{{ result.stdout_size }} bytes, SHA-256 {{ result.stdout_checksum }}, errors: {{ result.stderr }}"
 """
 
 RETURN = r"""
@@ -153,6 +213,50 @@ rc:
   sample: 0
   description:
     - The exit code of the command.
+stdout_size:
+  type: int
+  returned: success and O(detach=false)
+  sample: 1024
+  description:
+    - The size of the standard output of the command in bytes.
+  version_added: 5.3.0
+stderr_size:
+  type: int
+  returned: success and O(detach=false)
+  sample: 0
+  description:
+    - The size of the standard error output of the command in bytes.
+  version_added: 5.3.0
+stdout_truncated:
+  type: bool
+  returned: success and O(detach=false)
+  sample: false
+  description:
+    - Whether RV(stdout) only contains a part of the standard output, or nothing, because of O(stdout_path),
+      O(output_tail_lines), or O(output_tail_bytes).
+  version_added: 5.3.0
+stderr_truncated:
+  type: bool
+  returned: success and O(detach=false)
+  sample: false
+  description:
+    - Whether RV(stderr) only contains a part of the standard error output, or nothing, because of O(stderr_path),
+      O(output_tail_lines), or O(output_tail_bytes).
+  version_added: 5.3.0
+stdout_checksum:
+  type: str
+  returned: success, O(detach=false), and O(output_checksum) is specified
+  sample: e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855
+  description:
+    - The checksum of the complete standard output of the command.
+  version_added: 5.3.0
+stderr_checksum:
+  type: str
+  returned: success, O(detach=false), and O(output_checksum) is specified
+  sample: e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855
+  description:
+    - The checksum of the complete standard error output of the command.
+  version_added: 5.3.0
 exec_id:
   type: str
   returned: success and O(detach=true)
@@ -162,6 +266,9 @@ exec_id:
   version_added: 2.1.0
 """
 
+import collections
+import hashlib
+import os
 import shlex
 import traceback
 import typing as t
@@ -185,6 +292,120 @@ from ansible_collections.community.docker.plugins.module_utils._socket_handler i
 )
 
 
+class OutputFileError(Exception):
+    pass
+
+
+class OutputSink:
+    """
+    Receives one output stream of the command, and keeps only what is needed
+    for the result: the output (or its end) for the return value, the
+    total size, and the checksum. If ``path`` is given, the output is written
+    to that file.
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        tail_lines: int | None = None,
+        tail_bytes: int | None = None,
+        checksum: str | None = None,
+    ) -> None:
+        self.size = 0
+        self.truncated = False
+        self._keep = path is None or tail_lines is not None or tail_bytes is not None
+        self._tail_lines = tail_lines
+        self._tail_bytes = tail_bytes
+        self._chunks: collections.deque[bytes | bytearray] = collections.deque()
+        self._kept_size = 0
+        self._hash = hashlib.new(checksum) if checksum is not None else None
+        self._path = path
+        self._file: t.IO[bytes] | None = None
+        if path is not None:
+            # pylint: disable-next=consider-using-with
+            self._file = open(path, "wb")  # noqa: SIM115
+
+    def __enter__(self) -> t.Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._file is not None:
+            file, self._file = self._file, None
+            try:
+                file.close()
+            except OSError as exc:
+                raise OutputFileError(
+                    f"Cannot write output file {self._path}: {exc}"
+                ) from exc
+
+    def write(self, data: bytes | bytearray | memoryview) -> None:
+        if not data:
+            return
+        self.size += len(data)
+        if self._hash is not None:
+            self._hash.update(data)
+        if self._file is not None:
+            try:
+                self._file.write(data)
+            except OSError as exc:
+                raise OutputFileError(
+                    f"Cannot write output file {self._path}: {exc}"
+                ) from exc
+        if not self._keep:
+            self.truncated = True
+            return
+        if self._tail_lines is None:
+            self._chunks.append(bytes(data))
+        else:
+            # Every chunk is one line including its newline, except possibly
+            # the last one
+            lines = bytes(data).split(b"\n")
+            if self._chunks and not self._chunks[-1].endswith(b"\n"):
+                self._chunks[-1] += lines.pop(0)
+                if lines:
+                    self._chunks[-1] += b"\n"
+            last = len(lines) - 1
+            for index, line in enumerate(lines):
+                if index < last:
+                    self._chunks.append(bytearray(line + b"\n"))
+                elif line:
+                    self._chunks.append(bytearray(line))
+            while len(self._chunks) > self._tail_lines:
+                self._kept_size -= len(self._chunks.popleft())
+                self.truncated = True
+        self._kept_size += len(data)
+        if self._tail_bytes is not None and self._kept_size > self._tail_bytes:
+            while (
+                self._chunks
+                and self._kept_size - len(self._chunks[0]) >= self._tail_bytes
+            ):
+                self._kept_size -= len(self._chunks.popleft())
+            excess = self._kept_size - self._tail_bytes
+            if excess > 0:
+                self._chunks[0] = self._chunks[0][excess:]
+                self._kept_size -= excess
+            self.truncated = True
+
+    def get_output(self) -> bytes:
+        """
+        Return the output that was kept.
+        """
+        output = b"".join(self._chunks)
+        if self.truncated and self._tail_bytes is not None:
+            # Drop a character that was cut off at the beginning
+            index = 0
+            while index < min(3, len(output)) and 0x80 <= output[index] < 0xC0:
+                index += 1
+            output = output[index:]
+        return output
+
+    def get_checksum(self) -> str | None:
+        return self._hash.hexdigest() if self._hash is not None else None
+
+
 def main() -> None:
     argument_spec = {
         "container": {"type": "str", "required": True},
@@ -198,6 +419,11 @@ def main() -> None:
         "strip_empty_ends": {"type": "bool", "default": True},
         "tty": {"type": "bool", "default": False},
         "env": {"type": "dict"},
+        "stdout_path": {"type": "path"},
+        "stderr_path": {"type": "path"},
+        "output_tail_lines": {"type": "int"},
+        "output_tail_bytes": {"type": "int"},
+        "output_checksum": {"type": "str", "choices": ["sha1", "sha256", "sha512"]},
     }
 
     option_minimal_versions = {
@@ -221,6 +447,11 @@ def main() -> None:
     strip_empty_ends: bool = client.module.params["strip_empty_ends"]
     tty: bool = client.module.params["tty"]
     env: dict[str, t.Any] | None = client.module.params["env"]
+    stdout_path: str | None = client.module.params["stdout_path"]
+    stderr_path: str | None = client.module.params["stderr_path"]
+    output_tail_lines: int | None = client.module.params["output_tail_lines"]
+    output_tail_bytes: int | None = client.module.params["output_tail_bytes"]
+    output_checksum: str | None = client.module.params["output_checksum"]
 
     if env is not None:
         for name, value in env.items():
@@ -239,6 +470,31 @@ def main() -> None:
     if detach and stdin is not None:
         client.module.fail_json(msg="If detach=true, stdin cannot be provided.")
 
+    if (output_tail_lines or 0) < 0 or (output_tail_bytes or 0) < 0:
+        client.module.fail_json(
+            msg="output_tail_lines and output_tail_bytes must not be negative."
+        )
+
+    if (
+        stdout_path is not None
+        and stderr_path is not None
+        and os.path.realpath(stdout_path) == os.path.realpath(stderr_path)
+    ):
+        client.module.fail_json(
+            msg="stdout_path and stderr_path must not be the same file."
+        )
+
+    stream_output = any(
+        value is not None
+        for value in (
+            stdout_path,
+            stderr_path,
+            output_tail_lines,
+            output_tail_bytes,
+            output_checksum,
+        )
+    )
+
     if stdin is not None and client.module.params["stdin_add_newline"]:
         stdin += "\n"
 
@@ -268,58 +524,79 @@ def main() -> None:
         }
         if detach:
             client.post_json_to_text("/exec/{0}/start", exec_id, data=data)
-            client.module.exit_json(changed=True, exec_id=exec_id)
+            client.module.exit_json(
+                **client.add_api_stats({"changed": True, "exec_id": exec_id})
+            )
 
         else:
-            stdout: bytes | None
-            stderr: bytes | None
-            if stdin and not detach:
-                exec_socket, response = client.post_json_to_stream_socket(
-                    "/exec/{0}/start", exec_id, data=data
-                )
-                try:
-                    with DockerSocketHandlerModule(
-                        exec_socket, client.module
-                    ) as exec_socket_handler:
-                        if stdin:
-                            exec_socket_handler.write(to_bytes(stdin))
-
-                        stdout, stderr = exec_socket_handler.consume()
-                finally:
-                    response.close()
-            elif tty:
-                stdout, stderr = client.post_json_to_stream(
-                    "/exec/{0}/start",
-                    exec_id,
-                    data=data,
-                    stream=False,
-                    tty=True,
-                    demux=True,
+            try:
+                stdout_sink = OutputSink(
+                    stdout_path, output_tail_lines, output_tail_bytes, output_checksum
                 )
-            else:
-                stdout, stderr = client.post_json_to_stream(
-                    "/exec/{0}/start",
-                    exec_id,
-                    data=data,
-                    stream=False,
-                    tty=False,
-                    demux=True,
+                stderr_sink = OutputSink(
+                    stderr_path, output_tail_lines, output_tail_bytes, output_checksum
                 )
+            except OSError as e:
+                client.fail(f"Cannot open output file: {e}")
+            with stdout_sink, stderr_sink:
+                if stdin and not detach:
+                    exec_socket, response = client.post_json_to_stream_socket(
+                        "/exec/{0}/start", exec_id, data=data
+                    )
+                    try:
+                        with DockerSocketHandlerModule(
+                            exec_socket, client.module
+                        ) as exec_socket_handler:
+                            if stdin:
+                                exec_socket_handler.write(to_bytes(stdin))
+
+                            exec_socket_handler.consume_to(stdout_sink, stderr_sink)
+                    finally:
+                        response.close()
+                else:
+                    # With output options, the output is handled block by block
+                    # instead of collecting all of it first
+                    output = client.post_json_to_stream(  # type: ignore[call-overload]
+                        "/exec/{0}/start",
+                        exec_id,
+                        data=data,
+                        stream=stream_output,
+                        tty=tty,
+                        demux=True,
+                    )
+                    blocks: t.Iterable[tuple[bytes | None, bytes | None]] = (
+                        output if stream_output else [output]
+                    )
+                    for stdout_block, stderr_block in blocks:
+                        if stdout_block:
+                            stdout_sink.write(stdout_block)
+                        if stderr_block:
+                            stderr_sink.write(stderr_block)
 
             result = client.get_json("/exec/{0}/json", exec_id)
 
-            stdout_t = to_text(stdout or b"")
-            stderr_t = to_text(stderr or b"")
+            stdout_t = to_text(stdout_sink.get_output())
+            stderr_t = to_text(stderr_sink.get_output())
             if strip_empty_ends:
                 stdout_t = stdout_t.rstrip("\r\n")
                 stderr_t = stderr_t.rstrip("\r\n")
 
-            client.module.exit_json(
-                changed=True,
-                stdout=stdout_t,
-                stderr=stderr_t,
-                rc=result.get("ExitCode") or 0,
-            )
+            results = {
+                "changed": True,
+                "stdout": stdout_t,
+                "stderr": stderr_t,
+                "rc": result.get("ExitCode") or 0,
+                "stdout_size": stdout_sink.size,
+                "stderr_size": stderr_sink.size,
+                "stdout_truncated": stdout_sink.truncated,
+                "stderr_truncated": stderr_sink.truncated,
+            }
+            if output_checksum is not None:
+                results["stdout_checksum"] = stdout_sink.get_checksum()
+                results["stderr_checksum"] = stderr_sink.get_checksum()
+            client.module.exit_json(**client.add_api_stats(results))
+    except OutputFileError as e:
+        client.fail(str(e))
     except NotFound:
         client.fail(f'Could not find container "{container}"')
     except APIError as e:
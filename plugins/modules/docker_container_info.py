@@ -100,9 +100,13 @@ def main() -> None:
         container = client.get_container(container_id)
 
         client.module.exit_json(
-            changed=False,
-            exists=bool(container),
-            container=container,
+            **client.add_api_stats(
+                {
+                    "changed": False,
+                    "exists": bool(container),
+                    "container": container,
+                }
+            )
         )
     except DockerException as e:
         client.fail(
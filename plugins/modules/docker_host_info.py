@@ -220,6 +220,10 @@ from ansible_collections.community.docker.plugins.module_utils._api.errors impor
 from ansible_collections.community.docker.plugins.module_utils._api.utils.utils import (
     convert_filters,
 )
+from ansible_collections.community.docker.plugins.module_utils._async_api import (
+    GetJSON,
+    get_json_batch,
+)
 from ansible_collections.community.docker.plugins.module_utils._common_api import (
     AnsibleDockerClient,
     RequestException,
@@ -245,19 +249,30 @@ class DockerHostManager(DockerBaseClass):
         self.results["can_talk_to_docker"] = True
         self.client.fail_results["can_talk_to_docker"] = True
 
+        # The remaining requests are independent of each other and are sent
+        # concurrently if the connection to the daemon allows it
+        names = []
+        calls = []
         if self.client.module.params["disk_usage"]:
-            self.results["disk_usage"] = self.get_docker_disk_usage_facts()
-
+            names.append("disk_usage")
+            calls.append(GetJSON("/system/df"))
         for docker_object in listed_objects:
             if self.client.module.params[docker_object]:
-                returned_name = docker_object
                 filter_name = f"{docker_object}_filters"
                 filters = clean_dict_booleans_for_docker_api(
                     client.module.params.get(filter_name), allow_sequences=True
                 )
-                self.results[returned_name] = self.get_docker_items_list(
-                    docker_object, filters
-                )
+                names.append(docker_object)
+                calls.append(self.get_docker_items_call(docker_object, filters))
+        replies = get_json_batch(self.client, calls, return_exceptions=True)
+
+        for name, reply in zip(names, replies):
+            if isinstance(reply, BaseException) and not isinstance(reply, APIError):
+                raise reply
+            if name == "disk_usage":
+                self.results["disk_usage"] = self.get_docker_disk_usage_facts(reply)
+            else:
+                self.results[name] = self.get_docker_items_list(name, reply)
 
     def get_docker_host_info(self) -> dict[str, t.Any]:
         try:
@@ -265,22 +280,49 @@ class DockerHostManager(DockerBaseClass):
         except APIError as exc:
             self.client.fail(f"Error inspecting docker host: {exc}")
 
-    def get_docker_disk_usage_facts(self) -> dict[str, t.Any]:
-        try:
-            if self.verbose_output:
-                return self.client.df()
-            return {"LayersSize": self.client.df()["LayersSize"]}
-        except APIError as exc:
-            self.client.fail(f"Error inspecting docker host: {exc}")
+    def get_docker_disk_usage_facts(
+        self, df: dict[str, t.Any] | APIError
+    ) -> dict[str, t.Any]:
+        if isinstance(df, APIError):
+            self.client.fail(f"Error inspecting docker host: {df}")
+        if self.verbose_output:
+            return df
+        return {"LayersSize": df["LayersSize"]}
 
-    def get_docker_items_list(
+    def get_docker_items_call(
         self,
         docker_object: str,
         filters: dict[str, t.Any] | None = None,
-        verbose: bool = False,
-    ) -> list[dict[str, t.Any]]:
-        items = []
+    ) -> GetJSON:
+        if docker_object == "containers":
+            params = {
+                "limit": -1,
+                "all": 1 if self.client.module.params["containers_all"] else 0,
+                "size": 0,
+                "trunc_cmd": 0,
+                "filters": convert_filters(filters) if filters else None,
+            }
+            return GetJSON("/containers/json", params=params)
+        if docker_object == "networks":
+            params = {"filters": convert_filters(filters or {})}
+            return GetJSON("/networks", params=params)
+        if docker_object == "images":
+            params = {
+                "only_ids": 0,
+                "all": 0,
+                "filters": convert_filters(filters) if filters else None,
+            }
+            return GetJSON("/images/json", params=params)
+        params = {
+            "filters": convert_filters(filters) if filters else None,
+        }
+        return GetJSON("/volumes", params=params)
 
+    def get_docker_items_list(
+        self,
+        docker_object: str,
+        items: t.Any,
+    ) -> list[dict[str, t.Any]]:
         header_containers = [
             "Id",
             "Image",
@@ -294,39 +336,12 @@ class DockerHostManager(DockerBaseClass):
         header_images = ["Id", "RepoTags", "Created", "Size"]
         header_networks = ["Id", "Driver", "Name", "Scope"]
 
-        filter_arg = {}
-        if filters:
-            filter_arg["filters"] = filters
-        try:
-            if docker_object == "containers":
-                params = {
-                    "limit": -1,
-                    "all": 1 if self.client.module.params["containers_all"] else 0,
-                    "size": 0,
-                    "trunc_cmd": 0,
-                    "filters": convert_filters(filters) if filters else None,
-                }
-                items = self.client.get_json("/containers/json", params=params)
-            elif docker_object == "networks":
-                params = {"filters": convert_filters(filters or {})}
-                items = self.client.get_json("/networks", params=params)
-            elif docker_object == "images":
-                params = {
-                    "only_ids": 0,
-                    "all": 0,
-                    "filters": convert_filters(filters) if filters else None,
-                }
-                items = self.client.get_json("/images/json", params=params)
-            elif docker_object == "volumes":
-                params = {
-                    "filters": convert_filters(filters) if filters else None,
-                }
-                items = self.client.get_json("/volumes", params=params)
-                items = items["Volumes"]
-        except APIError as exc:
+        if isinstance(items, APIError):
             self.client.fail(
-                f"Error inspecting docker host for object '{docker_object}': {exc}"
+                f"Error inspecting docker host for object '{docker_object}': {items}"
             )
+        if docker_object == "volumes":
+            items = items["Volumes"]
 
         if self.verbose_output:
             return items
@@ -387,7 +402,7 @@ def main() -> None:
         }
 
         DockerHostManager(client, results)
-        client.module.exit_json(**results)
+        client.module.exit_json(**client.add_api_stats(results))
     except DockerException as e:
         client.fail(
             f"An unexpected Docker error occurred: {e}",
@@ -798,7 +798,9 @@ class ImageManager(DockerBaseClass):
                         params={"tag": push_tag},
                     )
                     self.client._raise_for_status(response)
-                    for line in self.client._stream_helper(response, decode=True):
+                    for line in self.client._stream_helper(
+                        response, decode=True, coalesce=True
+                    ):
                         self.log(line, pretty_print=True)
                         if line.get("errorDetail"):
                             raise RuntimeError(line["errorDetail"]["message"])
@@ -990,7 +992,7 @@ class ImageManager(DockerBaseClass):
             context.close()
 
         build_output: list[str] = []
-        for line in self.client._stream_helper(response, decode=True):
+        for line in self.client._stream_helper(response, decode=True, coalesce=True):
             # line = json.loads(line)
             self.log(line, pretty_print=True)
             self._extract_output_line(line, build_output)
@@ -1030,7 +1032,9 @@ class ImageManager(DockerBaseClass):
                 )
                 if LooseVersion(self.client.api_version) >= LooseVersion("1.23"):
                     has_output = True
-                    for line in self.client._stream_helper(res, decode=True):
+                    for line in self.client._stream_helper(
+                        res, decode=True, coalesce=True
+                    ):
                         self.log(line, pretty_print=True)
                         self._extract_output_line(line, load_output)
                 else:
@@ -1222,7 +1226,7 @@ def main() -> None:
         results = {"changed": False, "actions": [], "image": {}}
 
         ImageManager(client, results)
-        client.module.exit_json(**results)
+        client.module.exit_json(**client.add_api_stats(results))
     except DockerException as e:
         client.fail(
             f"An unexpected Docker error occurred: {e}",
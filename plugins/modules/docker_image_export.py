@@ -326,7 +326,7 @@ def main() -> None:
 
     try:
         results = ImageExportManager(client).run()
-        client.module.exit_json(**results)
+        client.module.exit_json(**client.add_api_stats(results))
     except DockerException as e:
         client.fail(
             f"An unexpected Docker error occurred: {e}",
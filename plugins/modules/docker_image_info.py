@@ -230,7 +230,7 @@ def main() -> None:
         results = {"changed": False, "images": []}
 
         ImageManager(client, results)
-        client.module.exit_json(**results)
+        client.module.exit_json(**client.add_api_stats(results))
     except DockerException as e:
         client.fail(
             f"An unexpected Docker error occurred: {e}",
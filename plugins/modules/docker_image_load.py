@@ -131,7 +131,7 @@ class ImageManager(DockerBaseClass):
                 res = self.client._post(
                     self.client._url("/images/load"), data=image_tar, stream=True
                 )
-                for line in self.client._stream_helper(res, decode=True):
+                for line in self.client._stream_helper(res, decode=True, coalesce=True):
                     self.log(line, pretty_print=True)
                     self._extract_output_line(line, load_output)
         except EnvironmentError as exc:
@@ -194,7 +194,7 @@ def main() -> None:
         }
 
         ImageManager(client, results)
-        client.module.exit_json(**results)
+        client.module.exit_json(**client.add_api_stats(results))
     except DockerException as e:
         client.fail(
             f"An unexpected Docker error occurred: {e}",
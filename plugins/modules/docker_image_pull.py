@@ -161,7 +161,7 @@ class ImagePuller(DockerBaseClass):
         if image and self.pull_mode == "not_present":
             if self.platform is None:
                 return results
-            host_info = self.client.info()
+            host_info = self.client.cached_info()
             wanted_platform = normalize_platform_string(
                 self.platform,
                 daemon_os=host_info.get("OSType"),
@@ -216,7 +216,7 @@ def main() -> None:
 
     try:
         results = ImagePuller(client).pull()
-        client.module.exit_json(**results)
+        client.module.exit_json(**client.add_api_stats(results))
     except DockerException as e:
         client.fail(
             f"An unexpected Docker error occurred: {e}",
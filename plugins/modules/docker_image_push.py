@@ -153,7 +153,9 @@ class ImagePusher(DockerBaseClass):
                 params={"tag": self.tag},
             )
             self.client._raise_for_status(response)
-            for line in self.client._stream_helper(response, decode=True):
+            for line in self.client._stream_helper(
+                response, decode=True, coalesce=True
+            ):
                 self.log(line, pretty_print=True)
                 if line.get("errorDetail"):
                     raise RuntimeError(line["errorDetail"]["message"])
@@ -188,7 +190,7 @@ def main() -> None:
 
     try:
         results = ImagePusher(client).push()
-        client.module.exit_json(**results)
+        client.module.exit_json(**client.add_api_stats(results))
     except DockerException as e:
         client.fail(
             f"An unexpected Docker error occurred: {e}",
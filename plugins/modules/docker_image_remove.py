@@ -275,7 +275,7 @@ def main() -> None:
 
     try:
         results = ImageRemover(client).absent()
-        client.module.exit_json(**results)
+        client.module.exit_json(**client.add_api_stats(results))
     except DockerException as e:
         client.fail(
             f"An unexpected Docker error occurred: {e}",
@@ -451,7 +451,7 @@ def main() -> None:
 
         if "actions" in results:
             del results["actions"]
-        client.module.exit_json(**results)
+        client.module.exit_json(**client.add_api_stats(results))
     except DockerException as e:
         client.fail(
             f"An unexpected Docker error occurred: {e}",
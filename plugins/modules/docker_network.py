@@ -869,7 +869,7 @@ def main() -> None:
     sanitize_labels(client.module.params["labels"], "labels", client)
     try:
         cm = DockerNetworkManager(client)
-        client.module.exit_json(**cm.results)
+        client.module.exit_json(**client.add_api_stats(cm.results))
     except DockerException as e:
         client.fail(
             f"An unexpected Docker error occurred: {e}",
@@ -120,9 +120,13 @@ def main() -> None:
         network = client.get_network(client.module.params["name"])
 
         client.module.exit_json(
-            changed=False,
-            exists=bool(network),
-            network=network,
+            **client.add_api_stats(
+                {
+                    "changed": False,
+                    "exists": bool(network),
+                    "network": network,
+                }
+            )
         )
     except DockerException as e:
         client.fail(
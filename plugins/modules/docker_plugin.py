@@ -279,7 +279,9 @@ class DockerPluginManager:
                         stream=True,
                     )
                     self.client._raise_for_status(response)
-                    for dummy in self.client._stream_helper(response, decode=True):
+                    for dummy in self.client._stream_helper(
+                        response, decode=True, coalesce=True
+                    ):
                         pass
                     # Inspect and configure plugin
                     self.existing_plugin = self.client.get_json(
@@ -438,7 +440,7 @@ def main() -> None:
 
     try:
         cm = DockerPluginManager(client)
-        client.module.exit_json(**cm.result)
+        client.module.exit_json(**client.add_api_stats(cm.result))
     except DockerException as e:
         client.fail(
             f"An unexpected docker error occurred: {e}",
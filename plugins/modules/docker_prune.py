@@ -351,7 +351,7 @@ def main() -> None:
                     changed = True
 
         result["changed"] = changed
-        client.module.exit_json(**result)
+        client.module.exit_json(**client.add_api_stats(result))
     except DockerException as e:
         client.fail(
             f"An unexpected Docker error occurred: {e}",
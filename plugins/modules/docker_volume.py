@@ -336,7 +336,7 @@ def main() -> None:
 
     try:
         cm = DockerVolumeManager(client)
-        client.module.exit_json(**cm.results)
+        client.module.exit_json(**client.add_api_stats(cm.results))
     except DockerException as e:
         client.fail(
             f"An unexpected Docker error occurred: {e}",
@@ -106,9 +106,13 @@ def main() -> None:
         volume = get_existing_volume(client, client.module.params["name"])
 
         client.module.exit_json(
-            changed=False,
-            exists=bool(volume),
-            volume=volume,
+            **client.add_api_stats(
+                {
+                    "changed": False,
+                    "exists": bool(volume),
+                    "volume": volume,
+                }
+            )
         )
     except DockerException as e:
         client.fail(
@@ -7,6 +7,7 @@
 
 from __future__ import annotations
 
+import os
 import typing as t
 
 from ansible.errors import AnsibleConnectionFailure
@@ -25,11 +26,17 @@ if t.TYPE_CHECKING:
 
 class AnsibleDockerClient(AnsibleDockerClientBase):
     def __init__(
-        self, plugin: AnsiblePlugin, min_docker_api_version: str | None = None
+        self,
+        plugin: AnsiblePlugin,
+        min_docker_api_version: str | None = None,
+        metadata_cache: bool = False,
     ) -> None:
         self.plugin = plugin
         self.display = Display()
-        super().__init__(min_docker_api_version=min_docker_api_version)
+        super().__init__(
+            min_docker_api_version=min_docker_api_version,
+            metadata_cache=metadata_cache,
+        )
 
     def fail(self, msg: str, **kwargs: t.Any) -> t.NoReturn:
         if kwargs:
@@ -51,3 +58,41 @@ class AnsibleDockerClient(AnsibleDockerClientBase):
 
     def _get_params(self) -> dict[str, t.Any]:
         return {option: self.plugin.get_option(option) for option in DOCKER_COMMON_ARGS}
+
+
+_SHARED_CLIENTS: dict[t.Hashable, tuple[int, AnsibleDockerClient]] = {}
+
+
+def get_shared_client(
+    plugin: AnsiblePlugin,
+    min_docker_api_version: str | None = None,
+    metadata_cache: bool = False,
+) -> AnsibleDockerClient:
+    """
+    Return a client for the Docker daemon configured by the options of
+    ``plugin``.
+
+    All plugins in this process whose daemon URL, TLS, and other connection
+    options are the same share one client, so that the API version is
+    negotiated and a connection pool is created only once. Clients created
+    before the process was forked are not reused, since their connections
+    are shared with the parent process.
+    """
+    key = (
+        min_docker_api_version,
+        metadata_cache,
+        tuple(
+            (option, plugin.get_option(option)) for option in sorted(DOCKER_COMMON_ARGS)
+        ),
+    )
+    pid = os.getpid()
+    entry = _SHARED_CLIENTS.get(key)
+    if entry is not None and entry[0] == pid:
+        return entry[1]
+    client = AnsibleDockerClient(
+        plugin,
+        min_docker_api_version=min_docker_api_version,
+        metadata_cache=metadata_cache,
+    )
+    _SHARED_CLIENTS[key] = (pid, client)
+    return client
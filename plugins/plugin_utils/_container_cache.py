@@ -0,0 +1,132 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# Note that this module util is **PRIVATE** to the collection. It can have breaking changes at any time.
+# Do not use this from other collections or standalone plugins/modules!
+
+"""
+File-based caches for connection plugins.
+
+Ansible creates a new connection plugin instance for every task, in a new
+worker process. Information the connection plugins look up about a container
+or the Docker CLI is therefore stored in the user's cache directory, so that
+all connections of the controller can re-use it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+import typing as t
+
+from ansible_collections.community.docker.plugins.module_utils._daemon_cache import (
+    get_cache_dir,
+    get_cache_ttl,
+    read_cache_file,
+    write_cache_file,
+)
+
+_CACHE_FORMAT = 1
+
+
+def _get_path(kind: str, key: t.Any, cache_dir: str | None) -> str:
+    name = hashlib.sha256(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir or get_cache_dir(), kind, name + ".json")
+
+
+class ContainerFacts:
+    """
+    Facts about one run of a container, like the user and group IDs of its
+    users.
+
+    The facts are stored per container ID and start time (``State.StartedAt``
+    from the container's inspection result), so that they are discarded when
+    the container is restarted or re-created.
+    """
+
+    def __init__(
+        self, container_id: str, started_at: str, cache_dir: str | None = None
+    ) -> None:
+        self.container_id = container_id
+        self.started_at = started_at
+        self.path = _get_path("containers", container_id, cache_dir)
+        self._facts = self._load()
+
+    def _load(self) -> dict[str, t.Any]:
+        data = read_cache_file(self.path)
+        if (
+            not isinstance(data, dict)
+            or data.get("format") != _CACHE_FORMAT
+            or data.get("container_id") != self.container_id
+            or data.get("started_at") != self.started_at
+            or not isinstance(data.get("facts"), dict)
+        ):
+            return {}
+        return data["facts"]
+
+    def _update(self, name: str, key: str, value: t.Any) -> None:
+        # Other processes might have added facts in the meantime
+        self._facts = self._load()
+        entry = self._facts.get(name)
+        if not isinstance(entry, dict):
+            entry = self._facts[name] = {}
+        entry[key] = value
+        write_cache_file(
+            self.path,
+            {
+                "format": _CACHE_FORMAT,
+                "container_id": self.container_id,
+                "started_at": self.started_at,
+                "facts": self._facts,
+            },
+        )
+
+    def get_ids(self, user: str | None) -> tuple[int, int] | None:
+        """
+        Return the user and group ID of ``user``, or of the container's
+        default user if ``user`` is ``None``.
+        """
+        ids = (self._facts.get("ids") or {}).get(user or "")
+        if (
+            not isinstance(ids, list)
+            or len(ids) != 2
+            or not all(isinstance(value, int) for value in ids)
+        ):
+            return None
+        return ids[0], ids[1]
+
+    def set_ids(self, user: str | None, ids: tuple[int, int]) -> None:
+        self._update("ids", user or "", list(ids))
+
+
+def get_cached_docker_version(
+    key: t.Any, cache_dir: str | None = None, ttl: int | None = None
+) -> str | None:
+    """
+    Return the Docker version stored for the Docker CLI invocation described
+    by ``key``, unless it is older than the TTL.
+    """
+    data = read_cache_file(_get_path("cli", key, cache_dir))
+    if (
+        not isinstance(data, dict)
+        or data.get("format") != _CACHE_FORMAT
+        or not isinstance(data.get("time"), (int, float))
+        or not isinstance(data.get("version"), str)
+    ):
+        return None
+    ttl = get_cache_ttl() if ttl is None else ttl
+    if not 0 <= time.time() - data["time"] <= ttl:
+        return None
+    return data["version"]
+
+
+def set_cached_docker_version(
+    key: t.Any, version: str, cache_dir: str | None = None
+) -> None:
+    write_cache_file(
+        _get_path("cli", key, cache_dir),
+        {"format": _CACHE_FORMAT, "time": time.time(), "version": version},
+    )
@@ -0,0 +1,313 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# Note that this module util is **PRIVATE** to the collection. It can have breaking changes at any time.
+# Do not use this from other collections or standalone plugins/modules!
+
+from __future__ import annotations
+
+import abc
+import os
+import selectors
+import shlex
+import subprocess
+import typing as t
+import uuid
+
+from ansible.errors import AnsibleConnectionFailure
+
+from ansible_collections.community.docker.plugins.module_utils._api.utils import (
+    socket as docker_socket,
+)
+from ansible_collections.community.docker.plugins.plugin_utils._socket_handler import (
+    DockerSocketHandler,
+)
+
+if t.TYPE_CHECKING:
+    from ansible.utils.display import Display
+    from requests import Response
+
+    from ansible_collections.community.docker.plugins.module_utils._api.api.client import (
+        APIClient,
+    )
+
+
+class PersistentShellBase(abc.ABC):
+    """
+    A shell that keeps running, and runs commands sent to it one after the
+    other.
+
+    Every command runs in its own process, with the output of the command as
+    stdout and stderr, and its standard input either empty or fed from a here
+    document. After the command, the shell prints a random marker and the
+    exit code to stdout, and the marker to stderr.
+
+    Subclasses start the shell and move data to and from it.
+    """
+
+    def __init__(self, description: str) -> None:
+        self._description = description
+        self._stdout = bytearray()
+        self._stderr = bytearray()
+
+    @staticmethod
+    def can_send(in_data: bytes | None) -> bool:
+        """
+        Whether ``in_data`` can be passed unchanged through a here document.
+        """
+        return in_data is None or (in_data.endswith(b"\n") and b"\0" not in in_data)
+
+    def _add_block(self, stream_id: int, data: bytes) -> None:
+        if stream_id == docker_socket.STDOUT:
+            self._stdout += data
+        elif stream_id == docker_socket.STDERR:
+            self._stderr += data
+        else:
+            raise ValueError(f"{stream_id} is not a valid stream ID")
+
+    @abc.abstractmethod
+    def _is_running(self) -> bool:
+        pass
+
+    @abc.abstractmethod
+    def _start(self) -> None:
+        pass
+
+    @abc.abstractmethod
+    def _send(self, data: bytes) -> None:
+        pass
+
+    @abc.abstractmethod
+    def _receive(self) -> None:
+        """
+        Wait for output of the shell, and pass it to ``_add_block()``. Raise
+        ``EOFError`` if the shell has exited.
+        """
+
+    @staticmethod
+    def _build_script(command: list[str], in_data: bytes | None, token: bytes) -> bytes:
+        script = shlex.join(command).encode("utf-8")
+        if in_data is None:
+            script += b" </dev/null\n"
+        else:
+            delimiter = b"ANSIBLE_EOF_" + token
+            script += b" <<'" + delimiter + b"'\n" + in_data + delimiter + b"\n"
+        return (
+            script
+            + b"__ansible_rc=$?\n"
+            + b"printf '%s %d\\n' '"
+            + token
+            + b'\' "$__ansible_rc"\n'
+            + b"printf '%s\\n' '"
+            + token
+            + b"' >&2\n"
+        )
+
+    def _find_result(self, token: bytes) -> tuple[int, bytes, bytes] | None:
+        stdout_marker = self._stdout.find(token + b" ")
+        if stdout_marker < 0:
+            return None
+        stdout_end = self._stdout.find(b"\n", stdout_marker)
+        stderr_marker = self._stderr.find(token + b"\n")
+        if stdout_end < 0 or stderr_marker < 0:
+            return None
+        rc = int(self._stdout[stdout_marker + len(token) + 1 : stdout_end])
+        stdout = bytes(self._stdout[:stdout_marker])
+        stderr = bytes(self._stderr[:stderr_marker])
+        del self._stdout[: stdout_end + 1]
+        del self._stderr[: stderr_marker + len(token) + 1]
+        return rc, stdout, stderr
+
+    def run(
+        self, command: list[str], in_data: bytes | None = None
+    ) -> tuple[int, bytes, bytes]:
+        """
+        Run ``command`` with ``in_data`` as its standard input, and return
+        the exit code, stdout and stderr. The shell is started if needed.
+        """
+        if not self.can_send(in_data):
+            raise ValueError("The input must end with a newline and not contain NUL")
+        if not self._is_running():
+            self.close()
+            self._stdout.clear()
+            self._stderr.clear()
+            self._start()
+
+        token = f"__ANSIBLE_{uuid.uuid4().hex}__".encode("ascii")
+        while in_data is not None and token in in_data:
+            token = f"__ANSIBLE_{uuid.uuid4().hex}__".encode("ascii")
+        try:
+            self._send(self._build_script(command, in_data, token))
+            while True:
+                result = self._find_result(token)
+                if result is not None:
+                    return result
+                self._receive()
+        except (EOFError, OSError) as exc:
+            self.close()
+            raise AnsibleConnectionFailure(
+                f"The persistent shell {self._description} exited unexpectedly"
+            ) from exc
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """
+        End the shell by closing its standard input.
+        """
+
+
+class PersistentShell(PersistentShellBase):
+    """
+    A persistent shell in an exec instance of a container. Running a command
+    needs no API requests once the shell is started.
+
+    ``exec_data`` is the request body used to create the exec instance; it
+    must attach stdin, stdout and stderr without a TTY.
+    """
+
+    def __init__(
+        self,
+        client: APIClient,
+        container: str,
+        exec_data: dict[str, t.Any],
+        display: Display,
+    ) -> None:
+        super().__init__(f'in container "{container}"')
+        self.client = client
+        self.container = container
+        self._exec_data = exec_data
+        self._display = display
+        self._handler: DockerSocketHandler | None = None
+        self._response: Response | None = None
+
+    def _is_running(self) -> bool:
+        return self._handler is not None and not self._handler.is_eof()
+
+    def _start(self) -> None:
+        exec_id = self.client.post_json_to_json(
+            "/containers/{0}/exec", self.container, data=self._exec_data
+        )["Id"]
+        sock, self._response = self.client.post_json_to_stream_socket(
+            "/exec/{0}/start", exec_id, data={"Tty": False, "Detach": False}
+        )
+        self._handler = DockerSocketHandler(
+            self._display, sock, container=self.container
+        )
+        self._handler.set_block_done_callback(self._add_block)
+
+    def _send(self, data: bytes) -> None:
+        assert self._handler is not None
+        self._handler.write(data)
+
+    def _receive(self) -> None:
+        assert self._handler is not None
+        if self._handler.is_eof():
+            raise EOFError()
+        self._handler.select()
+
+    def close(self) -> None:
+        handler, self._handler = self._handler, None
+        response, self._response = self._response, None
+        if handler is not None:
+            try:
+                handler.end_of_writing()
+            except OSError:
+                pass
+            handler.close()
+        if response is not None:
+            response.close()
+
+
+class ProcessShell(PersistentShellBase):
+    """
+    A persistent shell in a local process, for example a shell started by
+    ``nsenter`` in the namespaces of another process.
+    """
+
+    def __init__(self, args: list[str], description: str) -> None:
+        super().__init__(description)
+        self._args = args
+        self._process: subprocess.Popen[bytes] | None = None
+        self._selector: selectors.BaseSelector | None = None
+        self._write_buffer = bytearray()
+        self._waiting_for_stdin = False
+
+    def _is_running(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    def _start(self) -> None:
+        self._process = subprocess.Popen(  # pylint: disable=consider-using-with
+            self._args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=0,
+        )
+        assert self._process.stdin is not None
+        assert self._process.stdout is not None
+        assert self._process.stderr is not None
+        self._selector = selectors.DefaultSelector()
+        for stream, stream_id in (
+            (self._process.stdout, docker_socket.STDOUT),
+            (self._process.stderr, docker_socket.STDERR),
+        ):
+            os.set_blocking(stream.fileno(), False)
+            self._selector.register(stream, selectors.EVENT_READ, stream_id)
+        os.set_blocking(self._process.stdin.fileno(), False)
+        self._write_buffer.clear()
+        self._waiting_for_stdin = False
+
+    def _flush(self) -> None:
+        assert self._process is not None and self._process.stdin is not None
+        assert self._selector is not None
+        stdin = self._process.stdin
+        while self._write_buffer:
+            try:
+                written = os.write(stdin.fileno(), self._write_buffer)
+            except BlockingIOError:
+                break
+            del self._write_buffer[:written]
+        # Wait for the shell to read more of its script while it is blocked
+        if self._write_buffer and not self._waiting_for_stdin:
+            self._selector.register(stdin, selectors.EVENT_WRITE)
+            self._waiting_for_stdin = True
+        elif not self._write_buffer and self._waiting_for_stdin:
+            self._selector.unregister(stdin)
+            self._waiting_for_stdin = False
+
+    def _send(self, data: bytes) -> None:
+        self._write_buffer += data
+        self._flush()
+
+    def _receive(self) -> None:
+        assert self._selector is not None
+        for key, dummy_event in self._selector.select():
+            if key.data is None:
+                self._flush()
+                continue
+            data = os.read(key.fd, 65536)
+            if not data:
+                raise EOFError()
+            self._add_block(key.data, data)
+
+    def close(self) -> None:
+        process, self._process = self._process, None
+        selector, self._selector = self._selector, None
+        if selector is not None:
+            selector.close()
+        if process is None:
+            return
+        assert process.stdin is not None
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        for stream in (process.stdout, process.stderr):
+            if stream is not None:
+                stream.close()
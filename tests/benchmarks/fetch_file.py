@@ -0,0 +1,208 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Benchmark for fetching a large file from a container with ``fetch_file()``.
+
+Usage::
+
+    python tests/benchmarks/fetch_file.py [SIZE_MIB [CHUNK_KIB]]
+
+A fake daemon on a Unix socket answers every request with a tar archive
+containing one file of SIZE_MIB MiB (default: 2048), sent with chunked
+encoding in chunks of CHUNK_KIB KiB (default: 32, like dockerd). The daemon
+runs in the same process, so the numbers are only useful for comparing the
+variants with each other. The file is fetched with the minimal HTTP client
+and, if installed, with requests:
+
+- ``legacy``: the previous generator adapter, which copies the rest of the
+  current chunk on every read;
+- ``generator``: the current generator adapter on top of ``get_raw_stream()``;
+- ``fetch``: ``fetch_file()``, which reads the response body directly.
+
+The legacy adapter gets slow when the chunks are large; pass a smaller size
+to compare all three quickly. The collection must be importable as
+``ansible_collections.community.docker``.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import shutil
+import socket
+import sys
+import tarfile
+import tempfile
+import threading
+import time
+import typing as t
+
+from ansible_collections.community.docker.plugins.module_utils._api.api.client import (
+    APIClient,
+)
+from ansible_collections.community.docker.plugins.module_utils._copy import (
+    _stream_generator_to_fileobj,
+    fetch_file,
+)
+
+if t.TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+
+class LegacyFileobj(io.RawIOBase):
+    def __init__(self, stream: Iterator[bytes]) -> None:
+        self._stream = stream
+        self._buf = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def _readinto_from_buf(self, b: t.Any, index: int, length: int) -> int:
+        cpy = min(length - index, len(self._buf))
+        if cpy:
+            b[index : index + cpy] = self._buf[:cpy]
+            self._buf = self._buf[cpy:]
+            index += cpy
+        return index
+
+    def readinto(self, b: t.Any) -> int:
+        length = len(b)
+        index = self._readinto_from_buf(b, 0, length)
+        if index == length:
+            return index
+        try:
+            self._buf += next(self._stream)
+        except StopIteration:
+            return index
+        return self._readinto_from_buf(b, index, length)
+
+
+def _chunk(data: bytes) -> bytes:
+    return f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n"
+
+
+def _serve(connection: socket.socket, size: int, chunk_size: int) -> None:
+    info = tarfile.TarInfo("file")
+    info.size = size
+    header = info.tobuf()
+    zeros = _chunk(tarfile.NUL * chunk_size)
+    buffer = b""
+    with connection:
+        while True:
+            while b"\r\n\r\n" not in buffer:
+                data = connection.recv(65536)
+                if not data:
+                    return
+                buffer += data
+            buffer = buffer[buffer.index(b"\r\n\r\n") + 4 :]
+            connection.sendall(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/x-tar\r\n"
+                b"Transfer-Encoding: chunked\r\n\r\n" + _chunk(header)
+            )
+            left = size
+            while left >= chunk_size:
+                connection.sendall(zeros)
+                left -= chunk_size
+            trailer = tarfile.NUL * (left + (-left % tarfile.BLOCKSIZE))
+            trailer += tarfile.NUL * (2 * tarfile.BLOCKSIZE)
+            connection.sendall(_chunk(trailer) + b"0\r\n\r\n")
+
+
+def start_daemon(path: str, size: int, chunk_size: int) -> socket.socket:
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen(8)
+
+    def run() -> None:
+        while True:
+            try:
+                connection, dummy = server.accept()
+            except OSError:
+                return
+            threading.Thread(
+                target=_serve, args=(connection, size, chunk_size), daemon=True
+            ).start()
+
+    threading.Thread(target=run, daemon=True).start()
+    return server
+
+
+def fetch_with_adapter(
+    client: APIClient,
+    out_path: str,
+    adapter: Callable[[Iterator[bytes]], t.IO[bytes]],
+) -> None:
+    stream = client.get_raw_stream(
+        "/containers/{0}/archive",
+        "container",
+        params={"path": "/file"},
+        headers={"Accept-Encoding": "identity"},
+    )
+    with tarfile.open(fileobj=adapter(stream), mode="r|") as tar:
+        for member in tar:
+            reader = tar.extractfile(member)
+            assert reader is not None
+            with reader as in_f, open(out_path, "wb") as out_f:
+                shutil.copyfileobj(in_f, out_f)
+
+
+def legacy(client: APIClient, out_path: str) -> None:
+    fetch_with_adapter(
+        client, out_path, lambda stream: io.BufferedReader(LegacyFileobj(stream))
+    )
+
+
+def generator(client: APIClient, out_path: str) -> None:
+    fetch_with_adapter(client, out_path, _stream_generator_to_fileobj)
+
+
+def fetch(client: APIClient, out_path: str) -> None:
+    fetch_file(client, "container", "/file", out_path)
+
+
+def main(argv: list[str]) -> int:
+    size = int(argv[1]) * 1024 * 1024 if len(argv) > 1 else 2 * 1024**3
+    chunk_size = int(argv[2]) * 1024 if len(argv) > 2 else 32 * 1024
+    directory = tempfile.mkdtemp()
+    socket_path = os.path.join(directory, "docker.sock")
+    out_path = os.path.join(directory, "out")
+    server = start_daemon(socket_path, size, chunk_size)
+    try:
+        transports = [("minimal HTTP client", True)]
+        try:
+            import requests  # noqa: F401, pylint: disable=unused-import
+        except ImportError:
+            print("requests is not installed, skipping it")
+        else:
+            transports.append(("requests", False))
+        print(
+            f"File: {size / 1024 / 1024:.0f} MiB, chunks of {chunk_size / 1024:.0f} KiB"
+        )
+        for name, use_minimal_http in transports:
+            print(f"{name}:")
+            client = APIClient(
+                base_url=f"unix://{socket_path}",
+                version="1.45",
+                use_minimal_http=use_minimal_http,
+            )
+            for func in (legacy, generator, fetch):
+                start = time.perf_counter()
+                func(client, out_path)
+                duration = time.perf_counter() - start
+                assert os.path.getsize(out_path) == size
+                os.unlink(out_path)
+                print(
+                    f"  {func.__name__:12} {duration:8.2f} s"
+                    f"  ({size / duration / 1024 / 1024:8.1f} MiB/s)"
+                )
+            client.close()
+    finally:
+        server.close()
+        shutil.rmtree(directory)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,117 @@
+# Copyright (c) 2025, Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Microbenchmark for decoding the JSON progress stream of ``POST /images/create``.
+
+Usage::
+
+    python tests/benchmarks/json_stream.py [RECORDING]
+
+RECORDING is a file with the raw response body of an image pull, for example
+recorded with::
+
+    curl --unix-socket /var/run/docker.sock -X POST \\
+        'http://localhost/images/create?fromImage=...&tag=...' > RECORDING
+
+If no recording is provided, a synthetic stream with 50000 progress lines is
+generated. The stream is replayed with one chunk per line (as sent by the
+daemon), in 64 KiB blocks (as produced by chunk coalescing), and in 1 MiB
+blocks (as read from a daemon that sends faster than the module decodes).
+
+The collection must be importable as ``ansible_collections.community.docker``.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import sys
+import time
+import typing as t
+
+from ansible_collections.community.docker.plugins.module_utils._api.utils.json_stream import (
+    JSONStreamDecoder,
+    json_splitter,
+    json_stream,
+    split_buffer,
+)
+
+
+def synthesize(lines: int = 50000) -> bytes:
+    rng = random.Random(42)
+    layers = [f"{rng.getrandbits(48):012x}" for dummy in range(12)]
+    result = []
+    for index in range(lines):
+        layer = layers[index % len(layers)]
+        current = rng.randrange(1, 30000000)
+        total = current + rng.randrange(1, 30000000)
+        result.append(
+            json.dumps(
+                {
+                    "status": "Downloading" if index % 3 else "Extracting",
+                    "progressDetail": {"current": current, "total": total},
+                    "progress": f"[=======>      ]  {current / 1e6:.1f}MB/{total / 1e6:.1f}MB",
+                    "id": layer,
+                }
+            )
+        )
+    return ("\r\n".join(result) + "\r\n").encode("utf-8")
+
+
+def split_lines(data: bytes) -> list[bytes]:
+    return data.splitlines(keepends=True)
+
+
+def split_blocks(data: bytes, size: int = 64 * 1024) -> list[bytes]:
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def legacy(chunks: list[bytes]) -> list[t.Any]:
+    return list(split_buffer(iter(chunks), json_splitter, json.JSONDecoder().decode))
+
+
+def incremental(chunks: list[bytes]) -> list[t.Any]:
+    return list(json_stream(iter(chunks)))
+
+
+def incremental_no_orjson(chunks: list[bytes]) -> list[t.Any]:
+    decoder = JSONStreamDecoder(use_orjson=False)
+    result = []
+    for chunk in chunks:
+        result.extend(decoder.feed(chunk))
+    result.extend(decoder.finish())
+    return result
+
+
+def measure(
+    func: t.Callable[[list[bytes]], list[t.Any]], chunks: list[bytes]
+) -> tuple[float, int]:
+    start = time.perf_counter()
+    count = len(func(chunks))
+    return time.perf_counter() - start, count
+
+
+def main(argv: list[str]) -> int:
+    if len(argv) > 1:
+        with open(argv[1], "rb") as f:
+            data = f.read()
+    else:
+        data = synthesize()
+    lines = data.count(b"\n")
+    print(f"Stream: {len(data)} bytes, {lines} lines")
+    for name, chunks in (
+        ("one chunk per line", split_lines(data)),
+        ("64 KiB blocks", split_blocks(data)),
+        ("1 MiB blocks", split_blocks(data, 1024 * 1024)),
+    ):
+        print(f"{name} ({len(chunks)} chunks):")
+        for func in (legacy, incremental_no_orjson, incremental):
+            duration, count = measure(func, chunks)
+            print(f"  {func.__name__:24} {duration * 1000:10.1f} ms  ({count} objects)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
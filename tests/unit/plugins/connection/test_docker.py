@@ -4,11 +4,13 @@
 
 from __future__ import annotations
 
+import sys
 import typing as t
 import unittest
 from io import StringIO
 from unittest import mock
 
+import pytest
 from ansible.errors import AnsibleError
 from ansible.playbook.play_context import PlayContext
 from ansible.plugins.loader import connection_loader
@@ -83,3 +85,91 @@ class TestDockerConnectionClass(unittest.TestCase):
             "^Docker version check (.*?) failed:",
             self.dc._get_actual_user,
         )
+
+
+FAKE_DOCKER = """#!{python}
+import os
+import sys
+
+# Run the command passed to 'docker exec ... -i <container> <command>' locally
+args = sys.argv[1:]
+command = args[args.index("-i") + 2 :]
+name = "tar" if "exec tar" in " ".join(command) else command[0]
+if name == "tar" and os.environ.get("FAKE_DOCKER_NO_TAR"):
+    sys.exit(127)
+with open(os.environ["FAKE_DOCKER_LOG"], "a") as f:
+    f.write(name + "\\n")
+os.execvp(command[0], command)
+"""
+
+
+@pytest.fixture
+def batching_connection(tmp_path: t.Any, monkeypatch: pytest.MonkeyPatch) -> t.Any:
+    docker = tmp_path / "docker"
+    docker.write_text(FAKE_DOCKER.format(python=sys.executable))
+    docker.chmod(0o755)
+    monkeypatch.setenv("FAKE_DOCKER_LOG", str(tmp_path / "log"))
+    connection = connection_loader.get(
+        "community.docker.docker",
+        PlayContext(),
+        StringIO(),
+        docker_command=str(docker),
+    )
+    connection.set_options(direct={"batch_put_file": True, "remote_addr": "foo"})
+    return connection
+
+
+def _put_files(connection: t.Any, tmp_path: t.Any) -> list[t.Any]:
+    targets = []
+    for index, content in enumerate([b"module", b"", b"args\n"]):
+        source = tmp_path / f"source{index}"
+        source.write_bytes(content)
+        target = tmp_path / "remote" / f"file{index}"
+        connection.put_file(str(source), str(target))
+        # The caller can remove the file right after putting it
+        source.unlink()
+        targets.append((target, content))
+    return targets
+
+
+def test_batch_put_file(tmp_path: t.Any, batching_connection: t.Any) -> None:
+    (tmp_path / "remote").mkdir()
+    targets = _put_files(batching_connection, tmp_path)
+    assert not any(target.exists() for target, dummy in targets)
+
+    batching_connection.exec_command("true")
+    for target, content in targets:
+        assert target.read_bytes() == content
+    assert (tmp_path / "log").read_text().split() == ["tar", "/bin/sh"]
+
+
+def test_batch_put_file_without_tar(
+    tmp_path: t.Any, batching_connection: t.Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("FAKE_DOCKER_NO_TAR", "1")
+    (tmp_path / "remote").mkdir()
+    targets = _put_files(batching_connection, tmp_path)
+
+    batching_connection.close()
+    for target, content in targets:
+        assert target.read_bytes() == content
+    assert (tmp_path / "log").read_text().split() == ["/bin/sh"] * 3
+
+
+def test_batch_put_file_missing_directory(
+    tmp_path: t.Any, batching_connection: t.Any
+) -> None:
+    (tmp_path / "remote").mkdir()
+    source = tmp_path / "source"
+    source.write_bytes(b"module")
+    batching_connection.put_file(str(source), str(tmp_path / "remote" / "file"))
+    missing = tmp_path / "missing" / "file"
+    batching_connection.put_file(str(source), str(missing))
+
+    with pytest.raises(AnsibleError) as exc:
+        batching_connection.exec_command("true")
+    # Only the file that could not be written is named, and the directory
+    # is not created like dd would not create it
+    assert str(exc.value).startswith(f"failed to transfer file {source} to {missing}:")
+    assert f"{tmp_path / 'remote' / 'file'}:" not in str(exc.value)
+    assert not missing.parent.exists()
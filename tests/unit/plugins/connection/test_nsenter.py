@@ -0,0 +1,66 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import typing as t
+from io import StringIO
+from unittest import mock
+
+import pytest
+from ansible.playbook.play_context import PlayContext
+from ansible.plugins.loader import connection_loader
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture
+def connection() -> Iterator[t.Any]:
+    conn = connection_loader.get("community.docker.nsenter", PlayContext(), StringIO())
+    conn.set_options(direct={"persistent_shell": True})
+    # Run the commands locally instead of in the namespaces of PID 1
+    with mock.patch.object(conn, "_get_nsenter_command", return_value=[]):
+        conn._connect()
+        yield conn
+        conn.close()
+
+
+def test_persistent_shell(connection: t.Any) -> None:
+    assert connection.exec_command("echo hello") == (0, b"hello\n", b"")
+    shell = connection._persistent_shell
+    assert shell is not None
+    assert connection.exec_command("cat; exit 2", in_data=b"data\n") == (
+        2,
+        b"data\n",
+        b"",
+    )
+    assert connection._persistent_shell is shell
+
+    # Input the here document cannot carry runs with its own process
+    assert connection.exec_command("cat", in_data=b"no newline") == (
+        0,
+        b"no newline",
+        b"",
+    )
+
+    connection.close()
+    assert connection._persistent_shell is None
+    assert connection.exec_command("echo again")[1] == b"again\n"
+
+
+@pytest.mark.parametrize(
+    "content", [b"", b"text\n", b"no newline", b"binary\0data\n", bytes(range(256))]
+)
+def test_persistent_shell_files(
+    connection: t.Any, tmp_path: t.Any, content: bytes
+) -> None:
+    local = tmp_path / "local"
+    remote = tmp_path / "remote"
+    fetched = tmp_path / "fetched"
+    local.write_bytes(content)
+    connection.put_file(str(local), str(remote))
+    assert remote.read_bytes() == content
+    connection.fetch_file(str(remote), str(fetched))
+    assert fetched.read_bytes() == content
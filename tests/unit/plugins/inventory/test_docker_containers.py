@@ -99,6 +99,10 @@ def create_get_option(
 
 
 class FakeClient:
+    # Not a connection that AsyncAPIClient supports, so that batches are
+    # processed with get_json()
+    _connection_url = "ssh://fake"
+
     def __init__(self, *hosts: dict[str, t.Any]) -> None:
         self.get_results: dict[str, t.Any] = {}
         list_reply: list[dict[str, t.Any]] = []
@@ -465,6 +465,41 @@ class UnixSocketStreamTest(unittest.TestCase):
 
             assert list(stream) == [str(i).encode() for i in range(50)]
 
+    @pytest.mark.skipif(constants.IS_WINDOWS_PLATFORM, reason="Unix only")
+    def test_stream_helper_coalesce(self) -> None:
+        self.request_handler = self.early_response_sending_handler
+        lines = []
+        for i in range(0, 50):
+            line = f'{{"line": {i}}}\r\n'.encode()
+            lines += [f"{len(line):x}".encode(), line]
+        lines.append(b"0")
+        lines.append(b"")
+
+        self.response = (
+            b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+        ) + b"\r\n".join(lines)
+
+        with APIClient(
+            base_url="http+unix://" + self.socket_file,
+            version=DEFAULT_DOCKER_API_VERSION,
+        ) as client:
+            for i in range(5):
+                try:
+                    response = client._post(
+                        client._url("/images/create"),
+                        headers={"Content-Type": "application/json"},
+                        data=b"...",
+                        stream=True,
+                    )
+                    break
+                except requests.ConnectionError as e:
+                    if i == 4:
+                        raise e
+
+            assert list(client._stream_helper(response, decode=True)) == [
+                {"line": i} for i in range(50)
+            ]
+
 
 @pytest.mark.skip(
     "This test requires starting a networking server and tries to access it. "
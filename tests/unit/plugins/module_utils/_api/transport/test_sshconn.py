@@ -8,12 +8,23 @@
 
 from __future__ import annotations
 
+import os
+import struct
+import subprocess
+import sys
 import unittest
+from unittest import mock
 
 from ansible_collections.community.docker.plugins.module_utils._api.transport.sshconn import (
     SSHHTTPAdapter,
     SSHSocket,
 )
+from ansible_collections.community.docker.plugins.module_utils._api.utils.socket import (
+    STDERR,
+    STDOUT,
+    FrameReader,
+    consume_frames,
+)
 
 
 class SSHAdapterTest(unittest.TestCase):
@@ -49,3 +60,79 @@ class SSHAdapterTest(unittest.TestCase):
         assert c.host == "hostname"
         assert c.port == "22"
         assert c.user is None
+
+    @staticmethod
+    def test_ssh_control_persist() -> None:
+        with mock.patch(
+            "ansible_collections.community.docker.plugins.module_utils._api.transport.sshconn.subprocess.Popen"
+        ) as popen, mock.patch("os.makedirs") as makedirs:
+            SSHSocket(host="user@hostname:22", control_persist=30).connect()
+        control_path_dir = os.path.expanduser("~/.ansible/cp")
+        makedirs.assert_called_once_with(control_path_dir, mode=0o700, exist_ok=True)
+        assert popen.call_args[0][0] == [
+            "ssh",
+            "-l",
+            "user",
+            "-p",
+            "22",
+            "-o",
+            "ControlMaster=auto",
+            "-o",
+            "ControlPersist=30s",
+            "-o",
+            f"ControlPath={control_path_dir}/%C",
+            "--",
+            "hostname",
+            "docker system dial-stdio",
+        ]
+
+    @staticmethod
+    def test_ssh_without_control_persist() -> None:
+        with mock.patch(
+            "ansible_collections.community.docker.plugins.module_utils._api.transport.sshconn.subprocess.Popen"
+        ) as popen:
+            SSHSocket(host="hostname").connect()
+        assert popen.call_args[0][0] == [
+            "ssh",
+            "--",
+            "hostname",
+            "docker system dial-stdio",
+        ]
+
+    @staticmethod
+    def test_ssh_adapter_passes_control_persist() -> None:
+        adapter = SSHHTTPAdapter(
+            base_url="ssh://hostname", shell_out=True, control_persist=30
+        )
+        pool = adapter.get_connection("http+docker://ssh/version")
+        assert pool._new_conn().control_persist == 30
+
+    @staticmethod
+    def test_ssh_socket_frame_reader() -> None:
+        data = (
+            struct.pack(">BxxxL", STDOUT, 5)
+            + b"hello"
+            + struct.pack(">BxxxL", STDERR, 4)
+            + b"oops"
+        )
+        sock = SSHSocket(host="hostname")
+        # Stand-in for the ssh process, which writes the daemon's response
+        sock.proc = subprocess.Popen(
+            [
+                sys.executable,
+                "-c",
+                "import sys; sys.stdout.buffer.write(sys.stdin.buffer.read())",
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        try:
+            assert sock.proc.stdin is not None
+            sock.proc.stdin.write(data)
+            sock.proc.stdin.close()
+            reader = FrameReader(sock, buffer_size=7)
+            assert consume_frames(reader, demux=True) == (b"hello", b"oops")
+        finally:
+            sock.proc.wait()
+            assert sock.proc.stdout is not None
+            sock.proc.stdout.close()
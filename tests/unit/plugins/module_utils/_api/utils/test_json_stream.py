@@ -8,9 +8,16 @@
 
 from __future__ import annotations
 
+import json
 import typing as t
 
+import pytest
+
+from ansible_collections.community.docker.plugins.module_utils._api.errors import (
+    StreamParseError,
+)
 from ansible_collections.community.docker.plugins.module_utils._api.utils.json_stream import (
+    JSONStreamDecoder,
     json_splitter,
     json_stream,
     stream_as_text,
@@ -72,3 +79,38 @@ class TestJsonStream:
         )
         output = list(json_stream(stream))
         assert output == [{"one": "two"}, {"x": 1}, {"three": "four"}, {"x": 2}]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+class TestJSONStreamDecoder:
+    def test_many_objects_in_one_chunk(self, use_orjson: bool) -> None:
+        decoder = JSONStreamDecoder(use_orjson=use_orjson)
+        data = "".join(f'{{"id": {i}}}\r\n' for i in range(1000))
+        assert list(decoder.feed(data)) == [{"id": i} for i in range(1000)]
+        assert not list(decoder.finish())
+
+    def test_objects_split_over_chunks(self, use_orjson: bool) -> None:
+        data = b'{"status": "Downloading"}\r\n{"a": [1, 2]} {"b": "\xc3\xa4"}'
+        for size in (1, 2, 3, 7):
+            decoder = JSONStreamDecoder(use_orjson=use_orjson)
+            output: list[t.Any] = []
+            for i in range(0, len(data), size):
+                output.extend(decoder.feed(data[i : i + size]))
+            output.extend(decoder.finish())
+            assert output == [{"status": "Downloading"}, {"a": [1, 2]}, {"b": "ä"}]
+
+    def test_large_object(self, use_orjson: bool) -> None:
+        obj = {"data": ["x" * 100] * 1000}
+        data = json.dumps(obj)
+        decoder = JSONStreamDecoder(use_orjson=use_orjson)
+        output: list[t.Any] = []
+        for i in range(0, len(data), 100):
+            output.extend(decoder.feed(data[i : i + 100]))
+        output.extend(decoder.finish())
+        assert output == [obj]
+
+    def test_incomplete(self, use_orjson: bool) -> None:
+        decoder = JSONStreamDecoder(use_orjson=use_orjson)
+        assert list(decoder.feed('{"a": 1}\n{"b": ')) == [{"a": 1}]
+        with pytest.raises(StreamParseError):
+            list(decoder.finish())
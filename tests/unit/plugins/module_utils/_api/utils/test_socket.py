@@ -0,0 +1,134 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import socket
+import struct
+import threading
+import typing as t
+
+import pytest
+
+from ansible_collections.community.docker.plugins.module_utils._api.utils.socket import (
+    STDERR,
+    STDOUT,
+    FrameReader,
+    consume_frames,
+    consume_socket_output,
+    frames_iter,
+)
+
+
+def frame(stream: int, data: bytes) -> bytes:
+    return struct.pack(">BxxxL", stream, len(data)) + data
+
+
+def make_socket(data: bytes) -> socket.socket:
+    reader, writer = socket.socketpair()
+
+    def write() -> None:
+        try:
+            writer.sendall(data)
+        finally:
+            writer.close()
+
+    thread = threading.Thread(target=write)
+    thread.daemon = True
+    thread.start()
+    return reader
+
+
+MUX_DATA = (
+    frame(STDOUT, b"hello ")
+    + frame(STDERR, b"oops")
+    + frame(STDOUT, b"")
+    + frame(STDOUT, b"world")
+)
+
+
+@pytest.mark.parametrize("buffer_size", [1, 7, 8, 9, 13, 65536])
+def test_frame_reader_no_tty(buffer_size: int) -> None:
+    sock = make_socket(MUX_DATA)
+    try:
+        reader = FrameReader(sock, buffer_size=buffer_size)
+        result: dict[int, bytes] = {STDOUT: b"", STDERR: b""}
+        for stream, data in reader.frames():
+            assert isinstance(data, memoryview)
+            result[stream] += bytes(data)
+    finally:
+        sock.close()
+    assert result == {STDOUT: b"hello world", STDERR: b"oops"}
+
+
+def test_frame_reader_tty() -> None:
+    sock = make_socket(b"abc" * 10000)
+    try:
+        reader = FrameReader(sock, tty=True, buffer_size=1000)
+        chunks = [(stream, bytes(data)) for stream, data in reader.frames()]
+    finally:
+        sock.close()
+    assert {stream for stream, dummy in chunks} == {STDOUT}
+    assert all(len(data) <= 1000 for dummy, data in chunks)
+    assert b"".join(data for dummy, data in chunks) == b"abc" * 10000
+
+
+def test_frame_reader_truncated() -> None:
+    sock = make_socket(frame(STDOUT, b"complete") + frame(STDERR, b"truncated")[:-3])
+    try:
+        result = consume_frames(FrameReader(sock), demux=True)
+    finally:
+        sock.close()
+    assert result == (b"complete", b"trunca")
+
+
+@pytest.mark.parametrize(
+    "tty, demux, expected",
+    [
+        (False, False, b"hello oopsworld"),
+        (False, True, (b"hello world", b"oops")),
+        (True, False, MUX_DATA),
+        (True, True, (MUX_DATA, None)),
+    ],
+)
+def test_consume_frames(tty: bool, demux: bool, expected: t.Any) -> None:
+    sock = make_socket(MUX_DATA)
+    try:
+        assert consume_frames(FrameReader(sock, tty=tty), demux=demux) == expected
+    finally:
+        sock.close()
+
+
+def test_consume_frames_large() -> None:
+    stdout = bytes(range(256)) * 4096
+    stderr = b"e" * 300000
+    data = b"".join(
+        frame(STDOUT, stdout[i : i + 100000]) + frame(STDERR, stderr[i : i + 100000])
+        for i in range(0, len(stdout), 100000)
+    )
+    sock = make_socket(data)
+    try:
+        assert consume_frames(FrameReader(sock, buffer_size=4096), demux=True) == (
+            stdout,
+            stderr,
+        )
+    finally:
+        sock.close()
+
+
+def test_frames_iter() -> None:
+    sock = make_socket(MUX_DATA)
+    try:
+        frames = list(frames_iter(sock, False))
+    finally:
+        sock.close()
+    assert all(isinstance(data, bytes) for dummy, data in frames)
+    assert consume_socket_output(
+        [(data, None) if stream == STDOUT else (None, data) for stream, data in frames],
+        demux=True,
+    ) == (b"hello world", b"oops")
+    result: tuple[bytes | None, bytes | None] = consume_socket_output(
+        [(b"out", None)], demux=True
+    )
+    assert result == (b"out", None)
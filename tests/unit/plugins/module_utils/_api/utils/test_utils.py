@@ -28,6 +28,7 @@ from ansible_collections.community.docker.plugins.module_utils._api.errors impor
     DockerException,
 )
 from ansible_collections.community.docker.plugins.module_utils._api.utils.utils import (
+    coalesce_chunks,
     convert_filters,
     convert_volume_binds,
     decode_json_header,
@@ -462,6 +463,17 @@ class UtilsTest(unittest.TestCase):
         decoded_data = decode_json_header(data)
         assert obj == decoded_data
 
+    def test_coalesce_chunks(self) -> None:
+        chunks = [b"a", b"bc", b"def", b"0123456789", b"g", b"hij", b"klmn"]
+        assert list(coalesce_chunks(iter(chunks), 6)) == [
+            b"abcdef",
+            b"0123456789",
+            b"ghij",
+            b"klmn",
+        ]
+        assert list(coalesce_chunks(iter(chunks), 1024)) == [b"".join(chunks)]
+        assert not list(coalesce_chunks(iter([]), 1024))
+
 
 class SplitCommandTest(unittest.TestCase):
     def test_split_command_with_unicode(self) -> None:
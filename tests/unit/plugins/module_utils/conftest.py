@@ -0,0 +1,49 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+import typing as t
+
+import pytest
+
+from ansible_collections.community.docker.plugins.module_utils._api.api.client import (
+    APIClient,
+)
+from ansible_collections.community.docker.tests.unit.plugins.module_utils.fake_daemon import (
+    API_VERSION,
+    FakeDaemon,
+)
+
+if t.TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+
+@pytest.fixture
+def daemon_factory() -> Iterator[Callable[..., tuple[FakeDaemon, APIClient]]]:
+    socket_dir = tempfile.mkdtemp()
+    daemons: list[FakeDaemon] = []
+    clients: list[APIClient] = []
+
+    def create(
+        handler: Callable[[dict[str, t.Any]], tuple[bytes, bool]],
+    ) -> tuple[FakeDaemon, APIClient]:
+        path = os.path.join(socket_dir, f"docker{len(daemons)}.sock")
+        daemon = FakeDaemon(path, handler)
+        daemons.append(daemon)
+        client = APIClient(
+            base_url=f"unix://{path}", version=API_VERSION, use_minimal_http=True
+        )
+        clients.append(client)
+        return daemon, client
+
+    yield create
+    for client in clients:
+        client.close()
+    for daemon in daemons:
+        daemon.close()
+    shutil.rmtree(socket_dir)
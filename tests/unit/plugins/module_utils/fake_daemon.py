@@ -0,0 +1,189 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import datetime
+import ipaddress
+import json
+import socket
+import threading
+import typing as t
+
+import pytest
+
+if t.TYPE_CHECKING:
+    import ssl
+    from collections.abc import Callable
+
+
+API_VERSION = "1.45"
+
+
+def create_certificate(directory: t.Any) -> tuple[str, str]:
+    """
+    Create a self-signed CA certificate for 127.0.0.1 in ``directory``, and
+    return the paths of the certificate and its key.
+    """
+    x509 = pytest.importorskip("cryptography.x509")
+    hashes = pytest.importorskip("cryptography.hazmat.primitives.hashes")
+    serialization = pytest.importorskip("cryptography.hazmat.primitives.serialization")
+    ec = pytest.importorskip("cryptography.hazmat.primitives.asymmetric.ec")
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(x509.NameOID.COMMON_NAME, "daemon")])
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(datetime.datetime(2000, 1, 1))
+        .not_valid_after(datetime.datetime(2100, 1, 1))
+        .add_extension(
+            x509.SubjectAlternativeName(
+                [x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]
+            ),
+            critical=False,
+        )
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = str(directory / "cert.pem")
+    key_path = str(directory / "key.pem")
+    with open(cert_path, "wb") as f:
+        f.write(certificate.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, "wb") as f:
+        f.write(
+            key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+    return cert_path, key_path
+
+
+def _read_request(connection: socket.socket, buffer: bytearray) -> dict[str, t.Any]:
+    while b"\r\n\r\n" not in buffer:
+        data = connection.recv(4096)
+        if not data:
+            raise EOFError
+        buffer += data
+    index = buffer.index(b"\r\n\r\n")
+    lines = buffer[:index].decode("latin-1").split("\r\n")
+    del buffer[: index + 4]
+    headers = {}
+    for line in lines[1:]:
+        name, dummy, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    def read_exactly(length: int) -> bytes:
+        while len(buffer) < length:
+            buffer.extend(connection.recv(4096))
+        data = bytes(buffer[:length])
+        del buffer[:length]
+        return data
+
+    def read_line() -> bytes:
+        while b"\r\n" not in buffer:
+            buffer.extend(connection.recv(4096))
+        return read_exactly(buffer.index(b"\r\n") + 2)
+
+    body = b""
+    if headers.get("transfer-encoding") == "chunked":
+        while True:
+            size = int(read_line().strip(), 16)
+            if not size:
+                read_line()
+                break
+            body += read_exactly(size)
+            read_exactly(2)
+    elif "content-length" in headers:
+        body = read_exactly(int(headers["content-length"]))
+    return {"request_line": lines[0], "headers": headers, "body": body}
+
+
+class FakeDaemon:
+    """
+    Serves HTTP requests on a Unix socket, or on TCP if ``path`` is ``None``.
+    ``handler`` is called with every request and returns the raw response and
+    whether to close the connection afterwards. Instead of the raw response,
+    it can return a function that takes over the connection, for example to
+    emulate a hijacked exec stream; the connection is closed afterwards.
+
+    If ``ssl_context`` is given, connections use TLS. Whether a connection
+    resumed a TLS session is recorded in ``sessions_reused``.
+    """
+
+    def __init__(
+        self,
+        path: str | None,
+        handler: Callable[[dict[str, t.Any]], tuple[t.Any, bool]],
+        ssl_context: ssl.SSLContext | None = None,
+    ) -> None:
+        self.handler = handler
+        self.requests: list[dict[str, t.Any]] = []
+        self.connections = 0
+        self.sessions_reused: list[bool] = []
+        self._ssl_context = ssl_context
+        if path is None:
+            self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._server.bind(("127.0.0.1", 0))
+            self.port = self._server.getsockname()[1]
+        else:
+            self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._server.bind(path)
+        self._server.listen(64)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                connection, dummy = self._server.accept()
+            except OSError:
+                return
+            self.connections += 1
+            threading.Thread(
+                target=self._serve, args=(connection,), daemon=True
+            ).start()
+
+    def _serve(self, connection: socket.socket) -> None:
+        buffer = bytearray()
+        if self._ssl_context is not None:
+            try:
+                connection = self._ssl_context.wrap_socket(connection, server_side=True)
+            except OSError:
+                connection.close()
+                return
+            self.sessions_reused.append(bool(connection.session_reused))
+        with connection:
+            while True:
+                try:
+                    request = _read_request(connection, buffer)
+                except (EOFError, OSError):
+                    break
+                self.requests.append(request)
+                response, close = self.handler(request)
+                if callable(response):
+                    response(connection, buffer)
+                    break
+                try:
+                    connection.sendall(response)
+                except OSError:
+                    break
+                if close:
+                    break
+
+    def close(self) -> None:
+        self._server.close()
+
+
+def json_response(data: t.Any, status: str = "200 OK") -> bytes:
+    body = json.dumps(data).encode("utf-8")
+    return (
+        f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n"
+    ).encode("ascii") + body
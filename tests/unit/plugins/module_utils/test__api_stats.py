@@ -0,0 +1,133 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import json
+import typing as t
+
+import pytest
+
+from ansible_collections.community.docker.plugins.module_utils._api import constants
+from ansible_collections.community.docker.plugins.module_utils._api.api.client import (
+    APIClient,
+)
+from ansible_collections.community.docker.plugins.module_utils._api.errors import (
+    NotFound,
+)
+from ansible_collections.community.docker.plugins.module_utils._async_api import (
+    GetJSON,
+    get_json_batch,
+)
+from ansible_collections.community.docker.tests.unit.plugins.module_utils.fake_daemon import (
+    API_VERSION,
+    FakeDaemon,
+    json_response,
+)
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterator
+
+pytestmark = pytest.mark.skipif(constants.IS_WINDOWS_PLATFORM, reason="Unix only")
+
+STREAM_CHUNKS = [json.dumps({"status": i}).encode() + b"\r\n" for i in range(5)]
+
+
+def _handler(request: dict[str, t.Any]) -> tuple[bytes, bool]:
+    path = request["request_line"].split(" ")[1]
+    if "/missing/" in path:
+        return json_response({"message": "No such container"}, "404 Not Found"), False
+    if path.startswith(f"/v{API_VERSION}/images/create"):
+        body = b"".join(f"{len(c):x}\r\n".encode() + c + b"\r\n" for c in STREAM_CHUNKS)
+        return (
+            b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+            + body
+            + b"0\r\n\r\n",
+            False,
+        )
+    return json_response({"Id": "abc"}), False
+
+
+@pytest.fixture(params=[False, True], ids=["requests", "minimal-http"])
+def client(request: t.Any, tmp_path: t.Any) -> Iterator[APIClient]:
+    path = str(tmp_path / "docker.sock")
+    daemon = FakeDaemon(path, _handler)
+    client = APIClient(
+        base_url=f"unix://{path}",
+        version=API_VERSION,
+        use_minimal_http=request.param,
+        collect_stats=True,
+    )
+    yield client
+    client.close()
+    daemon.close()
+
+
+def test_records_requests(client: APIClient) -> None:
+    assert client.api_stats is not None
+
+    client.get_json("/containers/{0}/json", "foo")
+    client.get_json("/containers/{0}/json", "bar")
+    with pytest.raises(NotFound):
+        client.get_json("/containers/{0}/json", "missing")
+    client.post_json_to_json("/containers/{0}/update", "foo", data={"a": "b"})
+    response = client._post(client._url("/images/create"), stream=True)
+    assert len(list(client._stream_helper(response, decode=True))) == 5
+
+    def generate() -> t.Generator[bytes]:
+        yield b"abc"
+        yield b"defg"
+
+    client._put(client._url("/containers/{0}/archive", "foo"), data=generate())
+
+    summary = client.api_stats.summarize()
+    assert summary["count"] == 6
+    assert [(r["method"], r["endpoint"], r["status"]) for r in summary["requests"]] == [
+        ("GET", "/containers/{0}/json", 200),
+        ("GET", "/containers/{0}/json", 200),
+        ("GET", "/containers/{0}/json", 404),
+        ("POST", "/containers/{0}/update", 200),
+        ("POST", "/images/create", 200),
+        ("PUT", "/containers/{0}/archive", 200),
+    ]
+    inspect, update, pull, upload = (
+        summary["requests"][0],
+        summary["requests"][3],
+        summary["requests"][4],
+        summary["requests"][5],
+    )
+    assert inspect["request_bytes"] == 0
+    assert inspect["response_bytes"] == len(json.dumps({"Id": "abc"}))
+    assert update["request_bytes"] == len(json.dumps({"a": "b"}))
+    assert pull["response_bytes"] == sum(len(c) for c in STREAM_CHUNKS)
+    assert pull["duration"] >= pull["latency"]
+    assert upload["request_bytes"] == 7
+
+    endpoints = {(e["method"], e["endpoint"]): e for e in summary["endpoints"]}
+    assert endpoints[("GET", "/containers/{0}/json")]["count"] == 3
+    assert endpoints[("GET", "/containers/{0}/json")]["status"] == {"200": 2, "404": 1}
+    assert summary["response_bytes"] == sum(
+        r["response_bytes"] for r in summary["requests"]
+    )
+
+    client.api_stats.clear()
+    assert client.api_stats.summarize()["count"] == 0
+
+
+def test_records_batches(client: APIClient) -> None:
+    assert client.api_stats is not None
+
+    get_json_batch(
+        client, [GetJSON("/containers/{0}/json", (f"c{i}",)) for i in range(10)]
+    )
+
+    summary = client.api_stats.summarize()
+    assert summary["count"] == 10
+    assert summary["endpoints"][0]["endpoint"] == "/containers/{0}/json"
+    assert summary["endpoints"][0]["status"] == {"200": 10}
+
+
+def test_disabled_by_default(tmp_path: t.Any) -> None:
+    client = APIClient(base_url=f"unix://{tmp_path}/docker.sock", version=API_VERSION)
+    assert client.api_stats is None
@@ -0,0 +1,205 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import json
+import ssl
+import threading
+import time
+import typing as t
+from unittest import mock
+
+import pytest
+
+from ansible_collections.community.docker.plugins.module_utils._api import constants
+from ansible_collections.community.docker.plugins.module_utils._api.api.client import (
+    APIClient,
+)
+from ansible_collections.community.docker.plugins.module_utils._api.errors import (
+    NotFound,
+)
+from ansible_collections.community.docker.plugins.module_utils._api.tls import (
+    TLSConfig,
+)
+from ansible_collections.community.docker.plugins.module_utils._async_api import (
+    AsyncAPIClient,
+    GetJSON,
+    _create_ssl_context,
+    get_json_batch,
+)
+from ansible_collections.community.docker.tests.unit.plugins.module_utils.fake_daemon import (
+    API_VERSION,
+    FakeDaemon,
+    create_certificate,
+    json_response,
+)
+
+pytestmark = pytest.mark.skipif(constants.IS_WINDOWS_PLATFORM, reason="Unix only")
+
+
+class InspectHandler:
+    """
+    Answers ``GET /containers/<id>/json`` with a small inspect result, and
+    ``404`` for container IDs starting with ``missing``. Keeps track of how
+    many requests are processed at the same time.
+    """
+
+    def __init__(self, delay: float = 0.0, close: bool = False) -> None:
+        self.delay = delay
+        self.close = close
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, request: dict[str, t.Any]) -> tuple[bytes, bool]:
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            path = request["request_line"].split(" ")[1]
+            container_id = path.split("/")[3]
+            if container_id.startswith("missing"):
+                response = json_response(
+                    {"message": f"No such container: {container_id}"},
+                    "404 Not Found",
+                )
+            else:
+                response = json_response(
+                    {"Id": container_id, "Path": path, "State": {"Running": True}}
+                )
+            return response, self.close
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _inspect_calls(count: int) -> list[GetJSON]:
+    return [GetJSON("/containers/{0}/json", (f"c{i}",)) for i in range(count)]
+
+
+@pytest.mark.parametrize("use_minimal_http", [False, True])
+def test_batch_matches_sync(tmp_path: t.Any, use_minimal_http: bool) -> None:
+    path = str(tmp_path / "docker.sock")
+    daemon = FakeDaemon(path, InspectHandler())
+    client = APIClient(
+        base_url=f"unix://{path}",
+        version=API_VERSION,
+        use_minimal_http=use_minimal_http,
+    )
+    try:
+        calls = _inspect_calls(30)
+        expected = [client.get_json(call.pathfmt, *call.args) for call in calls]
+        assert get_json_batch(client, calls) == expected
+        user_agents = {r["headers"]["user-agent"] for r in daemon.requests}
+        assert user_agents == {constants.DEFAULT_USER_AGENT}
+    finally:
+        client.close()
+        daemon.close()
+
+
+def test_batch_concurrency_limit(daemon_factory: t.Any) -> None:
+    handler = InspectHandler(delay=0.02)
+    daemon, client = daemon_factory(handler)
+
+    results = get_json_batch(client, _inspect_calls(40), max_concurrency=4)
+    assert [result["Id"] for result in results] == [f"c{i}" for i in range(40)]
+    assert 1 < handler.max_active <= 4
+    assert daemon.connections <= 4
+
+
+def test_batch_errors(daemon_factory: t.Any) -> None:
+    dummy, client = daemon_factory(InspectHandler())
+    calls = [
+        GetJSON("/containers/{0}/json", ("c1",)),
+        GetJSON("/containers/{0}/json", ("missing1",)),
+        GetJSON("/containers/{0}/json", ("c2",), params={"size": 1}),
+    ]
+
+    first, second, third = get_json_batch(client, calls, return_exceptions=True)
+    assert first["Id"] == "c1"
+    assert isinstance(second, NotFound)
+    assert second.explanation == "No such container: missing1"
+    assert third["Path"] == f"/v{API_VERSION}/containers/c2/json?size=1"
+
+    with pytest.raises(NotFound):
+        get_json_batch(client, calls)
+
+
+def test_batch_reconnects(daemon_factory: t.Any) -> None:
+    # The daemon closes the connection after every response
+    daemon, client = daemon_factory(InspectHandler(close=True))
+
+    results = get_json_batch(client, _inspect_calls(10), max_concurrency=2)
+    assert [result["Id"] for result in results] == [f"c{i}" for i in range(10)]
+    assert daemon.connections == 10
+
+
+def test_batch_chunked(daemon_factory: t.Any) -> None:
+    body = json.dumps({"Id": "abc"}).encode("utf-8")
+    response = (
+        b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+        b"Transfer-Encoding: chunked\r\n\r\n"
+        + f"{len(body[:5]):x}\r\n".encode()
+        + body[:5]
+        + b"\r\n"
+        + f"{len(body[5:]):x}\r\n".encode()
+        + body[5:]
+        + b"\r\n0\r\n\r\n"
+    )
+    dummy, client = daemon_factory(lambda request: (response, False))
+
+    assert get_json_batch(client, _inspect_calls(3)) == [{"Id": "abc"}] * 3
+
+
+def test_batch_falls_back_to_sync(daemon_factory: t.Any) -> None:
+    dummy, client = daemon_factory(InspectHandler())
+
+    with mock.patch.object(AsyncAPIClient, "is_supported", return_value=False):
+        results = get_json_batch(
+            client,
+            _inspect_calls(2) + [GetJSON("/containers/{0}/json", ("missing",))],
+            return_exceptions=True,
+        )
+    assert [result["Id"] for result in results[:2]] == ["c0", "c1"]
+    assert isinstance(results[2], NotFound)
+
+
+def test_is_supported(daemon_factory: t.Any) -> None:
+    dummy, client = daemon_factory(InspectHandler())
+    assert AsyncAPIClient.is_supported(client)
+
+    client = APIClient(base_url="tcp://127.0.0.1:2375", version=API_VERSION)
+    with mock.patch.dict("os.environ", {}, clear=True):
+        assert AsyncAPIClient.is_supported(client)
+    with mock.patch.dict("os.environ", {"http_proxy": "http://proxy:3128"}, clear=True):
+        assert not AsyncAPIClient.is_supported(client)
+
+    client._connection_url = "ssh://user@host"
+    assert not AsyncAPIClient.is_supported(client)
+
+
+def test_ssl_context() -> None:
+    context = _create_ssl_context(TLSConfig(verify=False))
+    assert context.verify_mode == ssl.CERT_NONE
+    assert not context.check_hostname
+
+    context = _create_ssl_context(TLSConfig(verify=True, assert_hostname=False))
+    assert context.verify_mode == ssl.CERT_REQUIRED
+    assert not context.check_hostname
+
+    context = _create_ssl_context(True)
+    assert context.verify_mode == ssl.CERT_REQUIRED
+    assert context.check_hostname
+
+
+def test_ssl_context_ca_cert(tmp_path: t.Any) -> None:
+    cert_path, dummy = create_certificate(tmp_path)
+    context = _create_ssl_context(TLSConfig(ca_cert=cert_path, verify=True))
+    assert context.verify_mode == ssl.CERT_REQUIRED
+    assert context.check_hostname
+    # No other CA is trusted
+    (ca,) = context.get_ca_certs()
+    assert ca["subject"] == ((("commonName", "daemon"),),)
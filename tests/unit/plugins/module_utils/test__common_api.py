@@ -0,0 +1,137 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import typing as t
+
+import pytest
+
+from ansible_collections.community.docker.plugins.module_utils._common_api import (
+    get_connect_params,
+    get_ssh_control_persist,
+)
+
+_API = "ansible_collections.community.docker.plugins.module_utils._api"
+
+# Modules that are only needed for specific values of docker_host, or when a
+# credential store is used, and must not be imported up front
+LAZY_MODULES = [
+    "paramiko",
+    f"{_API}.transport.sshconn",
+    f"{_API}.transport.npipeconn",
+    f"{_API}.transport.npipesocket",
+    f"{_API}.transport.ssladapter",
+    f"{_API}.transport.unixconn",
+    f"{_API}.credentials.store",
+    f"{_API}.context.api",
+]
+
+
+def _import_times(module: str) -> dict[str, tuple[int, int]]:
+    """
+    Import ``module`` in a fresh interpreter with ``-X importtime`` and return
+    self and cumulative import time in microseconds for every imported module.
+    """
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join(p for p in sys.path if isinstance(p, str))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        times[parts[2].strip()] = (int(parts[0]), int(parts[1]))
+    return times
+
+
+def _format_import_times(
+    module: str, times: dict[str, tuple[int, int]], count: int = 25
+) -> str:
+    """
+    Report the self and cumulative import time per module, most expensive
+    first.
+    """
+    report = sorted(times.items(), key=lambda item: item[1][0], reverse=True)
+    lines = [f"Importing {module} took {times[module][1] / 1000:.1f} ms:"]
+    lines.append(f"  {'self':>8}    {'cumulative':>11}  module")
+    for name, (self_us, cumulative_us) in report[:count]:
+        lines.append(
+            f"  {self_us / 1000:8.1f} ms {cumulative_us / 1000:8.1f} ms  {name}"
+        )
+    return "\n".join(lines)
+
+
+def test_common_api_import_is_lazy(
+    record_property: t.Callable[[str, object], None],
+) -> None:
+    module = "ansible_collections.community.docker.plugins.module_utils._common_api"
+    times = _import_times(module)
+    assert module in times
+
+    # The report ends up in the JUnit XML, and in the message if the test fails
+    report = _format_import_times(module, times)
+    record_property("import_times", report)
+
+    imported = [name for name in LAZY_MODULES if name in times]
+    assert imported == [], report
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (None, None),
+        ("", None),
+        ("false", None),
+        ("0", None),
+        ("true", 60),
+        ("yes", 60),
+        ("300", 300),
+        ("-5", None),
+    ],
+)
+def test_get_ssh_control_persist(
+    monkeypatch: pytest.MonkeyPatch, value: str | None, expected: int | None
+) -> None:
+    if value is None:
+        monkeypatch.delenv("ANSIBLE_DOCKER_SSH_CONTROL_PERSIST", raising=False)
+    else:
+        monkeypatch.setenv("ANSIBLE_DOCKER_SSH_CONTROL_PERSIST", value)
+    assert get_ssh_control_persist() == expected
+
+
+@pytest.mark.parametrize("tls", [False, True])
+def test_get_connect_params_tls_session_cache(
+    monkeypatch: pytest.MonkeyPatch, tls: bool
+) -> None:
+    monkeypatch.setenv("ANSIBLE_DOCKER_TLS_SESSION_CACHE", "true")
+    auth_data = {
+        "docker_host": "tcp://127.0.0.1:2376",
+        "api_version": "auto",
+        "timeout": 60,
+        "tls": tls,
+        "tls_verify": False,
+        "tls_hostname": None,
+        "cert_path": None,
+        "key_path": None,
+        "cacert_path": None,
+    }
+
+    def fail(msg: str) -> t.NoReturn:
+        raise AssertionError(msg)
+
+    params = get_connect_params(auth_data, fail)
+    assert params.get("tls_session_cache", False) is tls
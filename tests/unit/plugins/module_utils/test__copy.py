@@ -4,12 +4,42 @@
 
 from __future__ import annotations
 
+import base64
+import hashlib
+import io
+import json
+import os
+import socket
+import stat
+import subprocess
+import tarfile
+import threading
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
 import pytest
 
+from ansible_collections.community.docker.plugins.module_utils._api.api.client import (
+    APIClient,
+)
 from ansible_collections.community.docker.plugins.module_utils._copy import (
+    DockerFileCopyError,
+    _regular_file_tar_body,
     _stream_generator_to_fileobj,
+    create_file_tar_body,
+    fetch_file,
+    fetch_tree_manifest,
+    get_file_checksum,
+    get_tree_manifest,
+    put_file,
+    put_file_content,
+    put_tar_body,
+    put_tree,
+)
+from ansible_collections.community.docker.tests.unit.plugins.module_utils.fake_daemon import (
+    API_VERSION,
+    FakeDaemon,
 )
 
 if t.TYPE_CHECKING:
@@ -85,3 +115,473 @@ def test__stream_generator_to_fileobj(
 
     assert buffer == expected[: len(buffer)]
     assert min(totally_read, len(expected)) == len(buffer)
+
+
+def _send_through_socket(body: t.Any) -> bytes:
+    left, right = socket.socketpair()
+
+    def send() -> None:
+        with left:
+            body.send_to(left)
+
+    thread = threading.Thread(target=send)
+    thread.start()
+    data = bytearray()
+    with right:
+        while True:
+            chunk = right.recv(65536)
+            if not chunk:
+                break
+            data += chunk
+    thread.join()
+    return bytes(data)
+
+
+def _read_member(archive: bytes) -> tuple[tarfile.TarInfo, bytes]:
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        members = tar.getmembers()
+        assert len(members) == 1
+        f = tar.extractfile(members[0])
+        assert f is not None
+        return members[0], f.read()
+
+
+@pytest.mark.parametrize("size", [0, 1, 511, 512, 10240, 100 * 1024 + 3])
+def test_regular_file_tar_body(tmp_path: t.Any, size: int) -> None:
+    content = os.urandom(size)
+    path = tmp_path / "file"
+    path.write_bytes(content)
+    b_path = str(path).encode("utf-8")
+    body = _regular_file_tar_body(b_path, os.lstat(b_path), "file", 1000, 1001)
+
+    archive = b"".join(body)
+    assert len(archive) == len(body)
+    assert len(archive) % tarfile.RECORDSIZE == 0
+    member, data = _read_member(archive)
+    assert (member.name, member.uid, member.gid) == ("file", 1000, 1001)
+    assert data == content
+
+    # send_to() sends the same archive
+    assert _send_through_socket(body) == archive
+
+
+def test_regular_file_tar_body_shrunk(tmp_path: t.Any) -> None:
+    path = tmp_path / "file"
+    path.write_bytes(b"12345")
+    b_path = str(path).encode("utf-8")
+    body = _regular_file_tar_body(b_path, os.lstat(b_path), "file", 0, 0)
+    path.write_bytes(b"12")
+
+    archive = _send_through_socket(body)
+    assert len(archive) == len(body)
+    assert _read_member(archive)[1] == b"12\0\0\0"
+
+
+@pytest.mark.parametrize(
+    "transport",
+    ["unix-minimal", "unix-requests", "tcp"],
+)
+def test_put_file_sendfile(
+    tmp_path: t.Any, monkeypatch: pytest.MonkeyPatch, transport: str
+) -> None:
+    if transport != "unix-minimal":
+        pytest.importorskip("requests")
+    for name in ("http_proxy", "HTTP_PROXY", "all_proxy", "ALL_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+
+    def handler(request: dict[str, t.Any]) -> tuple[bytes, bool]:
+        return b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n", False
+
+    if transport == "tcp":
+        daemon = FakeDaemon(None, handler)
+        base_url = f"tcp://127.0.0.1:{daemon.port}"
+    else:
+        daemon = FakeDaemon(str(tmp_path / "docker.sock"), handler)
+        base_url = f"unix://{tmp_path / 'docker.sock'}"
+    client = APIClient(
+        base_url=base_url,
+        version=API_VERSION,
+        use_minimal_http=transport == "unix-minimal",
+    )
+    content = os.urandom(200 * 1024)
+    (tmp_path / "file").write_bytes(content)
+    try:
+        with mock.patch.object(
+            socket.socket, "sendfile", autospec=True, side_effect=socket.socket.sendfile
+        ) as sendfile:
+            put_file(client, "abc", str(tmp_path / "file"), "/dir/file", 0, 0)
+            put_file(client, "abc", str(tmp_path / "file"), "/dir/other", 0, 0)
+    finally:
+        client.close()
+        daemon.close()
+
+    assert sendfile.call_count == 2
+    # The second request re-uses the connection
+    assert daemon.connections == 1
+    request = daemon.requests[0]
+    assert request["request_line"].startswith(
+        f"PUT /v{API_VERSION}/containers/abc/archive?path=%2Fdir HTTP/1.1"
+    )
+    assert "transfer-encoding" not in request["headers"]
+    assert int(request["headers"]["content-length"]) == len(request["body"])
+    member, data = _read_member(request["body"])
+    assert member.name == "file"
+    assert data == content
+
+
+def test_tar_body_coalesces(tmp_path: t.Any) -> None:
+    path = tmp_path / "file"
+    path.write_bytes(b"1" * 1000)
+    b_path = str(path).encode("utf-8")
+    body = _regular_file_tar_body(b_path, os.lstat(b_path), "file", 0, 0)
+    assert [len(chunk) for chunk in body] == [len(body)]
+
+    path.write_bytes(b"1" * (1024 * 1024 + 100))
+    body = _regular_file_tar_body(b_path, os.lstat(b_path), "file", 0, 0)
+    sizes = [len(chunk) for chunk in body]
+    assert sum(sizes) == len(body)
+    assert all(size >= 65536 for size in sizes[:-1])
+    assert len(sizes) == len(body) // 65536 + 1
+
+
+def _daemon_and_client(tmp_path: t.Any) -> tuple[FakeDaemon, APIClient]:
+    daemon = FakeDaemon(
+        str(tmp_path / "docker.sock"),
+        lambda request: (b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n", False),
+    )
+    client = APIClient(
+        base_url=f"unix://{tmp_path / 'docker.sock'}",
+        version=API_VERSION,
+        use_minimal_http=True,
+    )
+    return daemon, client
+
+
+def test_put_file_content(tmp_path: t.Any) -> None:
+    daemon, client = _daemon_and_client(tmp_path)
+    try:
+        put_file_content(client, "abc", b"content", "/dir/file", 0, 0, 0o644)
+    finally:
+        client.close()
+        daemon.close()
+
+    request = daemon.requests[0]
+    assert "transfer-encoding" not in request["headers"]
+    assert int(request["headers"]["content-length"]) == len(request["body"])
+    member, data = _read_member(request["body"])
+    assert (member.name, member.mode, data) == ("file", 0o644, b"content")
+
+
+@pytest.mark.parametrize("use_minimal_http", [True, False])
+def test_fetch_file(tmp_path: t.Any, use_minimal_http: bool) -> None:
+    if not use_minimal_http:
+        pytest.importorskip("requests")
+    content = os.urandom(300 * 1024 + 17)
+    archive = io.BytesIO()
+    with tarfile.open(fileobj=archive, mode="w") as tar:
+        info = tarfile.TarInfo("file")
+        info.size = len(content)
+        tar.addfile(info, io.BytesIO(content))
+    data = archive.getvalue()
+    # Chunks of the size dockerd sends
+    body = b"".join(
+        f"{len(data[i : i + 32768]):x}\r\n".encode() + data[i : i + 32768] + b"\r\n"
+        for i in range(0, len(data), 32768)
+    )
+    daemon = FakeDaemon(
+        str(tmp_path / "docker.sock"),
+        lambda request: (
+            b"HTTP/1.1 200 OK\r\nContent-Type: application/x-tar\r\n"
+            b"Transfer-Encoding: chunked\r\n\r\n" + body + b"0\r\n\r\n",
+            False,
+        ),
+    )
+    client = APIClient(
+        base_url=f"unix://{tmp_path / 'docker.sock'}",
+        version=API_VERSION,
+        use_minimal_http=use_minimal_http,
+        collect_stats=True,
+    )
+    try:
+        assert fetch_file(client, "abc", "/file", str(tmp_path / "out")) == "/file"
+    finally:
+        client.close()
+        daemon.close()
+
+    assert (tmp_path / "out").read_bytes() == content
+    assert client.api_stats is not None
+    assert client.api_stats.calls[0].response_bytes > len(content)
+
+
+_CHECKSUM = "a" * 64
+
+
+@pytest.mark.parametrize(
+    "result, expected",
+    [
+        (
+            (0, f"1000 1001\n{_CHECKSUM}  /file\n".encode(), b""),
+            (1000, 1001, _CHECKSUM),
+        ),
+        ((0, f"0 0\n{_CHECKSUM.upper()}  /file\n".encode(), b""), (0, 0, _CHECKSUM)),
+        ((127, b"", b"sh: busybox: not found\n"), None),
+        ((0, f"{_CHECKSUM}  /file\n".encode(), b""), None),
+        ((0, b"0 0\nabc  /file\n", b""), None),
+        ((0, f"0 0\n{'x' * 64}  /file\n".encode(), b""), None),
+        (DockerFileCopyError("container is not running"), None),
+    ],
+)
+def test_get_file_checksum(
+    result: tuple[int, bytes, bytes] | Exception,
+    expected: tuple[int, int, str] | None,
+) -> None:
+    with mock.patch(
+        "ansible_collections.community.docker.plugins.module_utils._copy._execute_command",
+        side_effect=[result],
+    ) as execute:
+        assert get_file_checksum(mock.sentinel.client, "container", "/file") == expected
+    assert execute.call_args.args[2][-1] == "/file"
+
+
+def _run_locally(
+    client: t.Any, container: str, command: list[str], **kwargs: t.Any
+) -> tuple[int, bytes, bytes]:
+    result = subprocess.run(command, capture_output=True, check=False)
+    return result.returncode, result.stdout, result.stderr
+
+
+def _create_tree(path: t.Any) -> None:
+    (path / "sub dir").mkdir(parents=True)
+    (path / "file").write_bytes(b"content")
+    (path / "sub dir" / "empty").write_bytes(b"")
+    (path / "link").symlink_to("sub dir/empty")
+    (path / "sub dir" / "dangling").symlink_to("../nowhere")
+
+
+@pytest.mark.parametrize("checksums", [False, True])
+def test_get_tree_manifest(tmp_path: t.Any, checksums: bool) -> None:
+    _create_tree(tmp_path / "tree")
+    with mock.patch(
+        "ansible_collections.community.docker.plugins.module_utils._copy._execute_command",
+        side_effect=_run_locally,
+    ):
+        manifest = get_tree_manifest(
+            mock.sentinel.client, "abc", str(tmp_path / "tree"), checksums=checksums
+        )
+        assert (
+            get_tree_manifest(mock.sentinel.client, "abc", str(tmp_path / "missing"))
+            is None
+        )
+
+    assert manifest is not None
+    assert sorted(manifest) == [
+        "",
+        "file",
+        "link",
+        "sub dir",
+        "sub dir/dangling",
+        "sub dir/empty",
+    ]
+    file_stat = os.lstat(tmp_path / "tree" / "file")
+    entry = manifest["file"]
+    assert (entry.mode, entry.uid, entry.gid, entry.size, entry.mtime) == (
+        file_stat.st_mode,
+        file_stat.st_uid,
+        file_stat.st_gid,
+        7,
+        int(file_stat.st_mtime),
+    )
+    assert entry.checksum == (
+        hashlib.sha256(b"content").hexdigest() if checksums else None
+    )
+    assert stat.S_ISDIR(manifest[""].mode)
+    assert stat.S_ISDIR(manifest["sub dir"].mode)
+    assert manifest["link"].link_target == "sub dir/empty"
+    assert manifest["sub dir/dangling"].link_target == "../nowhere"
+
+
+def test_put_tree(tmp_path: t.Any) -> None:
+    _create_tree(tmp_path / "tree")
+    daemon, client = _daemon_and_client(tmp_path)
+    try:
+        put_tree(
+            client,
+            "abc",
+            str(tmp_path / "tree"),
+            "/dir/tree",
+            ["", "file", "link", "sub dir", "sub dir/empty"],
+            1000,
+            1001,
+            mode=0o600,
+        )
+    finally:
+        client.close()
+        daemon.close()
+
+    request = daemon.requests[0]
+    assert request["request_line"].startswith(
+        f"PUT /v{API_VERSION}/containers/abc/archive?path=%2Fdir HTTP/1.1"
+    )
+    assert int(request["headers"]["content-length"]) == len(request["body"])
+    assert len(request["body"]) % tarfile.RECORDSIZE == 0
+    with tarfile.open(fileobj=io.BytesIO(request["body"])) as tar:
+        members = tar.getmembers()
+        assert [member.name for member in members] == [
+            "tree",
+            "tree/file",
+            "tree/link",
+            "tree/sub dir",
+            "tree/sub dir/empty",
+        ]
+        assert all((member.uid, member.gid) == (1000, 1001) for member in members)
+        assert members[0].isdir()
+        assert members[0].mode == stat.S_IMODE(os.stat(tmp_path / "tree").st_mode)
+        assert members[1].mode == 0o600
+        f = tar.extractfile(members[1])
+        assert f is not None
+        assert f.read() == b"content"
+        assert members[2].issym()
+        assert members[2].linkname == "sub dir/empty"
+
+
+def test_fetch_tree_manifest(tmp_path: t.Any) -> None:
+    _create_tree(tmp_path / "tree")
+    archive = io.BytesIO()
+    with tarfile.open(fileobj=archive, mode="w") as tar:
+        tar.add(str(tmp_path / "tree"), arcname="tree")
+    data = archive.getvalue()
+    daemon = FakeDaemon(
+        str(tmp_path / "docker.sock"),
+        lambda request: (
+            b"HTTP/1.1 200 OK\r\nContent-Type: application/x-tar\r\n"
+            + f"Content-Length: {len(data)}\r\n\r\n".encode()
+            + data,
+            False,
+        ),
+    )
+    client = APIClient(
+        base_url=f"unix://{tmp_path / 'docker.sock'}",
+        version=API_VERSION,
+        use_minimal_http=True,
+    )
+    try:
+        manifest = fetch_tree_manifest(client, "abc", "/dir/tree")
+    finally:
+        client.close()
+        daemon.close()
+
+    assert "path=%2Fdir%2Ftree" in daemon.requests[0]["request_line"]
+    assert sorted(manifest) == [
+        "",
+        "file",
+        "link",
+        "sub dir",
+        "sub dir/dangling",
+        "sub dir/empty",
+    ]
+    assert stat.S_ISDIR(manifest[""].mode)
+    assert manifest["file"].mode == os.lstat(tmp_path / "tree" / "file").st_mode
+    assert manifest["file"].checksum == hashlib.sha256(b"content").hexdigest()
+    assert manifest["link"].link_target == "sub dir/empty"
+
+
+def test_put_tar_body_concurrently(tmp_path: t.Any) -> None:
+    content = os.urandom(300 * 1024)
+    (tmp_path / "file").write_bytes(content)
+    body = create_file_tar_body(str(tmp_path / "file"), "file", 0, 0)
+    containers = [f"c{index}" for index in range(8)]
+    daemon, client = _daemon_and_client(tmp_path)
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(
+                executor.map(
+                    lambda container: put_tar_body(
+                        client, container, "/dir/file", body
+                    ),
+                    containers,
+                )
+            )
+    finally:
+        client.close()
+        daemon.close()
+
+    assert (
+        sorted(request["request_line"].split("/")[3] for request in daemon.requests)
+        == containers
+    )
+    for request in daemon.requests:
+        member, data = _read_member(request["body"])
+        assert member.name == "file"
+        assert data == content
+
+
+def _archive_response(member: tarfile.TarInfo, content: bytes = b"") -> bytes:
+    archive = io.BytesIO()
+    with tarfile.open(fileobj=archive, mode="w") as tar:
+        tar.addfile(member, io.BytesIO(content))
+    data = archive.getvalue()
+    stat_data = {
+        "name": member.name,
+        "size": member.size,
+        # https://pkg.go.dev/io/fs#FileMode: bit 32 - 5 means ModeSymlink
+        "mode": (1 << (32 - 5) if member.issym() else 0) | member.mode,
+        "mtime": "2025-01-01T00:00:00Z",
+        "linkTarget": member.linkname,
+    }
+    header = base64.b64encode(json.dumps(stat_data).encode()).decode()
+    return (
+        b"HTTP/1.1 200 OK\r\nContent-Type: application/x-tar\r\n"
+        + f"X-Docker-Container-Path-Stat: {header}\r\n".encode()
+        + f"Content-Length: {len(data)}\r\n\r\n".encode()
+        + data
+    )
+
+
+def _link(name: str, target: str) -> tarfile.TarInfo:
+    member = tarfile.TarInfo(name)
+    member.type = tarfile.SYMTYPE
+    member.linkname = target
+    return member
+
+
+def test_fetch_file_follows_links(tmp_path: t.Any) -> None:
+    member = tarfile.TarInfo("localtime")
+    member.size = 7
+    responses = {
+        "/etc/localtime": _archive_response(_link("localtime", "../usr/zone")),
+        "/etc/../usr/zone": _archive_response(_link("zone", "share/localtime")),
+        "/etc/../usr/share/localtime": _archive_response(member, b"content"),
+        "/loop": _archive_response(_link("loop", "loop")),
+    }
+
+    def handler(request: dict[str, t.Any]) -> tuple[bytes, bool]:
+        path = request["request_line"].split("path=")[1].split(" ")[0]
+        return responses[path.replace("%2F", "/")], False
+
+    daemon = FakeDaemon(str(tmp_path / "docker.sock"), handler)
+    client = APIClient(
+        base_url=f"unix://{tmp_path / 'docker.sock'}",
+        version=API_VERSION,
+        use_minimal_http=True,
+    )
+    try:
+        assert (
+            fetch_file(
+                client,
+                "abc",
+                "/etc/localtime",
+                str(tmp_path / "out"),
+                follow_links=True,
+            )
+            == "/etc/../usr/share/localtime"
+        )
+        with pytest.raises(DockerFileCopyError, match="infinite symbolic link loop"):
+            fetch_file(client, "abc", "/loop", str(tmp_path / "out"), follow_links=True)
+    finally:
+        client.close()
+        daemon.close()
+
+    assert (tmp_path / "out").read_bytes() == b"content"
+    assert len(daemon.requests) == 4
+    # The archives of the links were read, so the connection was re-used
+    assert daemon.connections == 1
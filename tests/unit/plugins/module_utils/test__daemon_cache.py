@@ -0,0 +1,101 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import os
+import socket
+import time
+import typing as t
+
+import pytest
+
+from ansible_collections.community.docker.plugins.module_utils._daemon_cache import (
+    DaemonMetadataCache,
+    is_cache_enabled,
+)
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+
+INFO = {
+    "ID": "abc",
+    "ServerVersion": "28.0.0",
+    "ContainerdCommit": {"ID": "1"},
+    "RuncCommit": {"ID": "2"},
+    "KernelVersion": "6.1",
+    "OSType": "linux",
+}
+
+
+def test_is_cache_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("ANSIBLE_DOCKER_METADATA_CACHE", raising=False)
+    assert not is_cache_enabled()
+    monkeypatch.setenv("ANSIBLE_DOCKER_METADATA_CACHE", "true")
+    assert is_cache_enabled()
+    monkeypatch.setenv("ANSIBLE_DOCKER_METADATA_CACHE", "no")
+    assert not is_cache_enabled()
+
+
+def test_roundtrip(tmp_path: Path) -> None:
+    cache = DaemonMetadataCache("tcp://example.com:2375", cache_dir=str(tmp_path))
+    assert cache.get("version") is None
+    cache.set("version", {"ApiVersion": "1.48"})
+
+    cache = DaemonMetadataCache("tcp://example.com:2375", cache_dir=str(tmp_path))
+    assert cache.get("version") == {"ApiVersion": "1.48"}
+
+    other = DaemonMetadataCache("tcp://example.com:2376", cache_dir=str(tmp_path))
+    assert other.get("version") is None
+
+    cache.invalidate()
+    cache = DaemonMetadataCache("tcp://example.com:2375", cache_dir=str(tmp_path))
+    assert cache.get("version") is None
+
+
+def test_ttl(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = DaemonMetadataCache("tcp://example.com:2375", cache_dir=str(tmp_path))
+    cache.set("version", {"ApiVersion": "1.48"})
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 601)
+    cache = DaemonMetadataCache(
+        "tcp://example.com:2375", cache_dir=str(tmp_path), ttl=600
+    )
+    assert cache.get("version") is None
+
+
+def test_info_change_invalidates(tmp_path: Path) -> None:
+    cache = DaemonMetadataCache("tcp://example.com:2375", cache_dir=str(tmp_path))
+    cache.set("version", {"ApiVersion": "1.48"})
+    cache.set("info", INFO)
+    cache.set("info", dict(INFO, NContainers=5))
+    assert cache.get("version") == {"ApiVersion": "1.48"}
+    cache.set("info", dict(INFO, ID="def"))
+    assert cache.get("version") is None
+    info = cache.get("info")
+    assert info is not None and info["ID"] == "def"
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix only")
+def test_unix_socket_restart(tmp_path: Path) -> None:
+    socket_path = str(tmp_path / "docker.sock")
+    cache_dir = str(tmp_path / "cache")
+
+    def create_socket() -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.bind(socket_path)
+        sock.close()
+
+    create_socket()
+    cache = DaemonMetadataCache(f"unix://{socket_path}", cache_dir=cache_dir)
+    cache.set("version", {"ApiVersion": "1.48"})
+    cache = DaemonMetadataCache(f"unix://{socket_path}", cache_dir=cache_dir)
+    assert cache.get("version") == {"ApiVersion": "1.48"}
+
+    os.unlink(socket_path)
+    time.sleep(0.01)
+    create_socket()
+    cache = DaemonMetadataCache(f"unix://{socket_path}", cache_dir=cache_dir)
+    assert cache.get("version") is None
@@ -0,0 +1,183 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import socket
+import struct
+import tempfile
+import threading
+
+import pytest
+
+from ansible_collections.community.docker.plugins.module_utils import (
+    _socket_handler,
+)
+from ansible_collections.community.docker.plugins.module_utils._api import constants
+from ansible_collections.community.docker.plugins.module_utils._socket_handler import (
+    DockerSocketHandlerBase,
+)
+
+pytestmark = pytest.mark.skipif(constants.IS_WINDOWS_PLATFORM, reason="Unix only")
+
+
+def _frame(stream_id: int, data: bytes) -> bytes:
+    return struct.pack(">BxxxL", stream_id, len(data)) + data
+
+
+FRAMES = [
+    (1, b"hello "),
+    (2, b"warning\n"),
+    (1, b""),
+    (1, b"x" * 100000),
+    (2, b"y" * 3),
+    (1, b"world\n"),
+]
+STREAM = b"".join(_frame(stream_id, data) for stream_id, data in FRAMES)
+STDOUT = b"".join(data for stream_id, data in FRAMES if stream_id == 1)
+STDERR = b"".join(data for stream_id, data in FRAMES if stream_id == 2)
+
+
+def _send(sock: socket.socket, data: bytes, chunk_size: int) -> None:
+    def run() -> None:
+        for index in range(0, len(data), chunk_size):
+            sock.sendall(data[index : index + chunk_size])
+        sock.close()
+
+    threading.Thread(target=run, daemon=True).start()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 8, 9, 4096, len(STREAM)])
+def test_consume(chunk_size: int) -> None:
+    ours, theirs = socket.socketpair()
+    _send(theirs, STREAM, chunk_size)
+    with DockerSocketHandlerBase(ours) as handler:
+        assert handler.consume() == (STDOUT, STDERR)
+    ours.close()
+
+
+def _spool() -> tempfile.SpooledTemporaryFile[bytes]:
+    return tempfile.SpooledTemporaryFile(max_size=1024)
+
+
+@pytest.mark.parametrize("chunk_size", [7, 65536])
+def test_consume_to(chunk_size: int) -> None:
+    ours, theirs = socket.socketpair()
+    _send(theirs, STREAM, chunk_size)
+    with _spool() as stdout, _spool() as stderr:
+        with DockerSocketHandlerBase(ours) as handler:
+            handler.consume_to(stdout, stderr)
+        ours.close()
+        # Only the output larger than max_size went to disk
+        assert stdout._rolled  # type: ignore[attr-defined]
+        assert not stderr._rolled  # type: ignore[attr-defined]
+        stdout.seek(0)
+        stderr.seek(0)
+        assert stdout.read() == STDOUT
+        assert stderr.read() == STDERR
+
+
+def test_blocks() -> None:
+    blocks: list[tuple[int, bytes]] = []
+    ours, theirs = socket.socketpair()
+    _send(theirs, STREAM, 5)
+    with DockerSocketHandlerBase(ours) as handler:
+        while not handler.is_eof():
+            handler.select()
+        # Blocks that arrived before the callback was set are passed to it
+        handler.set_block_done_callback(
+            lambda stream_id, data: blocks.append((stream_id, data))
+        )
+    ours.close()
+    assert blocks == [(stream_id, data) for stream_id, data in FRAMES if data]
+
+
+def test_invalid_stream_id() -> None:
+    ours, theirs = socket.socketpair()
+    _send(theirs, _frame(3, b"abc"), 1024)
+    handler = DockerSocketHandlerBase(ours)
+    with handler, pytest.raises(ValueError, match="3 is not a valid stream ID"):
+        handler.consume()
+    ours.close()
+
+
+class FakeChannel:
+    """
+    Behaves like a paramiko channel: fileno() only signals readability, and
+    writes block unless the channel is in non-blocking mode.
+    """
+
+    def __init__(self, sock: socket.socket, fail: bool = False) -> None:
+        self._sock = sock
+        self._fail = fail
+
+    def fileno(self) -> int:
+        return self._sock.fileno()
+
+    def setblocking(self, flag: bool) -> None:
+        self._sock.setblocking(flag)
+
+    def settimeout(self, timeout: float | None) -> None:
+        self._sock.settimeout(timeout)
+
+    def send_ready(self) -> bool:
+        raise AssertionError("send_ready() must not be polled")
+
+    def recv(self, size: int) -> bytes:
+        return self._sock.recv(size)
+
+    def sendall(self, data: bytes) -> None:
+        if self._fail:
+            raise OSError("Socket is closed")
+        self._sock.sendall(data)
+
+    def shutdown_write(self) -> None:
+        self._sock.shutdown(socket.SHUT_WR)
+
+
+def _echo(sock: socket.socket) -> None:
+    def run() -> None:
+        with sock:
+            while True:
+                data = sock.recv(65536)
+                if not data:
+                    break
+                sock.sendall(_frame(1, data))
+
+    threading.Thread(target=run, daemon=True).start()
+
+
+@pytest.fixture
+def fake_paramiko(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        _socket_handler,
+        "_is_paramiko_channel",
+        lambda sock: isinstance(sock, FakeChannel),
+    )
+
+
+@pytest.mark.usefixtures("fake_paramiko")
+def test_paramiko_channel() -> None:
+    ours, theirs = socket.socketpair()
+    _echo(theirs)
+    # Much more than fits into the socket buffers, so that writing blocks
+    # until the peer has read some of it, while it waits for us to read
+    data = bytes(range(256)) * 32768
+    with DockerSocketHandlerBase(FakeChannel(ours)) as handler:  # type: ignore[arg-type]
+        handler.write(data[:1000])
+        handler.write(data[1000:])
+        assert handler.consume() == (data, b"")
+    ours.close()
+
+
+@pytest.mark.usefixtures("fake_paramiko")
+def test_paramiko_channel_write_error() -> None:
+    ours, theirs = socket.socketpair()
+    handler = DockerSocketHandlerBase(FakeChannel(ours, fail=True))  # type: ignore[arg-type]
+    handler.write(b"data")
+    # The peer never answers; select() is woken up by the failed write
+    with handler, pytest.raises(OSError, match="Socket is closed"):
+        handler.select(10)
+    ours.close()
+    theirs.close()
@@ -0,0 +1,121 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import ssl
+import types
+import typing as t
+
+import pytest
+
+from ansible_collections.community.docker.plugins.module_utils._api.api.client import (
+    APIClient,
+)
+from ansible_collections.community.docker.plugins.module_utils._api.tls import (
+    TLSConfig,
+)
+from ansible_collections.community.docker.plugins.module_utils._tls_sessions import (
+    _is_valid,
+)
+from ansible_collections.community.docker.tests.unit.plugins.module_utils.fake_daemon import (
+    API_VERSION,
+    FakeDaemon,
+    create_certificate,
+    json_response,
+)
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture
+def tls_daemon(
+    tmp_path: t.Any, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[tuple[FakeDaemon, str]]:
+    # requests prefers these over the CA certificate configured for the client
+    monkeypatch.delenv("REQUESTS_CA_BUNDLE", raising=False)
+    monkeypatch.delenv("CURL_CA_BUNDLE", raising=False)
+    cert_path, key_path = create_certificate(tmp_path)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert_path, key_path)
+    # The daemon closes the connection after every response, so that every
+    # request needs a new TLS connection
+    daemon = FakeDaemon(
+        None, lambda request: (json_response({"Id": "abc"}), True), context
+    )
+    yield daemon, cert_path
+    daemon.close()
+
+
+def _create_client(
+    daemon: FakeDaemon, tls: TLSConfig, host: str = "127.0.0.1", **kwargs: t.Any
+) -> APIClient:
+    return APIClient(
+        base_url=f"tcp://{host}:{daemon.port}",
+        version=API_VERSION,
+        tls=tls,
+        collect_stats=True,
+        **kwargs,
+    )
+
+
+def _inspect(client: APIClient, count: int) -> dict[str, int]:
+    for dummy in range(count):
+        assert client.get_json("/containers/{0}/json", "abc") == {"Id": "abc"}
+    assert client.api_stats is not None
+    return client.api_stats.summarize()["tls_handshakes"]
+
+
+@pytest.mark.parametrize("verify", [True, False])
+def test_resumes_sessions(tls_daemon: tuple[FakeDaemon, str], verify: bool) -> None:
+    daemon, cert_path = tls_daemon
+    tls = TLSConfig(ca_cert=cert_path, verify=verify)
+
+    client = _create_client(daemon, tls, tls_session_cache=True)
+    assert _inspect(client, 3) == {"full": 1, "resumed": 2}
+    client.close()
+    assert daemon.sessions_reused == [False, True, True]
+
+    # Other clients with the same TLS configuration share the sessions
+    client = _create_client(daemon, tls, tls_session_cache=True)
+    assert _inspect(client, 1) == {"full": 0, "resumed": 1}
+    client.close()
+    assert daemon.sessions_reused[-1]
+
+
+def test_disabled_by_default(tls_daemon: tuple[FakeDaemon, str]) -> None:
+    daemon, cert_path = tls_daemon
+
+    client = _create_client(daemon, TLSConfig(ca_cert=cert_path, verify=True))
+    _inspect(client, 3)
+    client.close()
+    assert daemon.sessions_reused == [False, False, False]
+
+
+def test_verifies_host_name(tls_daemon: tuple[FakeDaemon, str]) -> None:
+    daemon, cert_path = tls_daemon
+    tls = TLSConfig(ca_cert=cert_path, verify=True)
+
+    client = _create_client(daemon, tls, tls_session_cache=True)
+    _inspect(client, 1)
+    client.close()
+
+    # The certificate is only valid for 127.0.0.1
+    client = _create_client(daemon, tls, host="localhost", tls_session_cache=True)
+    with pytest.raises(Exception, match="certificate|hostname"):
+        client.get_json("/containers/{0}/json", "abc")
+    client.close()
+
+
+def test_is_valid() -> None:
+    session = types.SimpleNamespace(
+        time=1000, timeout=7200, has_ticket=True, ticket_lifetime_hint=300
+    )
+    assert _is_valid(session, 1299)  # type: ignore[arg-type]
+    assert not _is_valid(session, 1300)  # type: ignore[arg-type]
+
+    session.has_ticket = False
+    assert _is_valid(session, 8199)  # type: ignore[arg-type]
+    assert not _is_valid(session, 8200)  # type: ignore[arg-type]
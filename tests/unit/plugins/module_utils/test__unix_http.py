@@ -0,0 +1,260 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import struct
+import subprocess
+import sys
+import typing as t
+from unittest import mock
+
+import pytest
+
+from ansible_collections.community.docker.plugins.module_utils._api import constants
+from ansible_collections.community.docker.plugins.module_utils._api.errors import (
+    NotFound,
+)
+from ansible_collections.community.docker.plugins.module_utils._api_stats import (
+    APIStats,
+)
+from ansible_collections.community.docker.plugins.module_utils._unix_http import (
+    UnixHTTPResponse,
+    UnixHTTPSession,
+)
+from ansible_collections.community.docker.tests.unit.plugins.module_utils.fake_daemon import (
+    API_VERSION,
+    json_response,
+)
+
+pytestmark = pytest.mark.skipif(constants.IS_WINDOWS_PLATFORM, reason="Unix only")
+
+
+def _frame(stream: int, data: bytes) -> bytes:
+    return struct.pack(">BxxxL", stream, len(data)) + data
+
+
+def test_get_json_reuses_connection(daemon_factory: t.Any) -> None:
+    daemon, client = daemon_factory(lambda request: (json_response({"a": 1}), False))
+    assert isinstance(client._unix_http, UnixHTTPSession)
+
+    assert client.get_json(
+        "/containers/json", params={"all": True, "filters": None, "x": ["1", "2"]}
+    ) == {"a": 1}
+    assert client.post_json_to_json("/containers/{0}/update", "foo", data={"b": 2}) == {
+        "a": 1
+    }
+
+    assert daemon.connections == 1
+    first, second = daemon.requests
+    assert (
+        first["request_line"]
+        == f"GET /v{API_VERSION}/containers/json?all=True&x=1&x=2 HTTP/1.1"
+    )
+    assert first["headers"]["user-agent"] == constants.DEFAULT_USER_AGENT
+    assert (
+        second["request_line"] == f"POST /v{API_VERSION}/containers/foo/update HTTP/1.1"
+    )
+    assert second["headers"]["content-type"] == "application/json"
+    assert json.loads(second["body"]) == {"b": 2}
+
+
+def test_reconnect_after_close(daemon_factory: t.Any) -> None:
+    daemon, client = daemon_factory(lambda request: (json_response([]), True))
+
+    assert client.get_json("/images/json") == []
+    assert client.get_json("/images/json") == []
+    assert daemon.connections == 2
+
+
+def test_error_response(daemon_factory: t.Any) -> None:
+    dummy, client = daemon_factory(
+        lambda request: (
+            json_response({"message": "No such container: foo"}, "404 Not Found"),
+            False,
+        )
+    )
+
+    with pytest.raises(NotFound) as exc:
+        client.get_json("/containers/{0}/json", "foo")
+    assert exc.value.status_code == 404
+    assert exc.value.explanation == "No such container: foo"
+
+
+def test_head_headers(daemon_factory: t.Any) -> None:
+    def handler(request: dict[str, t.Any]) -> tuple[bytes, bool]:
+        if request["request_line"].startswith("HEAD "):
+            return (
+                b"HTTP/1.1 200 OK\r\nX-Docker-Container-Path-Stat: abc\r\n"
+                b"Content-Length: 100\r\n\r\n",
+                False,
+            )
+        return b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nOK", False
+
+    daemon, client = daemon_factory(handler)
+
+    response = client._head(client._url("/containers/{0}/archive", "foo"))
+    assert response.status_code == 200
+    assert response.headers.get("x-docker-container-path-stat") == "abc"
+    # The body of HEAD responses is empty, independent of Content-Length
+    assert response.content == b""
+    # The connection is still usable
+    assert client.ping()
+    assert daemon.connections == 1
+
+
+def test_chunked_stream(daemon_factory: t.Any) -> None:
+    chunks = [json.dumps({"status": i}).encode() + b"\r\n" for i in range(20)]
+    body = b"".join(f"{len(c):x}\r\n".encode() + c + b"\r\n" for c in chunks)
+    dummy, client = daemon_factory(
+        lambda request: (
+            b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+            + body
+            + b"0\r\n\r\n",
+            False,
+        )
+    )
+
+    response = client._post(client._url("/images/create"), stream=True)
+    assert isinstance(response, UnixHTTPResponse)
+    assert list(client._stream_helper(response, decode=True)) == [
+        {"status": i} for i in range(20)
+    ]
+
+    response = client._post(client._url("/images/create"), stream=True)
+    assert list(client._stream_helper(response, coalesce=True)) == [b"".join(chunks)]
+
+
+@pytest.mark.parametrize("chunked", [True, False])
+def test_readinto(daemon_factory: t.Any, chunked: bool) -> None:
+    data = bytes(range(256)) * 1000
+    if chunked:
+        head = b"Transfer-Encoding: chunked\r\n\r\n"
+        body = b"".join(
+            f"{len(data[i : i + 7000]):x}\r\n".encode() + data[i : i + 7000] + b"\r\n"
+            for i in range(0, len(data), 7000)
+        )
+        body += b"0\r\n\r\n"
+    else:
+        head = f"Content-Length: {len(data)}\r\n\r\n".encode()
+        body = data
+    daemon, client = daemon_factory(
+        lambda request: (b"HTTP/1.1 200 OK\r\n" + head + body, False)
+    )
+
+    response = client.get_raw_response("/containers/{0}/archive", "foo")
+    buffer = bytearray(10000)
+    received = bytearray()
+    while True:
+        size = response.raw.readinto(buffer)
+        if not size:
+            break
+        assert size <= 10000
+        received += buffer[:size]
+    assert received == data
+    assert response.raw.complete
+    # The connection is re-used
+    response = client._get(client._url("/containers/{0}/archive", "foo"))
+    assert response.content == data
+    assert daemon.connections == 1
+
+
+def test_chunked_upload(daemon_factory: t.Any) -> None:
+    daemon, client = daemon_factory(
+        lambda request: (b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n", False)
+    )
+
+    def generate() -> t.Generator[bytes]:
+        yield b"abc"
+        yield b""
+        yield b"d" * 100000
+
+    response = client._put(
+        client._url("/containers/{0}/archive", "foo"),
+        params={"path": "/tmp"},
+        data=generate(),
+    )
+    assert response.status_code == 200
+    request = daemon.requests[0]
+    assert request["headers"]["transfer-encoding"] == "chunked"
+    assert request["body"] == b"abc" + b"d" * 100000
+
+
+def test_hijacked_stream(daemon_factory: t.Any) -> None:
+    # The frames are sent together with the response header; nothing may be
+    # lost when the socket is handed over
+    frames = _frame(1, b"out1") + _frame(2, b"err") + _frame(1, b"out2")
+    dummy, client = daemon_factory(
+        lambda request: (
+            b"HTTP/1.1 101 UPGRADED\r\n"
+            b"Content-Type: application/vnd.docker.raw-stream\r\n"
+            b"Connection: Upgrade\r\nUpgrade: tcp\r\n\r\n" + frames,
+            True,
+        )
+    )
+
+    assert client.post_json_to_stream(
+        "/exec/{0}/start", "foo", data={}, stream=False, demux=True
+    ) == (b"out1out2", b"err")
+
+
+_WITHOUT_REQUESTS = """
+import sys
+
+# Make sure that neither requests nor urllib3 can be imported
+sys.modules["requests"] = None
+sys.modules["urllib3"] = None
+
+from ansible_collections.community.docker.plugins.module_utils._api.api.client import (
+    APIClient,
+)
+from ansible_collections.community.docker.tests.unit.plugins.module_utils.fake_daemon import (
+    API_VERSION,
+    FakeDaemon,
+    json_response,
+)
+
+daemon = FakeDaemon(sys.argv[1], lambda request: (json_response({"Id": "abc"}), False))
+client = APIClient(base_url=f"unix://{sys.argv[1]}", version=API_VERSION)
+assert client._unix_http is not None
+assert client.base_url == "http+docker://localhost"
+assert client.get_json("/containers/{0}/json", "abc") == {"Id": "abc"}
+assert len(daemon.requests) == 1
+client.close()
+daemon.close()
+"""
+
+
+def test_used_without_requests(tmp_path: t.Any) -> None:
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join(p for p in sys.path if isinstance(p, str))
+    result = subprocess.run(
+        [sys.executable, "-c", _WITHOUT_REQUESTS, str(tmp_path / "docker.sock")],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_retry_on_stale_connection(daemon_factory: t.Any) -> None:
+    daemon, client = daemon_factory(lambda request: (json_response([]), False))
+    assert client.get_json("/images/json") == []
+    client.api_stats = APIStats()
+
+    # The daemon closes the idle connection, but the client only notices
+    # once it sends the next request on it
+    with mock.patch(
+        "ansible_collections.community.docker.plugins.module_utils._unix_http.select.select",
+        return_value=([], [], []),
+    ):
+        (sock,) = client._unix_http._idle
+        sock.shutdown(socket.SHUT_RD)
+        assert client.get_json("/images/json") == []
+    assert daemon.connections == 2
+    assert [call.retries for call in client.api_stats.calls] == [1]
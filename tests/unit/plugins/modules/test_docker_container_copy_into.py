@@ -4,11 +4,19 @@
 
 from __future__ import annotations
 
+import os
 import typing as t
+from unittest import mock
 
 import pytest
 
+from ansible_collections.community.docker.plugins.module_utils._copy import (
+    TreeEntry,
+)
 from ansible_collections.community.docker.plugins.modules.docker_container_copy_into import (
+    SharedSource,
+    get_local_tree,
+    is_tree_entry_equal,
     parse_modern,
     parse_octal_string_only,
 )
@@ -82,3 +90,62 @@ def test_parse_bad_value(value: str) -> None:
         parse_modern(value)
     with pytest.raises(ValueError):
         parse_octal_string_only(value)
+
+
+def test_get_local_tree(tmp_path: t.Any) -> None:
+    (tmp_path / "dir").mkdir()
+    (tmp_path / "dir" / "file").write_bytes(b"content")
+    (tmp_path / "link").symlink_to("dir")
+
+    tree = get_local_tree(str(tmp_path), False, 1000, 1001, 0o600)
+    assert list(tree) == ["", "dir", "link", "dir/file"]
+    assert tree["link"].link_target == "dir"
+    assert tree["dir/file"].mode == 0o100600
+    assert (tree["dir/file"].uid, tree["dir/file"].gid) == (1000, 1001)
+
+    tree = get_local_tree(str(tmp_path), True, 1000, 1001, None)
+    assert sorted(tree) == ["", "dir", "dir/file", "link", "link/file"]
+
+
+def test_is_tree_entry_equal(tmp_path: t.Any) -> None:
+    path = tmp_path / "file"
+    path.write_bytes(b"content")
+    checksum = "ed7002b439e9ac845f22357d822bac1444730fbdb6016d3ec9432297b9ec9f73"
+    local = get_local_tree(str(tmp_path), False, 0, 0, 0o644)["file"]
+    mtime = int(os.stat(path).st_mtime)
+
+    remote = TreeEntry(0o100644, 0, 0, 7, mtime)
+    assert is_tree_entry_equal(local, remote, str(path))
+    assert not is_tree_entry_equal(local, remote._replace(mtime=0), str(path))
+    assert not is_tree_entry_equal(local, remote._replace(mode=0o100755), str(path))
+    assert not is_tree_entry_equal(local, remote._replace(uid=1), str(path))
+    assert not is_tree_entry_equal(local, remote._replace(mode=0o40644), str(path))
+    # Checksums take precedence over modification times
+    remote = remote._replace(mtime=0, checksum=checksum)
+    assert is_tree_entry_equal(local, remote, str(path))
+    assert not is_tree_entry_equal(local, remote._replace(checksum="0" * 64), str(path))
+
+
+def test_shared_source(tmp_path: t.Any) -> None:
+    path = tmp_path / "file"
+    path.write_bytes(b"content")
+    source = SharedSource(str(path), None, True)
+    with mock.patch(
+        "ansible_collections.community.docker.plugins.modules.docker_container_copy_into.get_local_file_checksum",
+        return_value="abc",
+    ) as get_checksum:
+        assert source.get_checksum() == "abc"
+        assert source.get_checksum() == "abc"
+    assert get_checksum.call_count == 1
+
+    body = source.get_tar_body("file", 0, 0, 0o644)
+    assert source.get_tar_body("file", 0, 0, 0o644) is body
+    assert source.get_tar_body("file", 1000, 1000, 0o644) is not body
+
+    source = SharedSource(None, b"content", True)
+    assert source.get_checksum() == (
+        "ed7002b439e9ac845f22357d822bac1444730fbdb6016d3ec9432297b9ec9f73"
+    )
+    body = source.get_tar_body("file", 0, 0, 0o644)
+    assert source.get_tar_body("file", 0, 0, 0o644) is body
+    assert b"content" in b"".join(body)
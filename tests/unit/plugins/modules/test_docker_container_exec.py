@@ -0,0 +1,96 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import hashlib
+import os
+import typing as t
+
+import pytest
+
+from ansible_collections.community.docker.plugins.modules.docker_container_exec import (
+    OutputFileError,
+    OutputSink,
+)
+
+OUTPUT = b"first line\nsecond line\n\nfourth line\nlast line without newline"
+
+
+def _write(sink: OutputSink, data: bytes, block_size: int) -> None:
+    for index in range(0, len(data), block_size):
+        sink.write(data[index : index + block_size])
+
+
+@pytest.mark.parametrize("block_size", [1, 5, 1024])
+@pytest.mark.parametrize(
+    "tail_lines, tail_bytes, expected",
+    [
+        (None, None, OUTPUT),
+        (2, None, b"fourth line\nlast line without newline"),
+        (10, None, OUTPUT),
+        (0, None, b""),
+        (None, 12, b"hout newline"),
+        (None, 30, OUTPUT[-30:]),
+        (3, 30, OUTPUT[-30:]),
+        (2, 1000, b"fourth line\nlast line without newline"),
+        (None, 0, b""),
+    ],
+)
+def test_output_sink_tail(
+    tail_lines: int | None, tail_bytes: int | None, expected: bytes, block_size: int
+) -> None:
+    with OutputSink(tail_lines=tail_lines, tail_bytes=tail_bytes) as sink:
+        _write(sink, OUTPUT, block_size)
+    assert sink.get_output() == expected
+    assert sink.size == len(OUTPUT)
+    assert sink.truncated == (expected != OUTPUT)
+    assert sink.get_checksum() is None
+
+
+def test_output_sink_tail_lines_with_newline() -> None:
+    sink = OutputSink(tail_lines=1)
+    _write(sink, b"a\nb\nc\n", 1)
+    assert sink.get_output() == b"c\n"
+    assert sink.truncated
+
+
+def test_output_sink_cut_character() -> None:
+    sink = OutputSink(tail_bytes=5)
+    sink.write("aaa€€".encode("utf-8"))
+    # The first Euro sign was cut in the middle
+    assert sink.get_output() == "€".encode("utf-8")
+    assert sink.truncated
+
+
+@pytest.mark.parametrize("tail_lines", [None, 1])
+def test_output_sink_file(tmp_path: t.Any, tail_lines: int | None) -> None:
+    path = tmp_path / "output"
+    with OutputSink(path=str(path), tail_lines=tail_lines, checksum="sha256") as sink:
+        _write(sink, OUTPUT, 7)
+    assert path.read_bytes() == OUTPUT
+    assert sink.get_output() == (
+        b"" if tail_lines is None else b"last line without newline"
+    )
+    assert sink.truncated
+    assert sink.size == len(OUTPUT)
+    assert sink.get_checksum() == hashlib.sha256(OUTPUT).hexdigest()
+
+
+def test_output_sink_empty(tmp_path: t.Any) -> None:
+    with OutputSink(path=str(tmp_path / "output"), checksum="sha1") as sink:
+        pass
+    assert (tmp_path / "output").read_bytes() == b""
+    assert sink.get_output() == b""
+    assert not sink.truncated
+    assert sink.get_checksum() == hashlib.sha1(b"").hexdigest()
+
+
+@pytest.mark.skipif(not os.path.exists("/dev/full"), reason="needs /dev/full")
+def test_output_sink_write_error() -> None:
+    sink = OutputSink(path="/dev/full")
+    with pytest.raises(OutputFileError, match="^Cannot write output file /dev/full: "):
+        # The error shows up either when writing or when flushing the buffer
+        _write(sink, OUTPUT, 1024)
+        sink.close()
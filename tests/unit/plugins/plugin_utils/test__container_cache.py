@@ -0,0 +1,67 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import time
+import typing as t
+from unittest import mock
+
+from ansible_collections.community.docker.plugins.plugin_utils._container_cache import (
+    ContainerFacts,
+    get_cached_docker_version,
+    set_cached_docker_version,
+)
+
+
+def test_container_facts(tmp_path: t.Any) -> None:
+    cache_dir = str(tmp_path)
+    facts = ContainerFacts("abc", "2025-01-01T00:00:00Z", cache_dir=cache_dir)
+    assert facts.get_ids(None) is None
+    facts.set_ids(None, (0, 0))
+    facts.set_ids("app", (1000, 1001))
+
+    # Other connections, for example in other worker processes, see the facts
+    facts = ContainerFacts("abc", "2025-01-01T00:00:00Z", cache_dir=cache_dir)
+    assert facts.get_ids(None) == (0, 0)
+    assert facts.get_ids("app") == (1000, 1001)
+    assert facts.get_ids("other") is None
+
+    # Facts added by other connections in the meantime are kept
+    other = ContainerFacts("abc", "2025-01-01T00:00:00Z", cache_dir=cache_dir)
+    other.set_ids("other", (1002, 1002))
+    facts.set_ids("app", (1000, 1000))
+    facts = ContainerFacts("abc", "2025-01-01T00:00:00Z", cache_dir=cache_dir)
+    assert facts.get_ids("other") == (1002, 1002)
+    assert facts.get_ids("app") == (1000, 1000)
+
+    # The facts are gone once the container was restarted
+    facts = ContainerFacts("abc", "2025-01-01T00:05:00Z", cache_dir=cache_dir)
+    assert facts.get_ids(None) is None
+    assert (
+        ContainerFacts("def", "2025-01-01T00:00:00Z", cache_dir).get_ids(None) is None
+    )
+
+
+def test_invalid_cache_file(tmp_path: t.Any) -> None:
+    facts = ContainerFacts("abc", "2025-01-01T00:00:00Z", cache_dir=str(tmp_path))
+    facts.set_ids(None, (0, 0))
+    with open(facts.path, "w", encoding="utf-8") as f:
+        f.write("{")
+    facts = ContainerFacts("abc", "2025-01-01T00:00:00Z", cache_dir=str(tmp_path))
+    assert facts.get_ids(None) is None
+    facts.set_ids(None, (0, 0))
+    assert facts.get_ids(None) == (0, 0)
+
+
+def test_docker_version(tmp_path: t.Any) -> None:
+    cache_dir = str(tmp_path)
+    key = ["docker", [], {"DOCKER_HOST": "unix:///var/run/docker.sock"}]
+    assert get_cached_docker_version(key, cache_dir=cache_dir) is None
+    set_cached_docker_version(key, "27.0.1", cache_dir=cache_dir)
+    assert get_cached_docker_version(key, cache_dir=cache_dir, ttl=60) == "27.0.1"
+    assert get_cached_docker_version(["docker", [], {}], cache_dir=cache_dir) is None
+
+    with mock.patch("time.time", return_value=time.time() + 61):
+        assert get_cached_docker_version(key, cache_dir=cache_dir, ttl=60) is None
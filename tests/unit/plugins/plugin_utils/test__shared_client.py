@@ -0,0 +1,103 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import typing as t
+from unittest import mock
+
+import pytest
+
+from ansible_collections.community.docker.plugins.module_utils._api import constants
+from ansible_collections.community.docker.plugins.module_utils._util import (
+    DOCKER_COMMON_ARGS,
+)
+from ansible_collections.community.docker.plugins.plugin_utils import (
+    _common_api,
+)
+from ansible_collections.community.docker.plugins.plugin_utils._common_api import (
+    AnsibleDockerClient,
+    get_shared_client,
+)
+from ansible_collections.community.docker.tests.unit.plugins.module_utils.fake_daemon import (
+    API_VERSION,
+    FakeDaemon,
+    json_response,
+)
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from ansible.plugins import AnsiblePlugin
+
+pytestmark = pytest.mark.skipif(constants.IS_WINDOWS_PLATFORM, reason="Unix only")
+
+
+class FakePlugin:
+    def __init__(self, **options: t.Any) -> None:
+        self.options: dict[str, t.Any] = {
+            option: t.cast("dict[str, t.Any]", spec).get("default")
+            for option, spec in DOCKER_COMMON_ARGS.items()
+        }
+        self.options.update(options)
+
+    def get_option(self, option: str) -> t.Any:
+        return self.options[option]
+
+
+def _create_plugin(**options: t.Any) -> AnsiblePlugin:
+    return t.cast("AnsiblePlugin", FakePlugin(**options))
+
+
+def _handler(request: dict[str, t.Any]) -> tuple[bytes, bool]:
+    if request["request_line"].split(" ")[1] == "/version":
+        return json_response({"ApiVersion": API_VERSION, "Version": "27.0.0"}), False
+    return json_response({"Id": "abc"}), False
+
+
+@pytest.fixture
+def daemon(tmp_path: t.Any, monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeDaemon]:
+    monkeypatch.setattr(_common_api, "_SHARED_CLIENTS", {})
+    monkeypatch.delenv("ANSIBLE_DOCKER_METADATA_CACHE", raising=False)
+    monkeypatch.setenv("ANSIBLE_DOCKER_METADATA_CACHE_DIR", str(tmp_path / "cache"))
+    daemon = FakeDaemon(str(tmp_path / "docker.sock"), _handler)
+    daemon.url = f"unix://{tmp_path}/docker.sock"  # type: ignore[attr-defined]
+    yield daemon
+    daemon.close()
+
+
+def _version_requests(daemon: FakeDaemon) -> int:
+    return sum(
+        1 for r in daemon.requests if r["request_line"].split(" ")[1] == "/version"
+    )
+
+
+def test_shared_client(daemon: t.Any) -> None:
+    client = get_shared_client(_create_plugin(docker_host=daemon.url))
+    assert client.docker_api_version_str == API_VERSION
+    assert get_shared_client(_create_plugin(docker_host=daemon.url)) is client
+    assert _version_requests(daemon) == 1
+
+    # Different connection options need a different client
+    other = get_shared_client(_create_plugin(docker_host=daemon.url, timeout=5))
+    assert other is not client
+    assert _version_requests(daemon) == 2
+
+    # Clients are not reused after a fork
+    with mock.patch("os.getpid", return_value=-1):
+        assert get_shared_client(_create_plugin(docker_host=daemon.url)) is not client
+    assert _version_requests(daemon) == 3
+
+
+def test_metadata_cache(daemon: t.Any) -> None:
+    plugin = _create_plugin(docker_host=daemon.url)
+
+    AnsibleDockerClient(plugin)
+    AnsibleDockerClient(plugin)
+    assert _version_requests(daemon) == 2
+
+    AnsibleDockerClient(plugin, metadata_cache=True)
+    client = AnsibleDockerClient(plugin, metadata_cache=True)
+    assert client.docker_api_version_str == API_VERSION
+    assert _version_requests(daemon) == 3
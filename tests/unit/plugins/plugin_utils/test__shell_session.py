@@ -0,0 +1,229 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import struct
+import subprocess
+import threading
+import typing as t
+
+import pytest
+from ansible.errors import AnsibleConnectionFailure
+from ansible.utils.display import Display
+
+from ansible_collections.community.docker.plugins.module_utils._api import constants
+from ansible_collections.community.docker.plugins.module_utils._api.api.client import (
+    APIClient,
+)
+from ansible_collections.community.docker.plugins.plugin_utils._shell_session import (
+    PersistentShell,
+    ProcessShell,
+)
+from ansible_collections.community.docker.tests.unit.plugins.module_utils.fake_daemon import (
+    API_VERSION,
+    FakeDaemon,
+    json_response,
+)
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterator
+
+pytestmark = pytest.mark.skipif(constants.IS_WINDOWS_PLATFORM, reason="Unix only")
+
+EXEC_DATA = {
+    "Tty": False,
+    "AttachStdin": True,
+    "AttachStdout": True,
+    "AttachStderr": True,
+    "Cmd": ["/bin/sh"],
+}
+
+
+def _run_exec(command: list[str], connection: socket.socket, buffer: bytearray) -> None:
+    """
+    Emulate the hijacked stream of an exec instance by running ``command``
+    locally, and multiplexing its stdout and stderr as the daemon does.
+    """
+    connection.sendall(
+        b"HTTP/1.1 101 UPGRADED\r\n"
+        b"Content-Type: application/vnd.docker.raw-stream\r\n"
+        b"Connection: Upgrade\r\nUpgrade: tcp\r\n\r\n"
+    )
+    process = subprocess.Popen(
+        command,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    assert process.stdin is not None
+    assert process.stdout is not None
+    assert process.stderr is not None
+    lock = threading.Lock()
+
+    def forward(stream: t.IO[bytes], stream_id: int) -> None:
+        while True:
+            data = os.read(stream.fileno(), 65536)
+            if not data:
+                return
+            try:
+                with lock:
+                    connection.sendall(
+                        struct.pack(">BxxxL", stream_id, len(data)) + data
+                    )
+            except OSError:
+                # The client went away; keep draining the process output
+                pass
+
+    def feed() -> None:
+        assert process.stdin is not None
+        try:
+            process.stdin.write(bytes(buffer))
+            process.stdin.flush()
+            while True:
+                data = connection.recv(65536)
+                if not data:
+                    break
+                process.stdin.write(data)
+                process.stdin.flush()
+            process.stdin.close()
+        except OSError:
+            # The process exited, or the connection was shut down
+            pass
+
+    threads = [
+        threading.Thread(target=forward, args=(process.stdout, 1)),
+        threading.Thread(target=forward, args=(process.stderr, 2)),
+    ]
+    for thread in threads:
+        thread.start()
+    threading.Thread(target=feed, daemon=True).start()
+    # Like the daemon, end the stream once the process has exited
+    for thread in threads:
+        thread.join()
+    process.wait()
+    process.stdout.close()
+    process.stderr.close()
+    # Closing the socket does not wake up the feeding thread blocked in recv()
+    try:
+        connection.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+
+
+class ExecHandler:
+    def __init__(self) -> None:
+        self.created: list[dict[str, t.Any]] = []
+
+    def __call__(self, request: dict[str, t.Any]) -> tuple[t.Any, bool]:
+        path = request["request_line"].split(" ")[1]
+        if path.endswith("/exec"):
+            self.created.append(json.loads(request["body"]))
+            return (
+                json_response({"Id": f"exec{len(self.created)}"}, "201 Created"),
+                False,
+            )
+        if path.endswith("/start"):
+            command = self.created[-1]["Cmd"]
+            return lambda conn, buffer: _run_exec(command, conn, buffer), True
+        return json_response({"message": "not found"}, "404 Not Found"), False
+
+
+@pytest.fixture
+def shell(tmp_path: t.Any) -> Iterator[tuple[PersistentShell, ExecHandler]]:
+    handler = ExecHandler()
+    path = str(tmp_path / "docker.sock")
+    daemon = FakeDaemon(path, handler)
+    client = APIClient(base_url=f"unix://{path}", version=API_VERSION)
+    shell = PersistentShell(client, "container", EXEC_DATA, Display())
+    yield shell, handler
+    shell.close()
+    client.close()
+    daemon.close()
+
+
+def test_runs_commands(shell: tuple[PersistentShell, ExecHandler]) -> None:
+    session, handler = shell
+
+    assert session.run(["/bin/sh", "-c", "echo hello"]) == (0, b"hello\n", b"")
+    assert session.run(["/bin/sh", "-c", "printf out; printf err >&2; exit 3"]) == (
+        3,
+        b"out",
+        b"err",
+    )
+    assert session.run(["/bin/sh", "-c", "cd /; exit 0"]) == (0, b"", b"")
+    assert session.run(["/bin/sh", "-c", "cat; cat"], b"line 1\nline 2\n") == (
+        0,
+        b"line 1\nline 2\n",
+        b"",
+    )
+    # Commands do not read the script of the shell
+    assert session.run(["/bin/sh", "-c", "cat"]) == (0, b"", b"")
+
+    large = b"x" * 100000 + b"\n"
+    assert session.run(["/bin/sh", "-c", "wc -c"], large)[1].strip() == b"100001"
+
+    assert len(handler.created) == 1
+    assert handler.created[0]["Cmd"] == ["/bin/sh"]
+
+
+def test_restarts_after_exit(shell: tuple[PersistentShell, ExecHandler]) -> None:
+    session, handler = shell
+
+    assert session.run(["/bin/sh", "-c", "echo 1"])[1] == b"1\n"
+    session.close()
+    assert session.run(["/bin/sh", "-c", "echo 2"])[1] == b"2\n"
+    assert len(handler.created) == 2
+
+
+def test_shell_exits(shell: tuple[PersistentShell, ExecHandler]) -> None:
+    session, handler = shell
+
+    with pytest.raises(AnsibleConnectionFailure, match="exited unexpectedly"):
+        session.run(["exit", "1"])
+    assert session.run(["/bin/sh", "-c", "echo 1"])[1] == b"1\n"
+
+
+def test_can_send() -> None:
+    assert PersistentShell.can_send(None)
+    assert PersistentShell.can_send(b"data\n")
+    assert not PersistentShell.can_send(b"data")
+    assert not PersistentShell.can_send(b"da\0ta\n")
+
+
+@pytest.fixture
+def process_shell() -> Iterator[ProcessShell]:
+    shell = ProcessShell(["/bin/sh"], "for testing")
+    yield shell
+    shell.close()
+
+
+def test_process_shell_runs_commands(process_shell: ProcessShell) -> None:
+    assert process_shell.run(["/bin/sh", "-c", "echo hello"]) == (0, b"hello\n", b"")
+    process = process_shell._process
+    assert process_shell.run(
+        ["/bin/sh", "-c", "printf out; printf err >&2; exit 3"]
+    ) == (3, b"out", b"err")
+    assert process_shell.run(["/bin/sh", "-c", "cat"]) == (0, b"", b"")
+
+    # Much more than fits into the pipe buffer
+    large = b"x" * 1000000 + b"\n"
+    assert process_shell.run(["/bin/sh", "-c", "cat"], large) == (0, large, b"")
+
+    # All commands ran in the same shell
+    assert process_shell._process is process
+
+
+def test_process_shell_exits(process_shell: ProcessShell) -> None:
+    with pytest.raises(
+        AnsibleConnectionFailure,
+        match="The persistent shell for testing exited unexpectedly",
+    ):
+        process_shell.run(["exit", "1"])
+    assert process_shell.run(["/bin/sh", "-c", "echo 1"])[1] == b"1\n"
+    process_shell.close()
+    assert process_shell.run(["/bin/sh", "-c", "echo 2"])[1] == b"2\n"